@@ -2267,9 +2267,13 @@ Be concise. Focus on form elements only."""
                 
                 signal.signal(signal.SIGINT, handler)
                 
-                # Wait indefinitely
-                while True:
-                    time.sleep(1)
+                # Block until Ctrl+C without waking up (signal.pause is POSIX-only)
+                if hasattr(signal, 'pause'):
+                    while True:
+                        signal.pause()
+                else:
+                    import threading
+                    threading.Event().wait()
                 
         except ImportError:
             print(f"   ❌ Playwright not installed")
@@ -548,8 +548,12 @@ def apply_job():
         
         # Run in background thread to avoid blocking
         def apply_in_background():
-            result = job_service.apply_to_job(job_url)
-            logger.info(f"Application result: {result}")
+            try:
+                result = job_service.apply_to_job(job_url)
+                logger.info(f"Application result: {result}")
+            finally:
+                # The browser belongs to this thread, so close it here
+                job_service.close()
             # Clean up temp config
             if tailored_resume_path and Path('.temp_config.json').exists():
                 Path('.temp_config.json').unlink()
@@ -3,17 +3,67 @@ AI Service for interacting with Ollama LLM, Claude (Anthropic), and GPT-4 (OpenA
 """
 
 import ollama
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+import asyncio
+import importlib.util
 import json
 import re
 import os
 
 from src.config import Settings
+from src.utils.ai_cache import AnswerCache
 from src.utils.logger import get_logger
+from src.utils.paths import get_ai_cache_path
 
 
 logger = get_logger(__name__)
 
+# Connection pool shared by every call to a provider; keep-alive amortizes the TCP/TLS handshake
+_HTTP_MAX_CONNECTIONS = 20
+_HTTP_MAX_KEEPALIVE = 10
+
+# Questions that expect a bare number as the answer
+_NUMERIC_QUESTION_KEYWORDS = ('how many', 'years of', 'number of', 'salary', 'compensation')
+
+# Cached answers and resume sections older than this are regenerated
+_AI_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# Option-selection prompts only need the start of the job description
+_SELECTION_DESCRIPTION_CHARS = 1500
+
+# A tailored summary shorter than this is treated as incomplete
+_MIN_SUMMARY_CHARS = 50
+
+# Skill categories a tailored skills section must keep, found with a single scan
+_REQUIRED_SKILL_CATEGORIES = ('Programming & Frameworks:', 'Data & AI/ML Tools:',
+                              'Cloud & DevOps:', 'Databases & APIs:')
+_REQUIRED_SKILL_CATEGORY_RE = re.compile('|'.join(re.escape(cat) for cat in _REQUIRED_SKILL_CATEGORIES))
+_MIN_SKILLS_CHARS = 20
+
+# Top-level keys of the tailor_resume_bundle() JSON response
+_BUNDLE_SECTIONS = frozenset({'summary', 'skills', 'jobs'})
+
+
+class AIContext(NamedTuple):
+    """
+    Job context shared by every application question for one form.
+    
+    Built once with AIService.build_context(); the cache digests are hashed
+    up front so each question only hashes its own text. The prompt prefixes
+    are byte-identical across calls so providers can serve them from their
+    prompt cache.
+    """
+    job_description: str
+    job_title: str
+    company: str
+    user_background: str
+    job_requirements: str
+    selection_background: str
+    answer_digest: str
+    selection_digest: str
+    answer_prefix: str
+    selection_prefix: str
+
 
 class AIService:
     """Service for AI/LLM interactions using Ollama, Claude, or GPT-4."""
@@ -34,9 +84,19 @@ class AIService:
         # Check which AI provider to use based on model name
         self.provider = self._determine_provider(self.model)
         
+        # Answers and tailored resume sections persisted across runs (None if the cache can't be opened)
+        try:
+            self.answer_cache = AnswerCache(get_ai_cache_path())
+            self.answer_cache.invalidate_older_than(_AI_CACHE_MAX_AGE_SECONDS)
+        except Exception as e:
+            logger.warning(f"⚠️ AI answer cache unavailable: {e}")
+            self.answer_cache = None
+        
         # Initialize API clients if needed
         self.anthropic_client = None
         self.openai_client = None
+        # Ollama runs locally; one client keeps its connections open between calls
+        self.ollama_client = ollama.Client(limits=self._http_limits())
         
         if self.provider == "anthropic":
             try:
@@ -48,7 +108,7 @@ class AIService:
                     self.provider = "ollama"
                     self.model = "llama3.1"
                 else:
-                    self.anthropic_client = Anthropic(api_key=api_key)
+                    self.anthropic_client = Anthropic(api_key=api_key, http_client=self._pooled_http_client())
                     logger.info(f"✅ Initialized Claude API with model: {self.model}")
             except ImportError:
                 logger.warning("⚠️ anthropic package not installed. Run: pip install anthropic")
@@ -66,7 +126,7 @@ class AIService:
                     self.provider = "ollama"
                     self.model = "llama3.1"
                 else:
-                    self.openai_client = OpenAI(api_key=api_key)
+                    self.openai_client = OpenAI(api_key=api_key, http_client=self._pooled_http_client())
                     logger.info(f"✅ Initialized OpenAI API with model: {self.model}")
             except ImportError:
                 logger.warning("⚠️ openai package not installed. Run: pip install openai")
@@ -77,6 +137,27 @@ class AIService:
         else:
             logger.info(f"✅ Initialized Ollama with model: {self.model}")
     
+    @staticmethod
+    def _http_limits():
+        """Connection pool limits shared by the provider HTTP clients."""
+        import httpx
+        return httpx.Limits(max_connections=_HTTP_MAX_CONNECTIONS, max_keepalive_connections=_HTTP_MAX_KEEPALIVE)
+    
+    def _pooled_http_client(self):
+        """
+        Build the keep-alive HTTP client handed to the hosted provider SDKs.
+        
+        Returns:
+            httpx.Client using HTTP/2 when the h2 package is installed
+        """
+        import httpx
+        return httpx.Client(
+            limits=self._http_limits(),
+            # Long completions can take minutes; only the connect phase is kept short
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            http2=importlib.util.find_spec('h2') is not None,
+        )
+    
     def _determine_provider(self, model: str) -> str:
         """Determine which AI provider to use based on model name."""
         if model.startswith("claude"):
@@ -193,7 +274,9 @@ class AIService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = 4000
+        max_tokens: Optional[int] = 4000,
+        json_mode: bool = False,
+        cached_prefix: Optional[str] = None
     ) -> str:
         """
         Generate completion using configured AI provider.
@@ -203,6 +286,9 @@ class AIService:
             system_prompt: Optional system prompt
             temperature: Optional temperature override
             max_tokens: Maximum tokens to generate
+            json_mode: Ask the provider for a JSON object response (Claude relies on the prompt)
+            cached_prefix: Context shared verbatim by many calls; sent ahead of the prompt
+                so the provider's prompt cache can reuse it
             
         Returns:
             Generated text response
@@ -211,32 +297,86 @@ class AIService:
             temp = temperature or self.temperature
             
             if self.provider == "anthropic":
-                return self._generate_anthropic(prompt, system_prompt, temp, max_tokens)
+                return self._generate_anthropic(prompt, system_prompt, temp, max_tokens, cached_prefix)
             elif self.provider == "openai":
-                return self._generate_openai(prompt, system_prompt, temp, max_tokens)
+                return self._generate_openai(prompt, system_prompt, temp, max_tokens, json_mode, cached_prefix)
             else:
-                return self._generate_ollama(prompt, system_prompt, temp)
+                return self._generate_ollama(prompt, system_prompt, temp, json_mode, cached_prefix)
             
         except Exception as e:
             logger.error(f"❌ AI generation error: {str(e)}")
             raise
     
+    def generate_cached_completion(
+        self,
+        kind: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = 4000,
+        json_mode: bool = False,
+        cached_prefix: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Generate a completion, reusing a stored one for an identical request.
+        
+        Meant for resume tailoring, where re-running against the same job
+        posting would otherwise pay for the same completion again. The key
+        covers the model, the prompt (which embeds the job description and the
+        original text) and the sampling settings.
+        
+        Args:
+            kind: Label for the kind of content (e.g. 'summary', 'skills')
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Optional temperature override
+            max_tokens: Maximum tokens to generate
+            json_mode: Ask the provider for a JSON object response
+            cached_prefix: Context shared verbatim by many calls (see generate_completion)
+            validate: Optional check on a fresh response; one it rejects is returned
+                but not stored, so a malformed completion is not replayed on every retry
+            use_cache: If False, skip the lookup and always generate (a valid result
+                still replaces the stored one)
+            
+        Returns:
+            Generated text response
+        """
+        cache_key = AnswerCache.make_key(
+            self.model, kind, cached_prefix, prompt, system_prompt, temperature or self.temperature, max_tokens, json_mode
+        )
+        cached = self._cached_answer(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info(f"💾 Using cached {kind} completion")
+            return cached
+        
+        response = self.generate_completion(prompt, system_prompt, temperature, max_tokens, json_mode, cached_prefix)
+        if validate is None or validate(response):
+            self._store_answer(cache_key, response)
+        return response
+    
     def _generate_ollama(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        cached_prefix: Optional[str] = None
     ) -> str:
-        """Generate completion using Ollama."""
+        """Generate completion using Ollama (a repeated prefix reuses the loaded model's KV cache)."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
+        if cached_prefix:
+            messages.append({"role": "system", "content": cached_prefix})
         messages.append({"role": "user", "content": prompt})
         
-        response = ollama.chat(
+        response = self.ollama_client.chat(
             model=self.model,
             messages=messages,
-            options={"temperature": temperature}
+            options={"temperature": temperature},
+            **({"format": "json"} if json_mode else {})
         )
         
         return response['message']['content'].strip()
@@ -246,19 +386,27 @@ class AIService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        cached_prefix: Optional[str] = None
     ) -> str:
         """Generate completion using Claude (Anthropic)."""
         if not self.anthropic_client:
             raise RuntimeError("Anthropic client not initialized")
         
         messages = [{"role": "user", "content": prompt}]
+        system = system_prompt if system_prompt else "You are a professional resume writer."
+        if cached_prefix:
+            # Everything up to the cache_control breakpoint is cached for a few minutes
+            system = [
+                {"type": "text", "text": system},
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+            ]
         
         response = self.anthropic_client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_prompt if system_prompt else "You are a professional resume writer.",
+            system=system,
             messages=messages
         )
         
@@ -269,7 +417,9 @@ class AIService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        json_mode: bool = False,
+        cached_prefix: Optional[str] = None
     ) -> str:
         """Generate completion using OpenAI GPT."""
         if not self.openai_client:
@@ -278,13 +428,17 @@ class AIService:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
+        if cached_prefix:
+            # OpenAI caches identical prompt prefixes of 1024+ tokens automatically
+            messages.append({"role": "system", "content": cached_prefix})
         messages.append({"role": "user", "content": prompt})
         
         response = self.openai_client.chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            **({"response_format": {"type": "json_object"}} if json_mode else {})
         )
         
         return response.choices[0].message.content.strip()
@@ -294,7 +448,8 @@ class AIService:
         original_summary: str,
         job_description: str,
         job_title: str,
-        company: str
+        company: str,
+        use_cache: bool = True
     ) -> str:
         """
         Tailor resume summary for specific job.
@@ -304,6 +459,7 @@ class AIService:
             job_description: Job description
             job_title: Job title
             company: Company name
+            use_cache: If False, generate afresh instead of reusing a stored completion
             
         Returns:
             Tailored summary text
@@ -408,7 +564,11 @@ OUTPUT ONLY THE REWRITTEN SUMMARY (headline + body, no commentary):"""
         logger.info(f"Top Keywords: {', '.join(top_keywords[:5])}")
         logger.info(f"{'='*70}\n")
         
-        response = self.generate_completion(prompt, system_prompt, temperature=0.3)
+        response = self.generate_cached_completion(
+            'summary', prompt, system_prompt, temperature=0.3,
+            validate=lambda text: self.summary_is_complete(self._clean_ai_commentary(text)),
+            use_cache=use_cache
+        )
         
         # Clean up any remaining AI commentary
         response = self._clean_ai_commentary(response)
@@ -547,7 +707,8 @@ OUTPUT ONLY THE REWRITTEN SUMMARY (headline + body, no commentary):"""
         original_skills: str,
         job_description: str,
         job_title: str,
-        company: str
+        company: str,
+        use_cache: bool = True
     ) -> str:
         """
         Tailor skills section for specific job.
@@ -557,6 +718,7 @@ OUTPUT ONLY THE REWRITTEN SUMMARY (headline + body, no commentary):"""
             job_description: Job description
             job_title: Job title
             company: Company name
+            use_cache: If False, generate afresh instead of reusing a stored completion
             
         Returns:
             Tailored skills text
@@ -659,7 +821,10 @@ OUTPUT ONLY THE 4 CATEGORY LINES:"""
         logger.info(f"Target: {job_title} at {company}")
         logger.info(f"{'='*70}\n")
         
-        response = self.generate_completion(prompt, system_prompt, temperature=0.2)
+        response = self.generate_cached_completion(
+            'skills', prompt, system_prompt, temperature=0.2,
+            validate=self.skills_are_complete, use_cache=use_cache
+        )
         
         # Clean up the response
         cleaned_response = self._format_skills_single_line(response)
@@ -673,6 +838,25 @@ OUTPUT ONLY THE 4 CATEGORY LINES:"""
         
         return cleaned_response
     
+    @staticmethod
+    def summary_is_complete(summary: str) -> bool:
+        """Whether a tailored summary is long enough to use."""
+        return bool(summary) and len(summary.strip()) >= _MIN_SUMMARY_CHARS
+    
+    @staticmethod
+    def missing_skill_categories(skills: str) -> List[str]:
+        """Required skill categories absent from a skills section, in their standard order."""
+        found = set(_REQUIRED_SKILL_CATEGORY_RE.findall(skills))
+        return [cat for cat in _REQUIRED_SKILL_CATEGORIES if cat not in found]
+    
+    @classmethod
+    def skills_are_complete(cls, skills: str) -> bool:
+        """Whether a tailored skills section is long enough and has every required category."""
+        return (
+            bool(skills) and len(skills.strip()) >= _MIN_SKILLS_CHARS
+            and not cls.missing_skill_categories(skills)
+        )
+    
     def _clean_ai_commentary(self, text: str) -> str:
         """Remove common AI commentary patterns from responses."""
         # Remove common AI prefixes
@@ -890,7 +1074,7 @@ OUTPUT EXACTLY {num_bullets} BULLETS (plain text, one per line):"""
         logger.info(f"Bullets to generate: {num_bullets}")
         logger.info(f"{'='*70}\n")
         
-        response = self.generate_completion(prompt, system_prompt, temperature=0.4)
+        response = self.generate_cached_completion('experience', prompt, system_prompt, temperature=0.4)
         
         # Clean and parse bullets
         response = self._clean_ai_commentary(response)
@@ -908,6 +1092,151 @@ OUTPUT EXACTLY {num_bullets} BULLETS (plain text, one per line):"""
         
         return tailored_bullets if tailored_bullets else bullets
     
+    def tailor_resume_bundle(
+        self,
+        original_summary: str,
+        original_skills: str,
+        jobs: List[Dict[str, any]],
+        job_description: str,
+        job_title: str,
+        company: str
+    ) -> Dict[str, any]:
+        """
+        Tailor the summary, skills and every job's bullets with a single completion.
+        
+        The model returns a JSON object with one entry per section. Sections
+        it leaves out (or that fail validation) come back as None so the
+        caller can tailor just those with the per-section methods.
+        
+        Args:
+            original_summary: Original summary text ('' to skip)
+            original_skills: Original skills text ('' to skip)
+            jobs: Dicts with 'company', 'title', 'dates', 'bullets' for each past job
+            job_description: Job description
+            job_title: Job title
+            company: Company name
+            
+        Returns:
+            Dict with 'summary' (str or None), 'skills' (str or None) and
+            'jobs' (list with a bullet list or None per job)
+        """
+        role_analysis = self._analyze_job_role(job_description, job_title)
+        top_keywords = self._extract_top_keywords(job_description, top_n=10)
+        missing_skills = self._extract_missing_critical_skills(
+            original_skills + "\n" + "\n".join(b for job in jobs for b in job.get('bullets', [])),
+            job_description
+        )
+        
+        system_prompt = """You are an expert ATS resume optimizer and professional resume writer.
+Your task is to rewrite resume sections to maximize ATS scores while maintaining authenticity."""
+        
+        missing_skills_instruction = ""
+        if missing_skills:
+            missing_skills_instruction = f"""
+CRITICAL MISSING SKILLS (appear frequently in the job description but not in the resume):
+{', '.join(missing_skills)}
+"""
+        
+        jobs_text = "\n\n".join(
+            f"Job {i}: {job.get('title', '')} at {job.get('company', '')} ({job.get('dates', '')})\n"
+            + "\n".join(f"{n}. {bullet}" for n, bullet in enumerate(job.get('bullets', []), 1))
+            for i, job in enumerate(jobs, 1)
+        )
+        
+        prompt = f"""Rewrite these resume sections using professional best practices for ATS and recruiter scanning.
+
+TARGET JOB:
+Title: {job_title}
+Company: {company}
+
+ROLE FOCUS ANALYSIS:
+This job is: {role_analysis['primary_role']}
+Emphasis should be: {role_analysis['emphasis_areas']}
+De-emphasize: {role_analysis['de_emphasize']}
+
+TOP KEYWORDS FROM JOB (use these):
+{', '.join(top_keywords)}
+{missing_skills_instruction}
+JOB DESCRIPTION:
+{job_description[:3000]}
+
+ORIGINAL SUMMARY:
+{original_summary}
+
+ORIGINAL TECHNICAL SKILLS:
+{original_skills}
+
+ORIGINAL WORK EXPERIENCE:
+{jobs_text}
+
+SUMMARY RULES:
+- Line 1: a headline of at most 9 words, e.g. "Backend Engineer | 9 Years | Kotlin/Spring Boot | 10M+ Users"
+- Then a blank line and 2-3 concise sentences front-loaded with the top keywords and quantified achievements
+- No bullet points, symbols or headers
+
+SKILLS RULES:
+- Exactly 4 lines, one category per line: "Category: skill1, skill2, skill3"
+- Keep ALL original skills; put job-required and missing critical skills FIRST in their categories
+- Use the exact terminology from the job description
+
+EXPERIENCE RULES:
+- For each job, return exactly as many bullets as it has now
+- Every bullet: [Action Verb] + [What You Did] + [How, with technologies from the job] + [Quantified impact]
+- Work the missing critical skills naturally into 2-3 bullets per job
+- Plain text only, no bullet symbols or numbers
+
+Return ONLY a JSON object in this shape, with one "jobs" entry per original job in the same order:
+{{"summary": "headline\\n\\nbody", "skills": "Category: a, b\\nCategory: c, d", "jobs": [{{"bullets": ["...", "..."]}}]}}
+
+JSON:"""
+        
+        logger.info(f"\n{'='*70}")
+        logger.info(f"🤖 AI PROMPT - TAILOR RESUME SECTIONS ({self.provider}/{self.model})")
+        logger.info(f"{'='*70}")
+        logger.info(f"Target: {job_title} at {company}")
+        logger.info(f"Role Type: {role_analysis['primary_role']}")
+        logger.info(f"Sections: summary, skills, {len(jobs)} jobs")
+        logger.info(f"{'='*70}\n")
+        
+        response = self.generate_cached_completion(
+            'resume_bundle', prompt, system_prompt, temperature=0.3, json_mode=True,
+            validate=self._is_resume_bundle
+        )
+        data = self._parse_json_object(response)
+        
+        summary = data.get('summary')
+        summary = self._clean_ai_commentary(summary) if isinstance(summary, str) and original_summary else None
+        
+        skills = data.get('skills')
+        if isinstance(skills, str) and original_skills:
+            skills = self._clean_ai_commentary(self._format_skills_single_line(skills))
+        else:
+            skills = None
+        
+        returned_jobs = data.get('jobs')
+        returned_jobs = returned_jobs if isinstance(returned_jobs, list) else []
+        tailored_jobs = []
+        for i, job in enumerate(jobs):
+            entry = returned_jobs[i] if i < len(returned_jobs) else None
+            bullets = entry.get('bullets') if isinstance(entry, dict) else None
+            if isinstance(bullets, list) and all(isinstance(b, str) for b in bullets):
+                parsed = self._parse_bullets("\n".join(bullets), len(job.get('bullets', [])))
+                tailored_jobs.append(parsed or None)
+            else:
+                tailored_jobs.append(None)
+        
+        logger.info(
+            f"✅ AI RESPONSE - TAILORED SECTIONS: summary={'yes' if summary else 'no'}, "
+            f"skills={'yes' if skills else 'no'}, jobs={sum(1 for b in tailored_jobs if b)}/{len(jobs)}"
+        )
+        
+        return {'summary': summary or None, 'skills': skills or None, 'jobs': tailored_jobs}
+    
+    @classmethod
+    def _is_resume_bundle(cls, text: str) -> bool:
+        """Whether a response parses to a JSON object with at least one resume section."""
+        return not _BUNDLE_SECTIONS.isdisjoint(cls._parse_json_object(text))
+    
     def _parse_bullets(self, text: str, expected_count: int) -> List[str]:
         """Parse bullet points from AI response."""
         bullets = []
@@ -969,43 +1298,90 @@ OUTPUT EXACTLY {num_bullets} BULLETS (plain text, one per line):"""
             logger.info(f"{status} '{keyword}': JD={jd_count}x, Bullets={bullet_count}x ({match_rate:.0f}% coverage)")
         logger.info(f"{'='*70}\n")
     
-    def answer_question(
+    def build_context(
         self,
-        question: str,
         job_description: str,
         job_title: str,
         company: str,
         user_background: str
-    ) -> str:
+    ) -> AIContext:
         """
-        Generate answer to application question.
+        Bundle the job details shared by every question on a form.
         
         Args:
-            question: Application question
             job_description: Job description
             job_title: Job title
             company: Company name
             user_background: User background/elevator pitch
             
+        Returns:
+            Context to pass to answer_question() and select_best_option()
+        """
+        job_requirements = job_description[:_SELECTION_DESCRIPTION_CHARS]
+        selection_background = self._selection_background()
+        return AIContext(
+            job_description=job_description,
+            job_title=job_title,
+            company=company,
+            user_background=user_background,
+            job_requirements=job_requirements,
+            selection_background=selection_background,
+            answer_digest=AnswerCache.make_key(job_description, job_title, company, user_background),
+            selection_digest=AnswerCache.make_key(job_requirements, job_title, company, selection_background),
+            answer_prefix=(
+                f"You are filling out a job application for a {job_title} position at {company}.\n\n"
+                f"Your Background:\n{user_background}\n\n"
+                f"Job Description:\n{job_description}"
+            ),
+            selection_prefix=(
+                f"You are filling out a job application for a {job_title} position at {company}.\n\n"
+                f"Your Background:\n{selection_background}\n\n"
+                f"Job Requirements:\n{job_requirements}"
+            ),
+        )
+    
+    def _answer_key(self, kind: str, question: str, *context) -> str:
+        """Build an answer cache key from the prompt inputs plus the model and style settings."""
+        return AnswerCache.make_key(
+            self.model, self.tone, self.answer_length, kind, AnswerCache.normalize_question(question), *context
+        )
+    
+    def _cached_answer(self, key: str):
+        """Return a cached answer, or None on a miss or when the cache is disabled."""
+        return self.answer_cache.get(key) if self.answer_cache is not None else None
+    
+    def _store_answer(self, key: str, answer):
+        """Store an answer in the cache if it is enabled."""
+        if self.answer_cache is not None:
+            self.answer_cache.set(key, answer)
+    
+    def answer_question(self, question: str, ctx: AIContext) -> str:
+        """
+        Generate answer to application question.
+        
+        Args:
+            question: Application question
+            ctx: Job context from build_context()
+            
         Returns:
             Generated answer
         """
+        cache_key = self._answer_key('answer', question, ctx.answer_digest)
+        cached = self._cached_answer(cache_key)
+        if cached is not None:
+            logger.info(f"         💾 Using cached AI answer")
+            return cached
+        
         logger.info(f"         🤖 Generating AI answer...")
         
         # Check if this is a numeric question
-        is_numeric = any(keyword in question.lower() for keyword in ['how many', 'years of', 'number of', 'salary', 'compensation'])
+        is_numeric = any(keyword in question.lower() for keyword in _NUMERIC_QUESTION_KEYWORDS)
         
         prompt = f"""
-Answer this job application question for a {job_title} position at {company}.
+Answer this job application question.
 
 Question: {question}
 
-Your Background:
-{user_background}
-
-Job Description:
-{job_description}
-
 Requirements:
 - Be {self.answer_length}
 - Use a {self.tone} tone
@@ -1016,20 +1392,118 @@ Requirements:
 
 Answer:"""
         
-        answer = self.generate_completion(prompt)
+        answer = self.generate_completion(prompt, cached_prefix=ctx.answer_prefix)
         # Remove markdown formatting (e.g., **, *, _, `, #)
         import re
         answer = re.sub(r'[\*`_#]', '', answer)
         logger.info(f"         🤖 AI generated answer ({len(answer)} chars, markdown stripped)")
+        self._store_answer(cache_key, answer)
         return answer
     
+    def answer_questions_batch(self, questions: Dict[str, str], ctx: AIContext) -> Dict[str, str]:
+        """
+        Answer several application questions with a single completion.
+        
+        The model returns a JSON object keyed by question number; any question
+        it skips is answered on its own with answer_question().
+        
+        Args:
+            questions: Field path -> application question
+            ctx: Job context from build_context()
+            
+        Returns:
+            Field path -> generated answer
+        """
+        results = {}
+        cache_keys = {}
+        for path, question in questions.items():
+            cache_keys[path] = self._answer_key('answer', question, ctx.answer_digest)
+            cached = self._cached_answer(cache_keys[path])
+            if cached is not None:
+                results[path] = cached
+        if results:
+            logger.info(f"         💾 Using {len(results)} cached AI answers")
+        
+        paths = [path for path in questions if path not in results]
+        if len(paths) <= 1:
+            for path in paths:
+                results[path] = self.answer_question(questions[path], ctx)
+            return results
+        
+        logger.info(f"         🤖 Generating AI answers for {len(paths)} questions in one request...")
+        
+        # Field paths are long ids; short numeric keys are easier for the model to echo back
+        questions_text = "\n".join(
+            f'"{i}": {questions[path]}'
+            + (" (answer with ONLY the number)" if any(k in questions[path].lower() for k in _NUMERIC_QUESTION_KEYWORDS) else "")
+            for i, path in enumerate(paths, 1)
+        )
+        
+        prompt = f"""
+Answer these job application questions.
+
+Questions:
+{questions_text}
+
+Requirements:
+- Be {self.answer_length}
+- Use a {self.tone} tone
+- Relate your experience to the job requirements
+- Be honest and authentic
+- For numeric questions, provide ONLY the number (e.g., '5' not '5 years')
+- Return ONLY a JSON object mapping each question number to its answer string, e.g. {{"1": "...", "2": "..."}}
+
+JSON:"""
+        
+        response = self.generate_completion(prompt, json_mode=True, cached_prefix=ctx.answer_prefix)
+        answers = self._parse_json_object(response)
+        
+        for i, path in enumerate(paths, 1):
+            answer = answers.get(str(i))
+            if isinstance(answer, (int, float)) and not isinstance(answer, bool):
+                answer = str(answer)
+            if isinstance(answer, str) and answer.strip():
+                # Remove markdown formatting (e.g., **, *, _, `, #)
+                results[path] = re.sub(r'[\*`_#]', '', answer).strip()
+                self._store_answer(cache_keys[path], results[path])
+            else:
+                logger.warning(f"         ⚠️  No batched answer for question {i}, asking it separately")
+                results[path] = self.answer_question(questions[path], ctx)
+        
+        logger.info(f"         🤖 AI generated {len(paths)} answers")
+        return results
+    
+    async def answer_questions_batch_async(self, questions: Dict[str, str], ctx: AIContext) -> Dict[str, str]:
+        """
+        Async variant of answer_questions_batch.
+        
+        Args:
+            questions: Field path -> application question
+            ctx: Job context from build_context()
+            
+        Returns:
+            Field path -> generated answer
+        """
+        return await asyncio.to_thread(self.answer_questions_batch, questions, ctx)
+    
+    @staticmethod
+    def _parse_json_object(text: str) -> Dict:
+        """Parse the first JSON object in a model response, or return {} if there is none."""
+        start = text.find('{')
+        if start == -1:
+            return {}
+        try:
+            data, _ = json.JSONDecoder().raw_decode(text, start)
+        except json.JSONDecodeError:
+            logger.warning("         ⚠️  Could not parse JSON from AI response")
+            return {}
+        return data if isinstance(data, dict) else {}
+    
     def select_best_option(
         self,
         question: str,
         options: List[str],
-        job_description: str,
-        job_title: str,
-        company: str,
+        ctx: AIContext,
         multi_select: bool = False
     ) -> Union[str, List[str]]:
         """
@@ -1038,36 +1512,30 @@ Answer:"""
         Args:
             question: Question text
             options: Available options
-            job_description: Job description
-            job_title: Job title
-            company: Company name
+            ctx: Job context from build_context()
             multi_select: Whether multiple selections are allowed
             
         Returns:
             Selected option(s)
         """
+        # Options are part of the key, so a changed option list never reuses an old pick
+        cache_key = self._selection_key(question, options, ctx, multi_select)
+        cached = self._cached_answer(cache_key)
+        if cached is not None:
+            logger.info(f"         💾 Using cached selection")
+            return cached
+        
         logger.info(f"         🤖 Selecting from {len(options)} options...")
         options_text = "\n".join(f"{i+1}. {opt}" for i, opt in enumerate(options))
         
-        # Get user background from settings (with safe null checking)
-        background = self.settings.user_info.background
-        user_background = background.elevator_pitch if background and hasattr(background, 'elevator_pitch') else "Experienced software engineer"
-        
         prompt = f"""
 Select the best option{'(s)' if multi_select else ''} for this job application question.
 
 Question: {question}
-Position: {job_title} at {company}
 
 Available Options:
 {options_text}
 
-Your Background:
-{user_background}
-
-Job Requirements:
-{job_description[:1500]}
-
 Instructions:
 - Select the option that best matches the job requirements and your background
 {"- You can select multiple options if relevant" if multi_select else "- Select only ONE option"}
@@ -1077,17 +1545,130 @@ Instructions:
 Selected Option{'(s)' if multi_select else ''}:"""
         
         logger.info(f"Selecting option for: {question[:50]}...")
-        response = self.generate_completion(prompt)
+        response = self.generate_completion(prompt, cached_prefix=ctx.selection_prefix)
         
         if multi_select and '|||' in response:
             selected = [opt.strip() for opt in response.split('|||')]
-            return [s for s in selected if s in options]
+            selected = [s for s in selected if s in options]
+            # A response that matched no option is not worth replaying
+            if selected:
+                self._store_answer(cache_key, selected)
+            return selected
         else:
             # Find best match in options
             response_lower = response.lower().strip()
             for option in options:
                 if option.lower() in response_lower or response_lower in option.lower():
+                    self._store_answer(cache_key, option)
                     return option
             # Fallback to first option
             logger.warning(f"Could not match response '{response}' to options, using first option")
             return options[0] if options else ""
+    
+    def _selection_background(self) -> str:
+        """Get the user background used in option-selection prompts (with safe null checking)."""
+        background = self.settings.user_info.background
+        return background.elevator_pitch if background and hasattr(background, 'elevator_pitch') else "Experienced software engineer"
+    
+    def _selection_key(self, question: str, options: List[str], ctx: AIContext, multi_select: bool) -> str:
+        """Build the answer cache key for an option selection."""
+        return self._answer_key('select', question, options, ctx.selection_digest, multi_select)
+    
+    def select_options_batch(
+        self,
+        questions: Dict[str, Tuple[str, List[str], bool]],
+        ctx: AIContext
+    ) -> Dict[str, Union[str, List[str]]]:
+        """
+        Select options for several multiple-choice questions with a single completion.
+        
+        The model returns a JSON object keyed by question number; picks that
+        don't match an offered option are redone with select_best_option().
+        
+        Args:
+            questions: Field path -> (question, options, multi_select)
+            ctx: Job context from build_context()
+            
+        Returns:
+            Field path -> selected option (or list of options for multi-select)
+        """
+        results = {}
+        cache_keys = {}
+        for path, (question, options, multi_select) in questions.items():
+            cache_keys[path] = self._selection_key(question, options, ctx, multi_select)
+            cached = self._cached_answer(cache_keys[path])
+            if cached is not None:
+                results[path] = cached
+        if results:
+            logger.info(f"         💾 Using {len(results)} cached selections")
+        
+        paths = [path for path in questions if path not in results]
+        if len(paths) <= 1:
+            for path in paths:
+                question, options, multi_select = questions[path]
+                results[path] = self.select_best_option(question, options, ctx, multi_select)
+            return results
+        
+        logger.info(f"         🤖 Selecting options for {len(paths)} questions in one request...")
+        
+        blocks = []
+        for i, path in enumerate(paths, 1):
+            question, options, multi_select = questions[path]
+            options_text = "\n".join(f"   - {opt}" for opt in options)
+            blocks.append(
+                f'"{i}": {question} ({"select one or more" if multi_select else "select ONE"})\n{options_text}'
+            )
+        questions_text = "\n\n".join(blocks)
+        
+        prompt = f"""
+Select the best options for these job application questions.
+
+Questions:
+{questions_text}
+
+Instructions:
+- Select the options that best match the job requirements and your background
+- Use the exact option text
+- Return ONLY a JSON object mapping each question number to its selected option, or to a list of options for "select one or more" questions, e.g. {{"1": "Yes", "2": ["Python", "Go"]}}
+
+JSON:"""
+        
+        response = self.generate_completion(prompt, json_mode=True, cached_prefix=ctx.selection_prefix)
+        selections = self._parse_json_object(response)
+        
+        for i, path in enumerate(paths, 1):
+            question, options, multi_select = questions[path]
+            selected = selections.get(str(i))
+            if multi_select:
+                picks = selected if isinstance(selected, list) else [selected]
+                picks = [opt for opt in picks if isinstance(opt, str) and opt in options]
+                valid = bool(picks)
+                selected = picks
+            else:
+                valid = isinstance(selected, str) and selected in options
+            
+            if valid:
+                results[path] = selected
+                self._store_answer(cache_keys[path], selected)
+            else:
+                logger.warning(f"         ⚠️  No valid batched selection for question {i}, asking it separately")
+                results[path] = self.select_best_option(question, options, ctx, multi_select)
+        
+        return results
+    
+    async def select_options_batch_async(
+        self,
+        questions: Dict[str, Tuple[str, List[str], bool]],
+        ctx: AIContext
+    ) -> Dict[str, Union[str, List[str]]]:
+        """
+        Async variant of select_options_batch.
+        
+        Args:
+            questions: Field path -> (question, options, multi_select)
+            ctx: Job context from build_context()
+            
+        Returns:
+            Field path -> selected option (or list of options for multi-select)
+        """
+        return await asyncio.to_thread(self.select_options_batch, questions, ctx)
@@ -2,23 +2,418 @@
 Browser automation service using Playwright.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlparse
+from functools import lru_cache
+import gzip
+import logging
+import mimetypes
+import re
+import threading
 import time
 import random
 import signal
 
 from src.config.settings import Settings
 from src.utils.logger import get_logger
+from src.utils.fuzzy import best_match
 from src.utils.paths import (
     get_pre_submit_screenshot_path,
     get_post_submit_screenshot_path,
     get_form_debug_screenshot_path,
-    get_form_html_debug_path
+    get_form_html_debug_path,
+    get_browser_state_path
 )
 
 logger = get_logger(__name__)
 
+# Playwright is imported by _load_playwright() when the first submission runs, so
+# importing this module stays cheap. PlaywrightError also covers playwright's
+# TimeoutError (a subclass).
+_sync_playwright = None
+PlaywrightError = Exception
+
+
+def _load_playwright() -> bool:
+    """
+    Import Playwright once per process.
+    
+    Returns:
+        True if Playwright is available, False if it is not installed
+    """
+    global _sync_playwright, PlaywrightError
+    if _sync_playwright is None:
+        try:
+            from playwright.sync_api import sync_playwright, Error
+        except ImportError:
+            return False
+        _sync_playwright = sync_playwright
+        PlaywrightError = Error
+    return True
+
+# Chrome flags shared by every launch mode
+_CHROME_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+]
+
+# Question keywords that earn a longer "thinking" pause before the next field
+_COMPLEX_KW_RE = re.compile(r'experience|why|describe|explain', re.IGNORECASE)
+
+# Scroll a field into view, focus it and clear it in one round-trip (native setter keeps React in sync)
+_FOCUS_AND_CLEAR_JS = """
+(el) => {
+    el.scrollIntoView({block: 'center'});
+    el.focus();
+    if ('value' in el) {
+        const desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+        if (desc && desc.set) desc.set.call(el, ''); else el.value = '';
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+    }
+}
+"""
+
+# Resolve with the field's value length as soon as it is within 10 chars of expected (or after timeoutMs)
+_WAIT_FOR_LENGTH_JS = """
+(el, [expected, timeoutMs]) => new Promise(resolve => {
+    const ready = () => el.value.length >= expected - 10;
+    if (ready()) return resolve(el.value.length);
+    const finish = () => {
+        el.removeEventListener('input', onInput);
+        clearTimeout(timer);
+        resolve(el.value.length);
+    };
+    const onInput = () => { if (ready()) finish(); };
+    el.addEventListener('input', onInput);
+    const timer = setTimeout(finish, timeoutMs);
+})
+"""
+
+# Anti-bot widgets whose presence marks a site as high risk
+_CAPTCHA_SELECTOR = (
+    'iframe[src*="captcha" i], iframe[title*="captcha" i], iframe[src*="challenges.cloudflare.com"], '
+    '[class*="captcha" i], [id*="captcha" i], .cf-turnstile'
+)
+
+# Sites at or above this bot-detection risk get the slower, human-like interaction
+_HIGH_BOT_RISK = 0.3
+
+# Widget selector or visible "captcha" text, checked in a single round-trip
+_CAPTCHA_CHECK_JS = """
+(sel) => document.querySelector(sel) !== null
+    || (document.body !== null && /captcha/i.test(document.body.innerText))
+"""
+
+# Replay a pre-drawn pointer/scroll sequence in one round-trip; each move is
+# interpolated over s.steps synthetic mousemove events like page.mouse.move
+_HUMAN_SEQUENCE_JS = """
+async (seq) => {
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    let lastX = 0, lastY = 0;
+    for (const s of seq) {
+        if (s.scroll !== undefined) {
+            window.scrollTo(0, s.scroll);
+        } else {
+            for (let i = 1; i <= s.steps; i++) {
+                const x = lastX + (s.x - lastX) * i / s.steps;
+                const y = lastY + (s.y - lastY) * i / s.steps;
+                const target = document.elementFromPoint(x, y) || document.body || document;
+                target.dispatchEvent(new MouseEvent('mousemove', {
+                    bubbles: true, cancelable: true, view: window, clientX: x, clientY: y
+                }));
+            }
+            lastX = s.x;
+            lastY = s.y;
+        }
+        await sleep(s.t);
+    }
+}
+"""
+
+# Post-submit page signals; spam/flagged take priority over the success phrases
+_SUBMIT_STATUS_RE = re.compile(r'spam|flagged|thank you|submitted|received', re.IGNORECASE)
+_SPAM_SIGNALS = frozenset({'spam', 'flagged'})
+
+# Read back the value lengths of all tagged text fields in one round-trip
+_VALUE_LENGTHS_JS = """
+(ids) => ids.map(id => {
+    const el = document.querySelector(`[data-alphajob-id="${id}"]`);
+    return el && typeof el.value === 'string' ? el.value.length : 0;
+})
+"""
+
+# Resolve every field's selector candidates in one DOM pass and tag the hits
+_FIELD_MAP_JS = """
+(fields) => {
+    const map = {};
+    fields.forEach((f, i) => {
+        for (const sel of f.selectors) {
+            let el = null;
+            try {
+                el = document.querySelector(sel);
+            } catch (e) {
+                continue;  // Playwright-only syntax such as :has-text()
+            }
+            if (el) {
+                const id = el.getAttribute('data-alphajob-id') ?? String(i);
+                el.setAttribute('data-alphajob-id', id);
+                map[f.path] = id;
+                break;
+            }
+        }
+    });
+    return map;
+}
+"""
+
+
+# Match counts for a list of selectors in one round-trip (-1 for Playwright-only syntax)
+_SELECTOR_COUNTS_JS = """
+(selectors) => selectors.map(sel => {
+    try {
+        return document.querySelectorAll(sel).length;
+    } catch (e) {
+        return -1;
+    }
+})
+"""
+
+# First text input/textarea whose parent's text contains the title; tagged and returned by id
+_PARENT_TEXT_MATCH_JS = """
+([title, selector, fallbackId]) => {
+    for (const el of document.querySelectorAll(selector)) {
+        const parent = el.parentElement;
+        if (!parent || !parent.innerText.toLowerCase().includes(title)) continue;
+        let id = el.getAttribute('data-alphajob-id');
+        if (id === null) {
+            id = fallbackId;
+            el.setAttribute('data-alphajob-id', id);
+        }
+        return id;
+    }
+    return null;
+}
+"""
+
+# Index every <label> once: lowercased text (required-marker stripped) and its tagged form control
+_LABEL_INDEX_JS = """
+() => {
+    const FIELDS = 'input, textarea, select';
+    return [...document.querySelectorAll('label')].map((l, i) => {
+        const target = l.control || (l.parentElement && l.parentElement.querySelector(FIELDS));
+        let id = null;
+        if (target) {
+            id = target.getAttribute('data-alphajob-id');
+            if (id === null) {
+                id = 'l' + i;
+                target.setAttribute('data-alphajob-id', id);
+            }
+        }
+        return [l.innerText.trim().replace(/\\s*\\*$/, '').toLowerCase(), id];
+    });
+}
+"""
+
+# One DOM walk that resolves the text-proximity fallback for every form title:
+# title -> tag of the first field after an element whose own text contains the whole title
+_TEXT_SCAN_JS = """
+(titles) => {
+    const FIELDS = 'input, textarea, select';
+    let next = 0;
+    const tag = (el) => {
+        let id = el.getAttribute('data-alphajob-id');
+        if (id === null) {
+            id = 't' + (next++);
+            el.setAttribute('data-alphajob-id', id);
+        }
+        return id;
+    };
+    const all = [...document.body.querySelectorAll('*')];
+    const inputs = [];
+    const ownText = all.map((el, i) => {
+        if (el.matches(FIELDS)) inputs.push(i);
+        if (el.matches('script, style')) return '';
+        let text = '';
+        for (const n of el.childNodes) if (n.nodeType === 3) text += n.nodeValue;
+        return text.toLowerCase();
+    });
+    const out = {};
+    for (const title of titles) {
+        for (let i = 0; i < all.length && !(title in out); i++) {
+            if (!ownText[i].includes(title)) continue;
+            const j = inputs.find(k => k > i && !all[i].contains(all[k]));
+            if (j !== undefined) out[title] = tag(all[j]);
+        }
+    }
+    return out;
+}
+"""
+
+
+# Every radio input after a heading in document order, with its label text
+_FOLLOWING_RADIOS_JS = """
+(heading) => {
+    const radios = [];
+    for (const r of document.querySelectorAll('input[type="radio"]')) {
+        const pos = heading.compareDocumentPosition(r);
+        if (!(pos & Node.DOCUMENT_POSITION_FOLLOWING) || (pos & Node.DOCUMENT_POSITION_CONTAINED_BY)) continue;
+        const label = r.id ? document.querySelector(`label[for="${CSS.escape(r.id)}"]`) : null;
+        radios.push({id: r.id || null, text: label ? label.innerText : null});
+    }
+    return radios;
+}
+"""
+
+# Find a radio group's container, tag it, and return its label texts
+_OPTION_GROUP_JS = """
+(el) => {
+    const c = el.closest('fieldset') || el.closest('div[class*="fieldEntry"]');
+    if (!c) return null;
+    let gid = c.getAttribute('data-alphajob-group');
+    if (gid === null) {
+        window.__alphajobGroups = (window.__alphajobGroups || 0) + 1;
+        gid = String(window.__alphajobGroups);
+        c.setAttribute('data-alphajob-group', gid);
+    }
+    return {
+        group: gid,
+        labels: [...c.querySelectorAll('label')].map(l => l.innerText.trim()),
+    };
+}
+"""
+
+# Set a checkbox group to exactly the desired (lowercased) label texts by clicking only labels that differ
+_SYNC_CHECKBOXES_JS = """
+(el, desired) => {
+    const c = el.closest('fieldset') || el.closest('div[class*="fieldEntry"]');
+    if (!c) return null;
+    const labels = [];
+    const matched = [];
+    for (const l of c.querySelectorAll('label')) {
+        const text = l.innerText.trim();
+        const input = l.control || (l.htmlFor ? c.querySelector(`#${CSS.escape(l.htmlFor)}`) : null);
+        const shouldBe = desired.includes(text.toLowerCase());
+        labels.push(text);
+        if (shouldBe) matched.push(text.toLowerCase());
+        if (input ? input.checked !== shouldBe : shouldBe) l.click();
+    }
+    return {labels, matched};
+}
+"""
+
+# EEO answer -> label substrings that count as a match (anything else is matched literally)
+_GENDER_MATCHES = {
+    'man': ('male', 'man'),
+    'male': ('male', 'man'),
+    'woman': ('female', 'woman'),
+    'female': ('female', 'woman'),
+    'non-binary': ('non-binary', 'nonbinary', 'non binary'),
+    'prefer not to say': ('decline', 'prefer not', 'rather not'),
+}
+_VETERAN_MATCHES = {
+    'no': ('not a veteran', 'not a protected veteran', 'i am not'),
+    'yes': ('i am a veteran', 'protected veteran', 'i identify as'),
+    'decline': ('decline', 'prefer not', 'rather not'),
+}
+
+# Selector candidates per field type; {title}, {path} and {path_lower} are filled per field
+_FILE_SELECTORS = (
+    'input[type="file"]',
+    '[data-testid*="resume"]',
+    '[data-testid*="upload"]',
+    'button:has-text("Upload") + input[type="file"]',
+)
+_BOOLEAN_SELECTOR_TEMPLATES = (
+    'input[type="checkbox"][name="{path_lower}"]',
+    'input[type="checkbox"][name="{path}"]',
+    'input[type="checkbox"][id*="{path_lower}"]',
+)
+_LOCATION_SELECTORS = (
+    'input[placeholder="Start typing..."]',
+    'input[placeholder*="Start typing" i]',
+    'input[placeholder*="location" i]',
+    'input[placeholder*="city" i]',
+    'input[aria-label*="location" i]',
+)
+_LOCATION_PATH_TEMPLATES = (
+    '[id="{path_lower}"]',
+    '[name="{path_lower}"]',
+)
+_TITLE_SELECTOR_TEMPLATES = (
+    'input[placeholder*="{title}" i]',
+    'textarea[placeholder*="{title}" i]',
+    'input[aria-label*="{title}" i]',
+    'textarea[aria-label*="{title}" i]',
+)
+_PATH_SELECTOR_TEMPLATES = (
+    '[id="{path_lower}"]',
+    '[name="{path_lower}"]',
+    '[id="{path}"]',
+    '[name="{path}"]',
+)
+
+
+def _css_string(value: str) -> str:
+    """Escape a value for use inside a double-quoted CSS attribute selector."""
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+@lru_cache(maxsize=4096)
+def _build_selectors(field_type: str, field_path: str, field_title: str) -> Tuple[str, ...]:
+    """Build the CSS selector candidates for a form field (cached per field definition)."""
+    if field_type == 'File':
+        return _FILE_SELECTORS
+    
+    values = {
+        'title': _css_string(field_title),
+        'path': _css_string(field_path),
+        'path_lower': _css_string(field_path.lower()),
+    }
+    
+    if field_type == 'Boolean':
+        return tuple(t.format(**values) for t in _BOOLEAN_SELECTOR_TEMPLATES)
+    
+    if field_type == 'Location':
+        if not field_path:
+            return _LOCATION_SELECTORS
+        return _LOCATION_SELECTORS + tuple(t.format(**values) for t in _LOCATION_PATH_TEMPLATES)
+    
+    selectors = tuple(t.format(**values) for t in _TITLE_SELECTOR_TEMPLATES)
+    if field_path:
+        selectors += tuple(t.format(**values) for t in _PATH_SELECTOR_TEMPLATES)
+    return selectors
+
+
+class _FillState:
+    """
+    Lookup state for filling one page's form.
+    
+    Created per _fill_form_fields() call and passed to the element lookup
+    helpers, so batch workers sharing one BrowserService never see each
+    other's pages.
+    """
+    
+    def __init__(self, form_fields: List[Dict]):
+        # field_path -> data-alphajob-id for elements resolved before the fill loop
+        self.field_map: Dict[str, str] = {}
+        # selector -> (locator, count) for matches found during this fill
+        self.locator_cache: Dict[str, Tuple[object, int]] = {}
+        # Titles of the form being filled and their text-scan matches (computed on first need)
+        self.form_titles: List[str] = list(dict.fromkeys(field['title'] for field in form_fields))
+        self.text_matches: Optional[Dict[str, str]] = None
+        # (lowercased label text, tagged control id) for every label with a form control
+        self.label_index: List[Tuple[str, str]] = []
+        self.label_exact: Dict[str, str] = {}
+        # Add human-like pauses between field actions (set for anti-bot sites)
+        self.humanize = False
+
 
 class BrowserService:
     """Handle browser automation for form filling using Playwright."""
@@ -34,6 +429,26 @@ class BrowserService:
         self.settings = settings
         self.headless = headless
         self.auto_submit = True  # Set to False to require manual submission
+        # site (netloc) -> bot-detection risk in [0, 1], raised when a CAPTCHA is seen
+        self._bot_risk: Dict[str, float] = {}
+        
+        # Background pool for debug artifact writes (Playwright calls stay on the caller's thread);
+        # each submission waits only for the writes it queued
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # Cookies/localStorage carried between fresh browser contexts
+        self._state_path = get_browser_state_path()
+        self._state_lock = threading.Lock()
+        
+        # (resume path, mtime_ns, size) -> (file name, MIME type, bytes), shared by all submissions
+        self._resume_cache: Dict[Tuple[str, int, int], Tuple[str, str, bytes]] = {}
+        self._resume_lock = threading.Lock()
+        
+        # Warm debug-profile Chrome reused across submit_application() calls; the sync
+        # API is bound to the thread that started it, so only that thread reuses it
+        self._playwright = None
+        self._shared_context = None
+        self._owner_thread: Optional[int] = None
         
         logger.info(f"Browser service initialized (headless={headless})")
     
@@ -60,97 +475,249 @@ class BrowserService:
         logger.info("🤖 Submitting application with browser automation...")
         logger.info("="*70)
         
+        if not _load_playwright():
+            return self._playwright_missing()
+        
         try:
-            from playwright.sync_api import sync_playwright
-            
             logger.info(f"   🌐 Initializing Playwright...")
             logger.info(f"   📄 Resume file: {Path(resume_path).name if resume_path else 'None'}")
             logger.info(f"   📊 Fields to fill: {len(filled_data)}")
             
-            with sync_playwright() as p:
+            if self._owner_thread in (None, threading.get_ident()):
+                browser_context = self._get_shared_context()
+                # A new tab per job; the launch tab stays open so the window survives between jobs
                 try:
-                    logger.info(f"   🚀 Launching Chrome with debug profile...")
-                    
-                    # Use a separate debugging profile directory
-                    import os
-                    import tempfile
-                    home_dir = os.path.expanduser("~")
-                    debug_profile = os.path.join(home_dir, "Library/Application Support/Google/Chrome-Debug")
-                    
-                    logger.info(f"   📂 Using debug profile: {debug_profile}")
-                    
-                    # Launch Chrome with debug profile
-                    browser = p.chromium.launch_persistent_context(
-                        debug_profile,
-                        headless=False,
-                        channel="chrome",
-                        args=[
-                            '--disable-blink-features=AutomationControlled',
-                            '--no-first-run',
-                            '--no-default-browser-check',
-                            '--disable-background-timer-throttling',
-                            '--disable-backgrounding-occluded-windows',
-                            '--disable-renderer-backgrounding',
-                        ],
-                        viewport={'width': 1920, 'height': 1080},
+                    page = browser_context.new_page()
+                except PlaywrightError:
+                    # The window was closed since the last job; start a fresh browser
+                    self.close()
+                    browser_context = self._get_shared_context()
+                    page = browser_context.new_page()
+                try:
+                    return self._run_submission(
+                        page, browser_context, browser_context, job_url, filled_data, form_fields, resume_path
                     )
-                    
-                    logger.info(f"   ✅ Chrome ready")
-                    logger.info(f"   ℹ️  Note: Using separate debug profile. You can sign into your accounts for full legitimacy.")
-                    
-                    # Get or create a page
-                    page = browser.pages[0] if browser.pages else browser.new_page()
-                    
-                    # Inject anti-detection scripts
-                    logger.info(f"   🔒 Injecting stealth scripts...")
-                    self._inject_stealth_scripts(page)
-                    logger.info(f"   ✅ Stealth mode activated")
-                    
-                    # Navigate to job page
-                    logger.info(f"   🌐 Navigating to job page...")
-                    self._navigate_to_job(page, job_url)
-                    
-                    # Click Apply button if needed
-                    logger.info(f"   🔍 Looking for Apply button...")
-                    self._click_apply_button(page)
-                    
-                    # Fill form fields
-                    logger.info(f"   📝 Filling form fields...")
-                    self._fill_form_fields(page, filled_data, form_fields, resume_path)
-                    
-                    # Fill additional EEO fields
-                    logger.info(f"   🏢 Filling EEO fields...")
-                    self._fill_eeo_fields(page)
-                    
-                    # Take pre-submit screenshot
-                    pre_submit_path = get_pre_submit_screenshot_path()
-                    page.screenshot(path=str(pre_submit_path), full_page=True)
-                    logger.info(f"   ✅ Pre-submit screenshot: {pre_submit_path}")
-                    
-                    # Submit or manual review
-                    if not self.auto_submit:
-                        result = self._manual_submit(browser, browser)
-                    else:
-                        result = self._auto_submit(page, browser, browser)
-                    
-                    return result
-                    
-                except Exception as e:
-                    logger.error(f"   ⚠️  Browser context error: {e}")
+                finally:
                     try:
-                        browser.close()
-                    except:
+                        page.close()
+                    except Exception:
                         pass
-                    raise
+            
+            # Called from a different thread than the warm browser's: use a one-off launch
+            with _sync_playwright() as p:
+                # Pre-bind so cleanup never trips over a launch that failed
+                browser_context = None
+                try:
+                    browser_context = self._launch_debug_context(p)
+                    page = browser_context.pages[0] if browser_context.pages else browser_context.new_page()
+                    return self._run_submission(
+                        page, browser_context, browser_context, job_url, filled_data, form_fields, resume_path
+                    )
+                finally:
+                    if browser_context is not None:
+                        try:
+                            browser_context.close()
+                        except Exception:
+                            pass
                     
-        except ImportError:
-            logger.error("   ❌ Playwright not installed")
-            logger.error("   Run: pip install playwright && playwright install chromium")
+        except Exception as e:
+            logger.error(f"   ❌ Error: {e}")
             return {
                 'status': 'error',
                 'success': False,
-                'message': 'Playwright not installed'
+                'message': str(e)
             }
+    
+    def prewarm(self):
+        """
+        Launch the shared browser ahead of the first submission.
+        
+        Call from the thread that will submit; failures are logged and the
+        launch is retried by submit_application().
+        """
+        if not _load_playwright() or self._owner_thread not in (None, threading.get_ident()):
+            return
+        try:
+            self._get_shared_context()
+        except Exception as e:
+            logger.warning(f"   ⚠️  Browser prewarm failed: {str(e)[:80]}")
+    
+    def _get_shared_context(self):
+        """Return the warm debug-profile context, launching it on first use."""
+        if self._shared_context is not None:
+            return self._shared_context
+        
+        self._playwright = _sync_playwright().start()
+        self._owner_thread = threading.get_ident()
+        try:
+            self._shared_context = self._launch_debug_context(self._playwright)
+        except Exception:
+            self.close()
+            raise
+        return self._shared_context
+    
+    def _launch_debug_context(self, p):
+        """
+        Launch Chrome on the debug profile with stealth scripts injected.
+        
+        Args:
+            p: Started Playwright instance
+            
+        Returns:
+            Persistent browser context (a persistent context is its own browser)
+        """
+        logger.info(f"   🚀 Launching Chrome with debug profile...")
+        
+        # Use a separate debugging profile directory
+        import os
+        home_dir = os.path.expanduser("~")
+        debug_profile = os.path.join(home_dir, "Library/Application Support/Google/Chrome-Debug")
+        
+        logger.info(f"   📂 Using debug profile: {debug_profile}")
+        
+        browser_context = p.chromium.launch_persistent_context(
+            debug_profile,
+            headless=False,
+            channel="chrome",
+            args=_CHROME_ARGS,
+            viewport={'width': 1920, 'height': 1080},
+        )
+        
+        logger.info(f"   ✅ Chrome ready")
+        logger.info(f"   ℹ️  Note: Using separate debug profile. You can sign into your accounts for full legitimacy.")
+        
+        # Inject anti-detection scripts once for every page in the context
+        logger.info(f"   🔒 Injecting stealth scripts...")
+        self._inject_stealth_scripts(browser_context)
+        logger.info(f"   ✅ Stealth mode activated")
+        return browser_context
+    
+    def close(self):
+        """
+        Close the warm browser and stop Playwright.
+        
+        Must be called from the thread that ran the submissions.
+        """
+        if self._shared_context is not None:
+            try:
+                self._shared_context.close()
+            except Exception:
+                pass
+            self._shared_context = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+        self._owner_thread = None
+    
+    def _playwright_missing(self) -> Dict:
+        """Log and build the error result used when Playwright is not installed."""
+        logger.error("   ❌ Playwright not installed")
+        logger.error("   Run: pip install playwright && playwright install chromium")
+        return {
+            'status': 'error',
+            'success': False,
+            'message': 'Playwright not installed'
+        }
+    
+    def submit_applications_batch(self, jobs: List[Dict], max_concurrency: int = 4) -> List[Dict]:
+        """
+        Submit several applications, reusing one browser per worker.
+        
+        Playwright's sync API is bound to the thread that started it, so each
+        worker thread launches a single browser and gives every job its own
+        browser context. Every context starts from the shared
+        playwright_state.json and writes its cookies/localStorage back to it
+        when its submission finishes, so the last worker to finish overwrites
+        the saved state.
+        
+        Jobs are always submitted automatically and return without the
+        30-second inspection wait; with auto_submit off every job fails.
+        
+        Args:
+            jobs: List of dicts with submit_application() arguments
+                (job_url, filled_data, form_fields, optional resume_path)
+            max_concurrency: Maximum number of browsers running at once
+            
+        Returns:
+            List of submission results in the same order as jobs
+        """
+        if not jobs:
+            return []
+        if not _load_playwright():
+            return [self._playwright_missing() for _ in jobs]
+        if not self.auto_submit:
+            # Manual review waits on input() and a visible window, neither of which works from pool threads
+            logger.error("   ❌ Batch submission requires auto_submit")
+            return [
+                {'status': 'error', 'success': False, 'message': 'Manual submission is not supported in batch mode'}
+                for _ in jobs
+            ]
+        
+        logger.info("="*70)
+        logger.info(f"🤖 Submitting {len(jobs)} applications (max {max_concurrency} browsers)...")
+        logger.info("="*70)
+        
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        workers = max(1, min(max_concurrency, len(jobs)))
+        
+        def run_worker(indices: List[int]):
+            try:
+                with _sync_playwright() as p:
+                    browser = p.chromium.launch(
+                        headless=self.headless,
+                        channel="chrome",
+                        args=_CHROME_ARGS,
+                    )
+                    try:
+                        for idx in indices:
+                            results[idx] = self._submit_in_new_context(browser, **jobs[idx])
+                    finally:
+                        browser.close()
+            except Exception as e:
+                logger.error(f"   ❌ Batch worker error: {e}")
+                for idx in indices:
+                    if results[idx] is None:
+                        results[idx] = {
+                            'status': 'error',
+                            'success': False,
+                            'message': str(e)
+                        }
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Round-robin jobs across workers so each browser handles its share in order
+            list(pool.map(run_worker, [list(range(i, len(jobs), workers)) for i in range(workers)]))
+        
+        return results
+    
+    def _submit_in_new_context(
+        self,
+        browser,
+        job_url: str,
+        filled_data: Dict,
+        form_fields: List[Dict],
+        resume_path: Optional[str] = None
+    ) -> Dict:
+        """Run one submission in a fresh browser context and close only that context."""
+        # storage_state restores cookies and localStorage only; the HTTP cache starts cold
+        with self._state_lock:
+            storage_state = str(self._state_path) if self._state_path.exists() else None
+        browser_context = browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            storage_state=storage_state,
+        )
+        try:
+            self._inject_stealth_scripts(browser_context)
+            page = browser_context.new_page()
+            # Headless per-job context: nothing to inspect once the job is submitted
+            result = self._run_submission(
+                page, browser_context, browser_context, job_url, filled_data, form_fields, resume_path,
+                inspect=False
+            )
+            self._save_storage_state(browser_context)
+            return result
         except Exception as e:
             logger.error(f"   ❌ Error: {e}")
             return {
@@ -158,10 +725,67 @@ class BrowserService:
                 'success': False,
                 'message': str(e)
             }
+        finally:
+            browser_context.close()
+    
+    def _save_storage_state(self, browser_context):
+        """Persist cookies/localStorage so the next context starts warm."""
+        try:
+            with self._state_lock:
+                browser_context.storage_state(path=str(self._state_path))
+        except Exception as e:
+            logger.warning(f"   ⚠️  Could not save browser state: {str(e)[:80]}")
     
-    def _inject_stealth_scripts(self, page):
-        """Inject comprehensive anti-detection scripts."""
-        page.add_init_script("""
+    def _run_submission(
+        self,
+        page,
+        browser_context,
+        browser,
+        job_url: str,
+        filled_data: Dict,
+        form_fields: List[Dict],
+        resume_path: Optional[str],
+        inspect: bool = True
+    ) -> Dict:
+        """
+        Navigate, fill and submit the application on an already open page.
+        
+        With inspect=False the automatic submission returns as soon as the
+        result is known instead of keeping the browser open for 30 seconds.
+        """
+        # Navigate to job page
+        logger.info(f"   🌐 Navigating to job page...")
+        self._navigate_to_job(page, job_url)
+        
+        # Click Apply button if needed
+        logger.info(f"   🔍 Looking for Apply button...")
+        pending_io: List[Future] = []
+        self._click_apply_button(page, pending_io)
+        
+        # Fill form fields
+        logger.info(f"   📝 Filling form fields...")
+        self._fill_form_fields(page, filled_data, form_fields, resume_path)
+        
+        # Fill additional EEO fields
+        logger.info(f"   🏢 Filling EEO fields...")
+        self._fill_eeo_fields(page)
+        
+        # Take pre-submit screenshot
+        pre_submit_path = get_pre_submit_screenshot_path()
+        page.screenshot(path=str(pre_submit_path), full_page=True)
+        logger.info(f"   ✅ Pre-submit screenshot: {pre_submit_path}")
+        
+        # Make sure debug artifacts are on disk before submitting
+        self._wait_for_pending_io(pending_io)
+        
+        # Submit or manual review
+        if not self.auto_submit:
+            return self._manual_submit(browser_context, browser)
+        return self._auto_submit(page, browser_context, browser, inspect)
+    
+    def _inject_stealth_scripts(self, context):
+        """Inject comprehensive anti-detection scripts into every page of a browser context."""
+        context.add_init_script("""
             // Remove webdriver property completely
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => false,
@@ -345,16 +969,32 @@ class BrowserService:
         for attempt in range(max_retries):
             try:
                 page.goto(job_url, timeout=60000)
-                page.wait_for_load_state('networkidle', timeout=30000)
+                page.wait_for_load_state('domcontentloaded', timeout=15000)
                 break
             except Exception as e:
                 if attempt < max_retries - 1:
                     logger.warning(f"   ⚠️  Attempt {attempt + 1} failed, retrying...")
                 else:
                     raise
+        
+        # Many ATS pages keep analytics/chat sockets open, so wait for the form
+        # (or an Apply button) instead of network idle
+        try:
+            page.wait_for_selector(
+                'input, textarea, select, button:has-text("Apply"), a:has-text("Apply")',
+                timeout=10000
+            )
+        except Exception:
+            logger.warning(f"   ⚠️  No form or Apply button detected yet, continuing...")
     
-    def _click_apply_button(self, page):
-        """Look for and click Apply button if it exists."""
+    def _click_apply_button(self, page, pending_io: List[Future]):
+        """
+        Look for and click Apply button if it exists.
+        
+        Args:
+            page: Playwright page object
+            pending_io: List that receives the futures of the debug artifact writes
+        """
         logger.info(f"   🔍 Looking for Apply button...")
         
         apply_button_selectors = [
@@ -373,9 +1013,8 @@ class BrowserService:
                     button.click()
                     logger.info(f"   ✅ Clicked Apply button")
                     apply_clicked = True
-                    page.wait_for_load_state('networkidle')
                     break
-            except:
+            except PlaywrightError:
                 continue
         
         if not apply_clicked:
@@ -384,7 +1023,7 @@ class BrowserService:
         # Wait for form to be visible
         try:
             page.wait_for_selector('input, textarea, select', timeout=5000)
-        except:
+        except PlaywrightError:
             # Try to find and click Apply button again
             logger.warning(f"   ⚠️  No form fields detected, looking for Apply button...")
             
@@ -405,31 +1044,72 @@ class BrowserService:
                         logger.info(f"   🎯 Found Apply button with selector: {selector}")
                         page.locator(selector).first.click()
                         logger.info(f"   ✅ Clicked Apply button, waiting for form...")
-                        page.wait_for_load_state('networkidle')
                         
                         try:
                             page.wait_for_selector('input, textarea, select', timeout=5000)
                             logger.info(f"   ✅ Form fields now visible!")
-                        except:
+                        except PlaywrightError:
                             pass
                         break
                 except Exception as e:
                     continue
         
-        # Take debug screenshot
+        # Take debug screenshot (capture here, write to disk in the background)
         debug_path = get_form_debug_screenshot_path()
-        page.screenshot(path=str(debug_path), full_page=True)
+        screenshot_bytes = page.screenshot(full_page=True, type="jpeg", quality=70)
+        pending_io.append(self._io_pool.submit(debug_path.write_bytes, screenshot_bytes))
         logger.info(f"   📸 Debug screenshot saved: {debug_path}")
         
-        # Save HTML for debugging
+        # Save HTML for debugging (gzipped, written in the background)
         html_path = get_form_html_debug_path()
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(page.content())
+        html = self._capture_html(page)
+        pending_io.append(self._io_pool.submit(self._write_gzip_text, html_path, html))
         logger.info(f"   📄 Saved page HTML for debugging: {html_path}")
     
+    def _capture_html(self, page) -> str:
+        """
+        Capture the page's outer HTML via CDP, falling back to page.content().
+        
+        Args:
+            page: Playwright page object
+            
+        Returns:
+            Serialized HTML of the document
+        """
+        try:
+            cdp = page.context.new_cdp_session(page)
+            try:
+                root = cdp.send("DOM.getDocument", {"depth": 0})
+                return cdp.send("DOM.getOuterHTML", {"nodeId": root["root"]["nodeId"]})["outerHTML"]
+            finally:
+                cdp.detach()
+        except Exception:
+            return page.content()
+    
+    @staticmethod
+    def _write_gzip_text(path: Path, text: str):
+        """Write text to a gzip-compressed UTF-8 file."""
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+    
+    @staticmethod
+    def _wait_for_pending_io(pending_io: List[Future]):
+        """Block until the given background debug artifact writes have finished."""
+        for future in pending_io:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"   ⚠️  Debug artifact write failed: {e}")
+        pending_io.clear()
+    
     def _fill_form_fields(self, page, filled_data: Dict, form_fields: List[Dict], resume_path: Optional[str]):
         """Fill all form fields with advanced human-like anti-spam strategies."""
         logger.info(f"   📝 Starting to fill {len(form_fields)} form fields...")
+        state = _FillState(form_fields)
+        state.humanize = self._site_bot_risk(page) >= _HIGH_BOT_RISK
+        state.field_map = self._precompute_field_map(page, form_fields)
+        logger.info(f"   🗺️  Pre-resolved {len(state.field_map)}/{len(form_fields)} fields")
+        self._build_label_index(page, state)
 
         boolean_yes_clicks = 0
         boolean_no_clicks = 0
@@ -437,11 +1117,16 @@ class BrowserService:
         skipped_count = 0
         error_count = 0
 
-        # Randomize field order and simulate skipping/returning
+        # Randomize field order and simulate skipping/returning:
+        # skipped fields move to a deferred pass and are deferred at most once
         field_indices = list(range(len(form_fields)))
         random.shuffle(field_indices)
         skip_chance = 0.15  # 15% chance to skip a field and return later
-        skipped_fields = []
+        primary = deque(field_indices)
+        deferred = deque()
+        already_deferred: Set[int] = set()
+        # (field id, title, expected length) for text fields, verified in one batch at the end
+        text_fills: List[Tuple[str, str, int]] = []
 
         def simulate_mouse_hover_and_scroll():
             """Simulate human-like mouse movement with Bezier curves for organic motion."""
@@ -456,13 +1141,18 @@ class BrowserService:
             
             # Use Bezier curve for organic mouse movement
             steps = random.randint(15, 40)
+            
+            # Draw all control-point jitter and per-step delays in two calls
+            offsets = random.choices(range(-100, 101), k=steps * 4)
+            delays = random.choices(range(5, 21), k=steps)
+            
             for step in range(steps):
                 t = step / steps
                 # Cubic Bezier curve with random control points
-                control1_x = start_x + random.randint(-100, 100)
-                control1_y = start_y + random.randint(-100, 100)
-                control2_x = end_x + random.randint(-100, 100)
-                control2_y = end_y + random.randint(-100, 100)
+                control1_x = start_x + offsets[4*step]
+                control1_y = start_y + offsets[4*step + 1]
+                control2_x = end_x + offsets[4*step + 2]
+                control2_y = end_y + offsets[4*step + 3]
                 
                 # Bezier formula: B(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
                 x = int((1-t)**3 * start_x + 3*(1-t)**2*t * control1_x + 3*(1-t)*t**2 * control2_x + t**3 * end_x)
@@ -473,7 +1163,7 @@ class BrowserService:
                 y = max(0, min(height-1, y))
                 
                 page.mouse.move(x, y)
-                page.wait_for_timeout(random.randint(5, 20))
+                page.wait_for_timeout(delays[step])
             
             # Random scroll
             if random.random() < 0.5:
@@ -496,72 +1186,79 @@ class BrowserService:
                 pass
 
         def human_type(element, text):
-            """Type with realistic human behavior: random delays, typos, corrections."""
+            """Type in short bursts with realistic human behavior: random delays, typos, corrections."""
             typo_chars = 'abcdefghijklmnopqrstuvwxyz0123456789'
-            text_list = list(text)
             i = 0
             
-            while i < len(text_list):
-                char = text_list[i]
+            while i < len(text):
+                # One type() call per burst; Playwright still emits a keystroke per character
+                chunk = text[i:i + random.randint(5, 15)]
                 delay = random.randint(30, 120)
+                typo_at = random.randrange(len(chunk))
                 
-                # Occasionally make a typo (5% chance)
-                if random.random() < 0.05 and char.lower() in typo_chars:
+                # Occasionally make a typo inside the burst
+                if random.random() < 0.3 and chunk[typo_at].lower() in typo_chars:
+                    if typo_at:
+                        element.type(chunk[:typo_at], delay=delay)
                     # Type wrong character
-                    wrong_char = random.choice(typo_chars)
-                    element.type(wrong_char, delay=delay)
+                    element.type(random.choice(typo_chars), delay=delay)
                     page.wait_for_timeout(random.randint(100, 300))
                     # Backspace to correct
                     element.press('Backspace')
                     page.wait_for_timeout(random.randint(50, 150))
-                    # Type correct character
-                    element.type(char, delay=delay)
+                    # Type the rest of the burst correctly
+                    element.type(chunk[typo_at:], delay=delay)
                 else:
                     # Type normally
-                    element.type(char, delay=delay)
+                    element.type(chunk, delay=delay)
                 
-                # Mid-word pause
-                if i > 0 and i % random.randint(4, 8) == 0 and random.random() < 0.25:
+                # Mid-word pause between bursts
+                if random.random() < 0.25:
                     page.wait_for_timeout(random.randint(200, 600))
                 
-                i += 1
+                i += len(chunk)
 
+        # Per-field logs are DEBUG; skip building value previews unless they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         i = 0
-        while i < len(field_indices):
-            idx = field_indices[i]
+        while primary or deferred:
+            in_primary_pass = bool(primary)
+            idx = primary.popleft() if in_primary_pass else deferred.popleft()
+            i += 1
             field = form_fields[idx]
             field_path = field['path']
             field_title = field['title']
             field_type = field['type']
             value = filled_data.get(field_path)
 
-            logger.info(f"      � {field_title} ({field_type})")
+            logger.debug(f"      � {field_title} ({field_type})")
 
             if value is None:
                 logger.warning(f"         ⏭️  Skipped (no value)")
                 skipped_count += 1
-                i += 1
                 continue
 
-            if len(str(value)) > 80:
-                logger.info(f"         � Value: {str(value)[:77]}...")
-            else:
-                logger.info(f"         💬 Value: {value}")
+            if debug_enabled:
+                if len(str(value)) > 80:
+                    logger.debug(f"         � Value: {str(value)[:77]}...")
+                else:
+                    logger.debug(f"         💬 Value: {value}")
 
             try:
-                element = self._find_form_element(page, field, field_path, field_title, field_type)
+                element = self._find_form_element(page, state, field, field_path, field_title, field_type)
                 if element and element.count() > 0:
                     simulate_mouse_hover_and_scroll()
                     focus_and_blur(element)
                     # Randomly skip and return to this field
-                    if random.random() < skip_chance and idx not in skipped_fields:
-                        logger.info(f"         ⏭️  Simulating human skip, will return later...")
-                        skipped_fields.append(idx)
-                        field_indices.append(idx)
-                        i += 1
+                    if in_primary_pass and idx not in already_deferred and random.random() < skip_chance:
+                        logger.debug(f"         ⏭️  Simulating human skip, will return later...")
+                        already_deferred.add(idx)
+                        deferred.append(idx)
                         continue
                     if field_type == 'File':
-                        self._fill_file_field(element, resume_path, field_title)
+                        # File fields carry {'__file__': path}; fall back to the resume passed in
+                        file_path = value.get('__file__', resume_path) if isinstance(value, dict) else resume_path
+                        self._fill_file_field(element, file_path, field_title)
                         filled_count += 1
                     elif field_type == 'Boolean':
                         boolean_yes_clicks, boolean_no_clicks = self._fill_boolean_field(
@@ -584,16 +1281,12 @@ class BrowserService:
                         time.sleep(0.1)
                         human_type(element, str(value))
                         time.sleep(random.uniform(0.3, 0.7))
-                        filled_value = element.input_value()
-                        expected_length = len(str(value))
-                        actual_length = len(filled_value) if filled_value else 0
-                        if actual_length >= expected_length - 10:
-                            logger.info(f"      ✅ Filled: {field_title} ({actual_length}/{expected_length} chars)")
-                        else:
-                            logger.warning(f"      ⚠️  Incomplete fill: {field_title} ({actual_length}/{expected_length} chars)")
+                        field_id = self._tag_element(state, element, field_path, idx)
+                        if field_id is not None:
+                            text_fills.append((field_id, field_title, len(str(value))))
                         filled_count += 1
                     else:
-                        self._fill_text_field(element, value, field_title)
+                        self._fill_text_field(element, value, field_title, state.humanize)
                         filled_count += 1
                     
                     # Context-aware pause: longer for complex fields, shorter for simple
@@ -601,8 +1294,8 @@ class BrowserService:
                     page.wait_for_timeout(pause_time)
                     
                     # Occasionally scroll back up to review (simulate re-reading)
-                    if random.random() < 0.15 and i > 3:
-                        logger.info(f"         🔄 Simulating re-reading behavior...")
+                    if random.random() < 0.15 and i > 4:
+                        logger.debug(f"         🔄 Simulating re-reading behavior...")
                         current_scroll = page.evaluate("window.scrollY")
                         scroll_back = random.randint(200, 600)
                         page.evaluate(f"window.scrollTo(0, {max(0, current_scroll - scroll_back)})")
@@ -615,7 +1308,8 @@ class BrowserService:
             except Exception as e:
                 logger.error(f"         ❌ Error: {str(e)[:80]}")
                 error_count += 1
-            i += 1
+
+        self._verify_text_fills(page, text_fills)
 
         # Summary
         logger.info(f"\n   📊 Field filling summary:")
@@ -645,7 +1339,7 @@ class BrowserService:
             base_pause = 700
         else:
             # Text fields: longer for complex questions
-            if any(word in field_title.lower() for word in ['experience', 'why', 'describe', 'explain']):
+            if _COMPLEX_KW_RE.search(field_title):
                 base_pause = 1000
             elif len(value) > 100:
                 base_pause = 600
@@ -655,163 +1349,298 @@ class BrowserService:
         return max(200, base_pause + variance)
     
     
-    def _find_form_element(self, page, field: Dict, field_path: str, field_title: str, field_type: str):
+    def _precompute_field_map(self, page, form_fields: List[Dict]) -> Dict[str, str]:
+        """Resolve all field selectors in a single page.evaluate and tag the matches."""
+        descriptors = [
+            {
+                'path': field['path'],
+                'selectors': list(_build_selectors(field['type'], field['path'] or "", field['title'])),
+            }
+            for field in form_fields
+            if field.get('path')
+        ]
+        try:
+            return page.evaluate(_FIELD_MAP_JS, descriptors)
+        except Exception as e:
+            logger.warning(f"   ⚠️  Could not pre-resolve fields: {str(e)[:80]}")
+            return {}
+    
+    def _tag_element(self, state: _FillState, element, field_path: str, idx: int) -> Optional[str]:
+        """
+        Ensure an element carries a data-alphajob-id tag so it can be read back in batch.
+        
+        Args:
+            state: Fill state of the current page
+            element: Playwright locator for the field
+            field_path: Field path used as the key in the field map
+            idx: Field index, used to build a fresh id for untagged elements
+            
+        Returns:
+            The element's tag id, or None if it could not be tagged
+        """
+        field_id = state.field_map.get(field_path)
+        if field_id is not None:
+            return field_id
+        try:
+            field_id = element.evaluate(
+                "(el, id) => { const cur = el.getAttribute('data-alphajob-id') ?? id; "
+                "el.setAttribute('data-alphajob-id', cur); return cur; }",
+                f"f{idx}"
+            )
+        except Exception:
+            return None
+        state.field_map[field_path] = field_id
+        return field_id
+    
+    def _verify_text_fills(self, page, text_fills: List[Tuple[str, str, int]]):
+        """
+        Check the typed length of every text field with a single page.evaluate.
+        
+        Args:
+            page: Playwright page object
+            text_fills: (field id, field title, expected length) tuples
+        """
+        if not text_fills:
+            return
+        try:
+            lengths = page.evaluate(_VALUE_LENGTHS_JS, [field_id for field_id, _, _ in text_fills])
+        except Exception as e:
+            logger.warning(f"   ⚠️  Could not verify text fills: {str(e)[:80]}")
+            return
+        for (_, field_title, expected_length), actual_length in zip(text_fills, lengths):
+            if actual_length >= expected_length - 10:
+                logger.debug(f"      ✅ Filled: {field_title} ({actual_length}/{expected_length} chars)")
+            else:
+                logger.warning(f"      ⚠️  Incomplete fill: {field_title} ({actual_length}/{expected_length} chars)")
+    
+    def _build_label_index(self, page, state: _FillState):
+        """Index all labels on the page (text -> tagged control) into the fill state with one page.evaluate."""
+        try:
+            entries = page.evaluate(_LABEL_INDEX_JS)
+        except Exception as e:
+            logger.warning(f"   ⚠️  Could not index labels: {str(e)[:80]}")
+            entries = []
+        state.label_index = [(text, target) for text, target in entries if text and target]
+        state.label_exact = {}
+        for text, target in state.label_index:
+            state.label_exact.setdefault(text, target)
+    
+    def _label_target(self, state: _FillState, field_title: str) -> Optional[str]:
+        """
+        Find the control id for a field title in the label index.
+        
+        Args:
+            state: Fill state of the current page
+            field_title: Field title as shown on the form
+            
+        Returns:
+            Tagged control id for an exact label match, else for the shortest
+            label containing the title, else None
+        """
+        title = field_title.strip().lower()
+        if not title:
+            return None
+        target = state.label_exact.get(title)
+        if target is not None:
+            return target
+        best = None
+        for text, candidate in state.label_index:
+            if title in text and (best is None or len(text) < len(best[0])):
+                best = (text, candidate)
+        return best[1] if best else None
+    
+    def _best_label(self, state: _FillState, field_title: str) -> Optional[str]:
+        """
+        Find the label closest to a field title by edit distance.
+        
+        Args:
+            state: Fill state of the current page
+            field_title: Field title as shown on the form
+            
+        Returns:
+            Tagged control id of the best label within max(2, len/4) edits, or None
+        """
+        title = field_title.strip().lower()
+        if not title or not state.label_index:
+            return None
+        threshold = max(2, len(title) // 4)
+        match = best_match(title, (text for text, _ in state.label_index), threshold)
+        return state.label_index[match[0]][1] if match else None
+    
+    def _cached_locator(self, page, state: _FillState, selector: str):
+        """
+        Return (locator, count) for a selector, reusing matches found earlier in this fill.
+        
+        Only non-empty matches are cached, so fields that appear later are still found.
+        
+        Args:
+            page: Playwright page object
+            state: Fill state of the current page
+            selector: Playwright selector string
+            
+        Returns:
+            Tuple of (locator, match count)
+        """
+        cached = state.locator_cache.get(selector)
+        if cached is not None:
+            return cached
+        locator = page.locator(selector)
+        count = locator.count()
+        if count > 0:
+            state.locator_cache[selector] = (locator, count)
+        return locator, count
+    
+    def _locate_text_match(self, page, state: _FillState, field_title: str):
+        """
+        Find the first form field following a field title's text.
+        
+        The first call per fill scans the DOM once for all form titles; later
+        calls reuse that result.
+        
+        Args:
+            page: Playwright page object
+            state: Fill state of the current page
+            field_title: Field title as shown on the form
+            
+        Returns:
+            Locator for the matched element, or None
+        """
+        if state.text_matches is None:
+            titles = list(dict.fromkeys(title.lower() for title in state.form_titles))
+            try:
+                state.text_matches = page.evaluate(_TEXT_SCAN_JS, titles)
+            except Exception as e:
+                logger.warning(f"   ⚠️  Text scan failed: {str(e)[:80]}")
+                state.text_matches = {}
+        
+        match_id = state.text_matches.get(field_title.lower())
+        if match_id is None:
+            return None
+        locator = page.locator(f'[data-alphajob-id="{match_id}"]')
+        return locator.first if locator.count() > 0 else None
+    
+    def _find_form_element(self, page, state: _FillState, field: Dict, field_path: str, field_title: str, field_type: str):
         """Find form element using multiple robust strategies to combat masked/randomized classes."""
         element = None
         
+        # Fast path: element tagged by _precompute_field_map
+        field_id = state.field_map.get(field_path)
+        if field_id is not None:
+            tagged = page.locator(f'[data-alphajob-id="{field_id}"]')
+            if tagged.count() > 0:
+                return tagged.first
+        
+        # Label index: plain dict/substring lookup, no DOM query until a hit is resolved
+        label_target = self._label_target(state, field_title)
+        if label_target is not None:
+            tagged = page.locator(f'[data-alphajob-id="{label_target}"]')
+            if tagged.count() > 0:
+                logger.debug(f"         ✓ Found via label index")
+                return tagged.first
+        
         # Build selectors based on field type
-        if field_type == 'File':
-            selectors = [
-                'input[type="file"]',
-                '[data-testid*="resume"]',
-                '[data-testid*="upload"]',
-                'button:has-text("Upload") + input[type="file"]'
-            ]
-        elif field_type == 'Boolean':
-            selectors = [
-                f'input[type="checkbox"][name="{field_path.lower()}"]',
-                f'input[type="checkbox"][name="{field_path}"]',
-                f'input[type="checkbox"][id*="{field_path.lower()}"]',
-            ]
-        elif field_type == 'Location':
-            selectors = [
-                'input[placeholder="Start typing..."]',
-                'input[placeholder*="Start typing" i]',
-                'input[placeholder*="location" i]',
-                'input[placeholder*="city" i]',
-                'input[aria-label*="location" i]',
-                f'[id="{field_path.lower()}"]' if field_path else None,
-                f'[name="{field_path.lower()}"]' if field_path else None,
-            ]
-            selectors = [s for s in selectors if s]
-        else:
-            selectors = [
-                f'input[placeholder*="{field_title}" i]',
-                f'textarea[placeholder*="{field_title}" i]',
-                f'input[aria-label*="{field_title}" i]',
-                f'textarea[aria-label*="{field_title}" i]',
-            ]
-            
-            if field_path:
-                selectors.extend([
-                    f'[id="{field_path.lower()}"]',
-                    f'[name="{field_path.lower()}"]',
-                    f'[id="{field_path}"]',
-                    f'[name="{field_path}"]',
-                ])
-        
-        # Try each selector
-        for selector in selectors:
+        selectors = _build_selectors(field_type, field_path or "", field_title)
+        
+        # Count every CSS selector in one evaluate; only Playwright-only selectors need their own query
+        try:
+            counts = page.evaluate(_SELECTOR_COUNTS_JS, list(selectors))
+        except Exception:
+            counts = [-1] * len(selectors)
+        
+        # Try each selector in priority order
+        for selector, count in zip(selectors, counts):
             try:
-                count = page.locator(selector).count()
+                if count < 0:
+                    locator, count = self._cached_locator(page, state, selector)
+                else:
+                    locator = page.locator(selector)
                 if count > 0:
-                    logger.info(f"         ✓ Found with selector: {selector} (count: {count})")
-                    element = page.locator(selector).first
+                    logger.debug(f"         ✓ Found with selector: {selector} (count: {count})")
+                    element = locator.first
                     break
-            except:
+            except PlaywrightError:
                 continue
         
         # Enhanced fallback strategies for masked/randomized elements
         if not element:
             # Strategy 1: Label-based with nearby input
             try:
-                labels = page.locator(f'text="{field_title}" >> xpath=..')
-                if labels.count() > 0:
-                    parent = labels.first
-                    nearby_inputs = parent.locator('input, textarea, select')
+                labels, label_count = self._cached_locator(page, state, f'text="{field_title}" >> xpath=..')
+                if label_count > 0:
+                    nearby_inputs = labels.first.locator('input, textarea, select')
                     if nearby_inputs.count() > 0:
                         element = nearby_inputs.first
-                        logger.info(f"         ✓ Found via label strategy")
-            except:
+                        logger.debug(f"         ✓ Found via label strategy")
+            except PlaywrightError:
                 pass
         
         if not element:
-            # Strategy 2: Fuzzy text matching with XPath
-            try:
-                # Try to find label with similar text (case-insensitive, partial match)
-                field_title_lower = field_title.lower()
-                field_title_words = field_title_lower.split()
-                for word in field_title_words:
-                    if len(word) > 3:  # Only use meaningful words
-                        xpath = f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{word}')]"
-                        labels = page.locator(f'xpath={xpath}')
-                        if labels.count() > 0:
-                            label = labels.first
-                            # Try to get associated input via 'for' attribute
-                            label_for = label.get_attribute('for')
-                            if label_for:
-                                input_by_id = page.locator(f'#{label_for}')
-                                if input_by_id.count() > 0:
-                                    element = input_by_id.first
-                                    logger.info(f"         ✓ Found via fuzzy label-for: '{word}'")
-                                    break
-                            # Or find nearby input
-                            parent = label.locator('xpath=..')
-                            nearby = parent.locator('input, textarea, select')
-                            if nearby.count() > 0:
-                                element = nearby.first
-                                logger.info(f"         ✓ Found via fuzzy label nearby: '{word}'")
-                                break
-            except:
-                pass
+            # Strategy 2: Closest label by bounded edit distance over the label index
+            label_target = self._best_label(state, field_title)
+            if label_target is not None:
+                tagged = page.locator(f'[data-alphajob-id="{label_target}"]')
+                if tagged.count() > 0:
+                    element = tagged.first
+                    logger.debug(f"         ✓ Found via fuzzy label match")
         
-        if not element:
-            # Strategy 3: XPath by input type and position
+        if not element and field_type in ('Text', 'Input', 'Textarea'):
+            # Strategy 3: Input whose parent's text mentions the title, scanned in one evaluate
+            selector = 'textarea' if field_type == 'Textarea' else 'input[type="text"], input:not([type])'
             try:
-                if field_type in ['Text', 'Input']:
-                    # Find all text inputs and try to match by context
-                    all_inputs = page.locator('xpath=//input[@type="text" or not(@type)]').all()
-                    for inp in all_inputs:
-                        # Check if any nearby text contains our field title
-                        try:
-                            parent = inp.locator('xpath=..')
-                            parent_text = parent.inner_text().lower()
-                            if field_title.lower() in parent_text:
-                                element = inp
-                                logger.info(f"         ✓ Found via XPath context matching")
-                                break
-                        except:
-                            continue
-                elif field_type == 'Textarea':
-                    all_textareas = page.locator('xpath=//textarea').all()
-                    for ta in all_textareas:
-                        try:
-                            parent = ta.locator('xpath=..')
-                            parent_text = parent.inner_text().lower()
-                            if field_title.lower() in parent_text:
-                                element = ta
-                                logger.info(f"         ✓ Found textarea via XPath context")
-                                break
-                        except:
-                            continue
-            except:
+                match_id = page.evaluate(
+                    _PARENT_TEXT_MATCH_JS, [field_title.lower(), selector, f"p{field_path}"]
+                )
+                if match_id is not None:
+                    element = page.locator(f'[data-alphajob-id="{_css_string(match_id)}"]').first
+                    logger.debug(f"         ✓ Found via parent text context matching")
+            except PlaywrightError:
                 pass
         
         if not element:
-            # Strategy 4: Visual position - find by proximity to text
-            try:
-                # Find text node containing field title
-                text_nodes = page.locator(f'xpath=//*[contains(translate(text(), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{field_title.lower()}")][not(self::script)][not(self::style)]').all()
-                for text_node in text_nodes:
-                    try:
-                        # Find first input after this text node in DOM order
-                        following_inputs = text_node.locator('xpath=following::input[1] | following::textarea[1] | following::select[1]')
-                        if following_inputs.count() > 0:
-                            element = following_inputs.first
-                            logger.info(f"         ✓ Found via visual position (following element)")
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            # Strategy 4: Visual position - first field following the title text
+            element = self._locate_text_match(page, state, field_title)
+            if element:
+                logger.debug(f"         ✓ Found via visual position (following element)")
         
         return element
     
+    def _get_resume_payload(self, resume_path: str) -> Optional[Dict]:
+        """
+        Load a resume file once and return it as a set_input_files payload.
+        
+        Args:
+            resume_path: Path to the resume file
+            
+        Returns:
+            Dict with name, mimeType and buffer, or None if the file does not exist
+        """
+        path = Path(resume_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        # A rewritten file gets a new (mtime_ns, size) and so a fresh read
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._resume_lock:
+            cached = self._resume_cache.get(key)
+            if cached is None:
+                mime_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+                try:
+                    cached = (path.name, mime_type, path.read_bytes())
+                except OSError:
+                    return None
+                self._resume_cache[key] = cached
+        name, mime_type, data = cached
+        return {'name': name, 'mimeType': mime_type, 'buffer': data}
+    
     def _fill_file_field(self, element, resume_path: Optional[str], field_title: str):
         """Handle file upload."""
-        if resume_path and Path(resume_path).exists():
-            element.set_input_files(str(Path(resume_path).absolute()))
-            logger.info(f"      ✅ Uploaded: {field_title}")
+        if not resume_path:
+            return
+        payload = self._get_resume_payload(resume_path)
+        if payload:
+            element.set_input_files(payload)
+            logger.debug(f"      ✅ Uploaded: {field_title}")
     
     def _fill_boolean_field(self, page, element, value: bool, field_title: str, yes_clicks: int, no_clicks: int):
         """Handle checkbox/boolean fields."""
@@ -820,27 +1649,28 @@ class BrowserService:
         try:
             # Set checkbox value via JS
             element.evaluate(f'el => el.checked = {str(value).lower()}')
-            logger.info(f"      ✅ Set checkbox via JS: {field_title}")
+            logger.debug(f"      ✅ Set checkbox via JS: {field_title}")
             
             # Find and click the button
-            logger.info(f"         🔘 Looking for '{button_text}' button near this field...")
+            logger.debug(f"         🔘 Looking for '{button_text}' button near this field...")
             
             try:
                 # Get parent container
                 parent = element.locator('xpath=ancestor::div[contains(@class, "css-") or contains(@class, "field")]').first
                 button = parent.locator(f'button:has-text("{button_text}")').first
                 
+                # click() scrolls the button into view itself
                 if button.count() > 0:
-                    button.scroll_into_view_if_needed()
                     button.click(timeout=3000, force=True)
-                    logger.info(f"      ✅ Clicked '{button_text}' button: {field_title}")
+                    logger.debug(f"      ✅ Clicked '{button_text}' button: {field_title}")
                 else:
                     logger.warning(f"      ⚠️  '{button_text}' button not found in parent container")
-            except:
+            except PlaywrightError:
                 # Fallback: use global button index
                 logger.warning(f"         ⚠️  Parent strategy failed, using global index")
-                buttons = page.locator(f'button:has-text("{button_text}")').all()
-                logger.info(f"         📍 Found {len(buttons)} '{button_text}' buttons total")
+                buttons = page.locator(f'button:has-text("{button_text}")')
+                button_count = buttons.count()
+                logger.debug(f"         📍 Found {button_count} '{button_text}' buttons total")
                 
                 if button_text == "Yes":
                     button_index = yes_clicks
@@ -849,11 +1679,9 @@ class BrowserService:
                     button_index = no_clicks
                     no_clicks += 1
                 
-                if button_index < len(buttons):
-                    btn = buttons[button_index]
-                    btn.scroll_into_view_if_needed()
-                    btn.click(timeout=3000, force=True)
-                    logger.info(f"      ✅ Clicked '{button_text}' button #{button_index + 1}: {field_title}")
+                if button_index < button_count:
+                    buttons.nth(button_index).click(timeout=3000, force=True)
+                    logger.debug(f"      ✅ Clicked '{button_text}' button #{button_index + 1}: {field_title}")
         
         except Exception as e:
             logger.error(f"      ⚠️  Boolean error: {str(e)[:80]}")
@@ -863,40 +1691,37 @@ class BrowserService:
     def _fill_location_field(self, page, element, value: str, field_title: str):
         """Handle location autocomplete field."""
         try:
-            logger.info(f"         🔍 Location field found, preparing to type...")
-            element.scroll_into_view_if_needed()
-            
-            element.click()
-            logger.info(f"         ✓ Clicked location field")
-            
-            element.fill('')
-            logger.info(f"         ✓ Cleared field")
+            logger.debug(f"         🔍 Location field found, preparing to type...")
+            element.evaluate(_FOCUS_AND_CLEAR_JS)
+            logger.debug(f"         ✓ Focused and cleared location field")
             
             location_text = str(value)
-            logger.info(f"         📍 Typing location: '{location_text}'")
+            logger.debug(f"         📍 Typing location: '{location_text}'")
             
-            # Try multiple typing methods
+            # Try multiple typing methods; last_filled holds the most recent value read back
+            last_filled = None
             try:
                 element.press_sequentially(location_text, delay=random.randint(80, 120))
-                filled = element.input_value()
-                logger.info(f"         ✓ After press_sequentially: '{filled}' ({len(filled) if filled else 0} chars)")
+                last_filled = element.input_value()
+                logger.debug(f"         ✓ After press_sequentially: '{last_filled}' ({len(last_filled) if last_filled else 0} chars)")
                 
-                if not filled or len(filled) < 3:
+                if not last_filled or len(last_filled) < 3:
                     logger.warning(f"         ⚠️  press_sequentially didn't work, trying type()...")
                     element.fill('')
                     element.type(location_text, delay=100)
-                    filled = element.input_value()
-                    logger.info(f"         ✓ After type(): '{filled}' ({len(filled) if filled else 0} chars)")
+                    last_filled = element.input_value()
+                    logger.debug(f"         ✓ After type(): '{last_filled}' ({len(last_filled) if last_filled else 0} chars)")
                 
-                if not filled or len(filled) < 3:
+                if not last_filled or len(last_filled) < 3:
                     logger.warning(f"         ⚠️  type() didn't work, trying fill()...")
                     element.fill(location_text)
-                    filled = element.input_value()
-                    logger.info(f"         ✓ After fill(): '{filled}' ({len(filled) if filled else 0} chars)")
+                    # fill() sets the value directly, no need to read it back
+                    last_filled = location_text
             
             except Exception as type_error:
                 logger.warning(f"         ⚠️  Typing error: {str(type_error)[:100]}")
                 element.fill(location_text)
+                last_filled = location_text
             
             # Wait for autocomplete dropdown
             page.wait_for_timeout(800)
@@ -906,17 +1731,17 @@ class BrowserService:
                 autocomplete_option = page.locator('[role="option"]').first
                 if autocomplete_option.count() > 0:
                     autocomplete_option.click()
-                    logger.info(f"      ✅ Selected from autocomplete: {field_title}")
+                    logger.debug(f"      ✅ Selected from autocomplete: {field_title}")
                 else:
-                    filled = element.input_value()
+                    filled = last_filled
                     if filled and len(filled) > 0:
-                        logger.info(f"      ✅ Typed location: {field_title} ({len(filled)}/{len(location_text)} chars)")
+                        logger.debug(f"      ✅ Typed location: {field_title} ({len(filled)}/{len(location_text)} chars)")
                     else:
                         logger.warning(f"      ⚠️  Location field still empty after all attempts!")
             except Exception as e:
-                filled = element.input_value()
+                filled = last_filled
                 if filled:
-                    logger.info(f"      ✅ Typed location: {field_title} ({len(filled)} chars)")
+                    logger.debug(f"      ✅ Typed location: {field_title} ({len(filled)} chars)")
                 else:
                     logger.warning(f"      ⚠️  Location field empty!")
         
@@ -926,12 +1751,12 @@ class BrowserService:
     def _fill_select_field(self, page, element, value, field_type: str, field_title: str):
         """Handle ValueSelect and MultiValueSelect fields."""
         try:
-            logger.info(f"         🔍 DEBUG: Processing {field_type} field: {field_title}")
+            logger.debug(f"         🔍 DEBUG: Processing {field_type} field: {field_title}")
             element.scroll_into_view_if_needed()
             
             tag_name = element.evaluate('el => el.tagName')
             elem_type = element.evaluate('el => el.type') if tag_name.lower() == 'input' else None
-            logger.info(f"         📄 Element: <{tag_name}> type={elem_type}")
+            logger.debug(f"         📄 Element: <{tag_name}> type={elem_type}")
             
             if elem_type == 'radio':
                 self._handle_radio_buttons(page, element, value, field_title)
@@ -946,111 +1771,94 @@ class BrowserService:
     
     def _handle_radio_buttons(self, page, element, value: str, field_title: str):
         """Handle radio button selection."""
-        logger.info(f"         🔘 This is a radio button input")
-        
-        field_container = element.locator('xpath=ancestor::fieldset').first
-        if field_container.count() == 0:
-            field_container = element.locator('xpath=ancestor::div[contains(@class, "fieldEntry")]').first
-        
-        if field_container.count() > 0:
-            all_labels = field_container.locator('label').all()
-            logger.info(f"         🎯 Available radio options ({len(all_labels)}):")
-            for idx, lbl in enumerate(all_labels):
-                lbl_text = lbl.inner_text()
-                logger.info(f"            [{idx}] '{lbl_text}'")
+        logger.debug(f"         🔘 This is a radio button input")
+        
+        group = element.evaluate(_OPTION_GROUP_JS)
+        
+        if group:
+            label_texts = group['labels']
+            logger.debug(f"         🎯 Available radio options ({len(label_texts)}):")
+            for idx, lbl_text in enumerate(label_texts):
+                logger.debug(f"            [{idx}] '{lbl_text}'")
             
             value_str = str(value)
-            logger.info(f"         🎯 Looking for: '{value_str}'")
+            logger.debug(f"         🎯 Looking for: '{value_str}'")
             
-            found = False
-            for lbl in all_labels:
-                lbl_text = lbl.inner_text().strip()
-                if lbl_text.lower() == value_str.lower():
-                    logger.info(f"         ✓ Found match: '{lbl_text}' (clicking...)")
-                    lbl.click()
-                    logger.info(f"      ✅ Selected radio: {value_str}")
-                    found = True
-                    break
+            # Lowercase each side once, then let list.index do the scan
+            labels_lower = [lbl_text.lower() for lbl_text in label_texts]
+            try:
+                idx = labels_lower.index(value_str.strip().lower())
+            except ValueError:
+                idx = -1
             
-            if not found:
+            if idx >= 0:
+                logger.debug(f"         ✓ Found match: '{label_texts[idx]}' (clicking...)")
+                self._group_locator(page, group, 'label').nth(idx).click()
+                logger.debug(f"      ✅ Selected radio: {value_str}")
+            else:
                 logger.warning(f"      ⚠️  Could not find radio option: {value_str}")
-                logger.info(f"      🔍 Available were: {[l.inner_text().strip() for l in all_labels]}")
+                logger.debug(f"      🔍 Available were: {label_texts}")
         else:
             logger.warning(f"      ⚠️  Could not find container for radio buttons")
     
     def _handle_checkboxes(self, page, element, value, field_title: str):
         """Handle checkbox selection."""
-        logger.info(f"         ☑️  This is a checkbox input")
-        
-        field_container = element.locator('xpath=ancestor::fieldset').first
-        if field_container.count() == 0:
-            field_container = element.locator('xpath=ancestor::div[contains(@class, "fieldEntry")]').first
-        
-        if field_container.count() > 0:
-            all_labels = field_container.locator('label').all()
-            logger.info(f"         📋 Available checkbox options ({len(all_labels)}):")
-            for idx, lbl in enumerate(all_labels):
-                lbl_text = lbl.inner_text()
-                logger.info(f"            [{idx}] '{lbl_text}'")
-            
-            if isinstance(value, list):
-                values_to_select = value
-            else:
-                values_to_select = [value]
-            
-            logger.info(f"         🎯 Need to select: {values_to_select}")
-            
-            # Uncheck all first
-            all_checkboxes = field_container.locator('input[type="checkbox"]').all()
-            logger.info(f"         🔄 Unchecking all {len(all_checkboxes)} checkboxes...")
-            for idx, cb in enumerate(all_checkboxes):
-                if cb.is_checked():
-                    logger.info(f"            [{idx}] Unchecking...")
-                    cb.uncheck()
+        logger.debug(f"         ☑️  This is a checkbox input")
+        
+        if isinstance(value, list):
+            values_to_select = value
+        else:
+            values_to_select = [value]
+        
+        logger.debug(f"         🎯 Need to select: {values_to_select}")
+        
+        # Uncheck everything else and check the selected ones in a single pass
+        result = element.evaluate(_SYNC_CHECKBOXES_JS, [str(v).lower() for v in values_to_select])
+        
+        if result:
+            label_texts = result['labels']
+            logger.debug(f"         📋 Available checkbox options ({len(label_texts)}):")
+            for idx, lbl_text in enumerate(label_texts):
+                logger.debug(f"            [{idx}] '{lbl_text}'")
             
-            # Check selected ones
+            matched = set(result['matched'])
             for v in values_to_select:
-                logger.info(f"         🔍 Looking for: '{v}'")
-                found = False
-                for lbl in all_labels:
-                    lbl_text = lbl.inner_text().strip()
-                    if lbl_text.lower() == v.lower():
-                        logger.info(f"         ✓ Found match: '{lbl_text}' (clicking...)")
-                        lbl.click()
-                        found = True
-                        break
-                if found:
-                    logger.info(f"         ✅ Checked: {v}")
+                if str(v).lower() in matched:
+                    logger.debug(f"         ✅ Checked: {v}")
                 else:
                     logger.warning(f"         ⚠️  Not found: {v}")
-                    logger.info(f"         🔍 Available options were: {[l.inner_text().strip() for l in all_labels]}")
+                    logger.debug(f"         🔍 Available options were: {label_texts}")
             
-            logger.info(f"      ✅ Selected checkboxes: {', '.join(values_to_select)}")
+            logger.debug(f"      ✅ Selected checkboxes: {', '.join(map(str, values_to_select))}")
         else:
             logger.warning(f"      ⚠️  Could not find container for checkboxes")
     
+    def _group_locator(self, page, group: Dict, selector: str):
+        """Locate elements inside an option group tagged by _OPTION_GROUP_JS."""
+        return page.locator(f'[data-alphajob-group="{group["group"]}"] {selector}')
+    
     def _handle_dropdown(self, page, element, value, field_title: str):
         """Handle regular dropdown selection."""
-        logger.info(f"         🔽 This is a dropdown/combobox")
+        logger.debug(f"         🔽 This is a dropdown/combobox")
         element.click()
-        logger.info(f"         ✓ Clicked dropdown")
+        logger.debug(f"         ✓ Clicked dropdown")
         
         if isinstance(value, list):
             # Multi-select dropdown
             for v in value:
-                logger.info(f"         📝 Typing to filter: {v}")
+                logger.debug(f"         📝 Typing to filter: {v}")
                 element.type(str(v), delay=50)
                 try:
                     option = page.locator(f'[role="option"]:has-text("{v}")').first
                     if option.count() > 0:
                         option.click()
-                        logger.info(f"         ✓ Selected: {v}")
-                except:
+                        logger.debug(f"         ✓ Selected: {v}")
+                except PlaywrightError:
                     logger.warning(f"         ⚠️  Could not select: {v}")
         else:
             # Single select dropdown
             value_str = str(value)
-            logger.info(f"         📝 Typing to filter: {value_str}")
+            logger.debug(f"         📝 Typing to filter: {value_str}")
             element.type(value_str, delay=50)
             
             try:
@@ -1058,67 +1866,67 @@ class BrowserService:
                 option = page.locator(f'[role="option"]:has-text("{value_str}")').first
                 if option.count() > 0:
                     option.click()
-                    logger.info(f"      ✅ Selected: {value_str}")
+                    logger.debug(f"      ✅ Selected: {value_str}")
                 else:
                     element.press('Enter')
-                    logger.info(f"      ✅ Selected first option (pressed Enter)")
+                    logger.debug(f"      ✅ Selected first option (pressed Enter)")
             except Exception as e:
                 try:
                     option = page.locator('[role="option"]').first
                     if option.count() > 0:
                         option.click()
-                        logger.info(f"      ✅ Selected first visible option")
+                        logger.debug(f"      ✅ Selected first visible option")
                     else:
                         logger.warning(f"      ⚠️  No options found for: {value_str}")
-                except:
+                except PlaywrightError:
                     logger.warning(f"      ⚠️  Could not select any option")
     
-    def _fill_text_field(self, element, value: str, field_title: str):
-        """Handle text input fields."""
-        element.scroll_into_view_if_needed()
-        time.sleep(random.uniform(0.2, 0.5))
-        element.click()
-        time.sleep(random.uniform(0.3, 0.6))
-        
-        element.fill('')
-        time.sleep(0.1)
+    def _fill_text_field(self, element, value: str, field_title: str, humanize: bool = False):
+        """Handle text input fields (with pauses around typing when humanize is set)."""
+        if humanize:
+            time.sleep(random.uniform(0.2, 0.5))
+        element.evaluate(_FOCUS_AND_CLEAR_JS)
         
         text_to_type = str(value)
         
-        # For longer text, use fill() then verify
+        # Length read back from the field; None means it changed since the last read
+        filled_length = None
+        
+        # For longer text, use fill() then wait in the browser until the value lands
         if len(text_to_type) > 200:
             element.fill(text_to_type)
-            time.sleep(random.uniform(0.5, 1))
             
-            filled_value = element.input_value()
-            if len(filled_value) < len(text_to_type) - 10:
-                logger.warning(f"      ⚠️  Only filled {len(filled_value)}/{len(text_to_type)} chars, retrying...")
+            filled_length = element.evaluate(_WAIT_FOR_LENGTH_JS, [len(text_to_type), 3000])
+            if filled_length < len(text_to_type) - 10:
+                logger.warning(f"      ⚠️  Only filled {filled_length}/{len(text_to_type)} chars, retrying...")
                 element.fill('')
-                time.sleep(0.2)
                 # Type in chunks
                 chunk_size = 100
                 for i in range(0, len(text_to_type), chunk_size):
                     chunk = text_to_type[i:i+chunk_size]
                     element.type(chunk, delay=5)
-                    time.sleep(0.1)
+                filled_length = None
         else:
             element.type(text_to_type, delay=random.randint(20, 50))
         
-        time.sleep(random.uniform(0.3, 0.7))
+        if humanize:
+            time.sleep(random.uniform(0.3, 0.7))
         
-        # Final verification
-        filled_value = element.input_value()
+        # Final verification (reuses the earlier read when nothing was typed since)
         expected_length = len(text_to_type)
-        actual_length = len(filled_value) if filled_value else 0
+        if filled_length is not None:
+            actual_length = filled_length
+        else:
+            filled_value = element.input_value()
+            actual_length = len(filled_value) if filled_value else 0
         
         if actual_length >= expected_length - 10:
-            logger.info(f"      ✅ Filled: {field_title} ({actual_length}/{expected_length} chars)")
+            logger.debug(f"      ✅ Filled: {field_title} ({actual_length}/{expected_length} chars)")
         else:
             logger.warning(f"      ⚠️  Incomplete fill: {field_title} ({actual_length}/{expected_length} chars)")
-            logger.info(f"         Trying one more time with press_sequentially...")
+            logger.debug(f"         Trying one more time with press_sequentially...")
             element.click()
             element.press_sequentially(text_to_type, delay=10)
-            time.sleep(0.5)
     
     def _fill_eeo_fields(self, page):
         """Fill additional EEO fields (Gender, Race, Veteran status)."""
@@ -1143,42 +1951,31 @@ class BrowserService:
                 logger.info(f"   📋 Found Gender identity field")
                 gender_heading.scroll_into_view_if_needed()
 
-                # Find all radio inputs after the heading in the DOM
-                radio_inputs = gender_heading.locator('xpath=following::input[@type="radio"]').all()
-                logger.info(f"   🔍 (Fixed) Found {len(radio_inputs)} radio inputs after heading")
+                # Collect all radio inputs after the heading and their labels in one call
+                radio_options = gender_heading.evaluate(_FOLLOWING_RADIOS_JS)
+                logger.info(f"   🔍 (Fixed) Found {len(radio_options)} radio inputs after heading")
 
                 # Log all radio labels for debugging
-                for idx, radio in enumerate(radio_inputs):
-                    input_id = radio.get_attribute('id')
-                    label = page.locator(f'label[for="{input_id}"]').first if input_id else None
-                    label_text = label.inner_text() if label and label.count() > 0 else "(no label)"
-                    logger.info(f"      [{idx}] id={input_id} label={label_text}")
+                for idx, option in enumerate(radio_options):
+                    label_text = option['text'] if option['text'] is not None else "(no label)"
+                    logger.info(f"      [{idx}] id={option['id']} label={label_text}")
 
                 # Now select the correct radio based on gender_value (fuzzy match)
                 gender_value_lower = gender_value.strip().lower()
                 
-                # Gender mappings for common variations
-                gender_mappings = {
-                    'man': ['male', 'man'],
-                    'male': ['male', 'man'],
-                    'woman': ['female', 'woman'],
-                    'female': ['female', 'woman'],
-                    'non-binary': ['non-binary', 'nonbinary', 'non binary'],
-                    'prefer not to say': ['decline', 'prefer not', 'rather not'],
-                }
-                
                 # Get possible matches for the user's gender value
-                possible_matches = gender_mappings.get(gender_value_lower, [gender_value_lower])
+                possible_matches = _GENDER_MATCHES.get(gender_value_lower, (gender_value_lower,))
                 
                 found = False
-                for radio in radio_inputs:
-                    input_id = radio.get_attribute('id')
-                    label = page.locator(f'label[for="{input_id}"]').first if input_id else None
-                    label_text = label.inner_text().strip() if label and label.count() > 0 else ""
+                for option in radio_options:
+                    if not option['id'] or option['text'] is None:
+                        continue
+                    label_text = option['text'].strip()
                     label_text_lower = label_text.lower()
                     
                     # Check if label matches any possible variation
                     if any(match in label_text_lower for match in possible_matches):
+                        label = page.locator(f'label[for="{_css_string(option["id"])}"]').first
                         label.scroll_into_view_if_needed()
                         time.sleep(0.3)
                         label.click()
@@ -1200,21 +1997,22 @@ class BrowserService:
                 logger.info(f"   📋 Found Race identity field")
                 race_heading.scroll_into_view_if_needed()
                 
-                # Find all radio inputs after the heading
-                radio_inputs = race_heading.locator('xpath=following::input[@type="radio"]').all()
+                # Collect all radio inputs after the heading and their labels in one call
+                radio_options = race_heading.evaluate(_FOLLOWING_RADIOS_JS)
                 
                 # Race value matching
                 race_value_lower = race_value.strip().lower()
                 
                 found = False
-                for radio in radio_inputs:
-                    input_id = radio.get_attribute('id')
-                    label = page.locator(f'label[for="{input_id}"]').first if input_id else None
-                    label_text = label.inner_text().strip() if label and label.count() > 0 else ""
+                for option in radio_options:
+                    if not option['id'] or option['text'] is None:
+                        continue
+                    label_text = option['text'].strip()
                     label_text_lower = label_text.lower()
                     
                     # Check if the race value matches the label
                     if race_value_lower in label_text_lower or label_text_lower in race_value_lower:
+                        label = page.locator(f'label[for="{_css_string(option["id"])}"]').first
                         label.scroll_into_view_if_needed()
                         time.sleep(0.3)
                         label.click()
@@ -1236,28 +2034,23 @@ class BrowserService:
                 logger.info(f"   📋 Found Veteran status field")
                 veteran_heading.scroll_into_view_if_needed()
                 
-                # Find all radio inputs after the heading
-                radio_inputs = veteran_heading.locator('xpath=following::input[@type="radio"]').all()
+                # Collect all radio inputs after the heading and their labels in one call
+                radio_options = veteran_heading.evaluate(_FOLLOWING_RADIOS_JS)
                 
                 # Veteran status mappings
                 veteran_value_lower = veteran_value.strip().lower()
-                veteran_mappings = {
-                    'no': ['not a veteran', 'not a protected veteran', 'i am not'],
-                    'yes': ['i am a veteran', 'protected veteran', 'i identify as'],
-                    'decline': ['decline', 'prefer not', 'rather not'],
-                }
-                
-                possible_matches = veteran_mappings.get(veteran_value_lower, [veteran_value_lower])
+                possible_matches = _VETERAN_MATCHES.get(veteran_value_lower, (veteran_value_lower,))
                 
                 found = False
-                for radio in radio_inputs:
-                    input_id = radio.get_attribute('id')
-                    label = page.locator(f'label[for="{input_id}"]').first if input_id else None
-                    label_text = label.inner_text().strip() if label and label.count() > 0 else ""
+                for option in radio_options:
+                    if not option['id'] or option['text'] is None:
+                        continue
+                    label_text = option['text'].strip()
                     label_text_lower = label_text.lower()
                     
                     # Check if label matches any possible variation
                     if any(match in label_text_lower for match in possible_matches):
+                        label = page.locator(f'label[for="{_css_string(option["id"])}"]').first
                         label.scroll_into_view_if_needed()
                         time.sleep(0.3)
                         label.click()
@@ -1286,19 +2079,45 @@ class BrowserService:
         logger.info(f"   ⏸️  Press ENTER after you've submitted to close browser...")
         logger.info(f"   " + "="*70 + "\n")
         input()
-        logger.info(f"   ✅ Closing browser...")
-        browser_context.close()
-        browser.close()
+        logger.info(f"   ✅ Closing page...")
         return {
             'success': True,
             'status': 'manual_submit',
             'message': 'Form filled, human submitted manually'
         }
     
-    def _auto_submit(self, page, browser_context, browser) -> Dict:
-        """Handle automatic submission workflow."""
+    def _site_bot_risk(self, page) -> float:
+        """
+        Return the bot-detection risk for the page's site, checking for a CAPTCHA once per site.
+        
+        Args:
+            page: Playwright page object
+            
+        Returns:
+            Risk score in [0, 1]
+        """
+        site = urlparse(page.url).netloc
+        risk = self._bot_risk.get(site)
+        if risk is None:
+            risk = 1.0 if self._detect_captcha(page) else 0.0
+            self._bot_risk[site] = risk
+            if risk:
+                logger.info(f"   🛡️  CAPTCHA detected on {site}, keeping full human simulation")
+        return risk
+    
+    def _detect_captcha(self, page) -> bool:
+        """Check whether the page contains a known CAPTCHA widget."""
+        try:
+            return page.evaluate(_CAPTCHA_CHECK_JS, _CAPTCHA_SELECTOR)
+        except PlaywrightError:
+            return False
+    
+    def _auto_submit(self, page, browser_context, browser, inspect: bool = True) -> Dict:
+        """Handle automatic submission workflow (keeping the browser open for inspection if inspect)."""
         logger.info(f"\n   ⏳ Looking for submit button...")
-        self._simulate_human_behavior(page)
+        # The extra pre-click simulation only pays off on sites with anti-bot checks
+        high_risk = self._site_bot_risk(page) >= _HIGH_BOT_RISK
+        self._simulate_human_behavior(page, trusted=high_risk)
         submit_selectors = [
             'button:has-text("Submit Application")',
             'button:has-text("Submit")',
@@ -1315,7 +2134,8 @@ class BrowserService:
                     logger.info(f"   🚀 Clicking submit button: {selector}")
                     button = page.locator(selector).first
                     button.scroll_into_view_if_needed()
-                    self._simulate_human_behavior(page)
+                    if high_risk:
+                        self._simulate_human_behavior(page, trusted=True)
                     button.click()
                     submitted = True
                     break
@@ -1329,17 +2149,21 @@ class BrowserService:
             post_submit_path = get_post_submit_screenshot_path()
             page.screenshot(path=str(post_submit_path))
             logger.info(f"   📸 Screenshot saved: {post_submit_path}")
-            # Check for success/error
-            page_content = page.content().lower()
-            if 'spam' in page_content or 'flagged' in page_content:
+            # Check for success/error (one regex pass, no lowercased copy of the page)
+            signals = {match.lower() for match in _SUBMIT_STATUS_RE.findall(page.content())}
+            if signals & _SPAM_SIGNALS:
                 logger.warning(f"\n   ⚠️  WARNING: Application may have been flagged as spam!")
-                # Dump HTML for debugging
-                logger.info(f"   ⚠️  Dumping page HTML for spam debug:")
-                logger.info(page.content()[:2000])
+                # Dump just the error block for debugging
+                logger.info(f"   ⚠️  Dumping error element HTML for spam debug:")
+                try:
+                    error_block = page.locator('[class*="error"], [class*="spam"], [role="alert"]').first
+                    logger.info(error_block.inner_html(timeout=1000)[:2000] if error_block.count() > 0 else '(no error element)')
+                except Exception as e:
+                    logger.info(f"   (could not read error element: {str(e)[:80]})")
                 status = 'flagged'
                 success = False
                 message = 'Application flagged as spam'
-            elif 'thank you' in page_content or 'submitted' in page_content or 'received' in page_content:
+            elif signals:
                 logger.info(f"\n   ✅ Application submitted successfully!")
                 status = 'submitted'
                 success = True
@@ -1354,6 +2178,13 @@ class BrowserService:
             status = 'failed'
             success = False
             message = 'Submit button not found'
+        if not inspect:
+            return {
+                'success': success,
+                'status': status,
+                'message': message
+            }
+        
         # Keep browser open for inspection (with timeout)
         logger.info(f"\n   ⏸️  Browser kept open for inspection...")
         logger.info(f"   ℹ️  Status: {status}")
@@ -1365,8 +2196,7 @@ class BrowserService:
         try:
             def handler(signum, frame):
                 logger.info(f"\n   🛑 Closing browser...")
-                browser_context.close()
-                browser.close()
+                self.close()
                 exit(0)
             signal.signal(signal.SIGINT, handler)
         except ValueError:
@@ -1384,18 +2214,41 @@ class BrowserService:
             'message': message
         }
     
-    def _simulate_human_behavior(self, page):
-        """Simulate human-like mouse movement and scrolling."""
-        import random
+    def _simulate_human_behavior(self, page, trusted: bool = False):
+        """
+        Simulate human-like mouse movement and scrolling.
+        
+        The sequence is drawn up front and replayed inside the page in a single
+        evaluate call. Those synthetic events are untrusted, so on sites with
+        anti-bot checks the moves go through Playwright's real input instead.
+        
+        Args:
+            page: Playwright page object
+            trusted: Drive the pointer through page.mouse (one round-trip per step)
+        """
         width = page.viewport_size['width'] if page.viewport_size else 1920
         height = page.viewport_size['height'] if page.viewport_size else 1080
-        for _ in range(random.randint(3, 7)):
-            x = random.randint(0, width-1)
-            y = random.randint(0, height-1)
-            page.mouse.move(x, y, steps=random.randint(10, 30))
-            page.wait_for_timeout(random.randint(100, 400))
-        # Scroll randomly
-        for _ in range(random.randint(1, 3)):
-            scroll_y = random.randint(0, height)
-            page.evaluate(f"window.scrollTo(0, {scroll_y})")
-            page.wait_for_timeout(random.randint(200, 600))
+        moves = [
+            {
+                'x': random.randint(0, width - 1),
+                'y': random.randint(0, height - 1),
+                'steps': random.randint(10, 30),
+                't': random.randint(100, 400),
+            }
+            for _ in range(random.randint(3, 7))
+        ]
+        scrolls = [
+            {'scroll': random.randint(0, height), 't': random.randint(200, 600)}
+            for _ in range(random.randint(1, 3))
+        ]
+        
+        if not trusted:
+            page.evaluate(_HUMAN_SEQUENCE_JS, moves + scrolls)
+            return
+        
+        for move in moves:
+            page.mouse.move(move['x'], move['y'], steps=move['steps'])
+            page.wait_for_timeout(move['t'])
+        for scroll in scrolls:
+            page.evaluate("(y) => window.scrollTo(0, y)", scroll['scroll'])
+            page.wait_for_timeout(scroll['t'])
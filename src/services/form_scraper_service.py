@@ -2,15 +2,23 @@
 Job application form scraping service.
 """
 
-from typing import Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional
+import asyncio
+import html
+import importlib.util
 import json
+import re
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Field descriptions are short HTML fragments; stripping tags is enough to get their text
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Marks the inline <script> that carries the posting and form JSON
+_APP_DATA_SENTINEL = 'window.__appData'
+
 
 class FormScraperService:
     """Scrape job application forms from job posting URLs."""
@@ -20,8 +28,28 @@ class FormScraperService:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
+        
+        # Created on first request so constructing the service doesn't import requests
+        self._session = None
+        
         logger.info("Form scraper service initialized")
     
+    @property
+    def session(self):
+        """HTTP session that reuses connections (keep-alive) across postings."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            # Ask for compressed responses
+            session = requests.Session()
+            session.headers.update({**self.headers, 'Accept-Encoding': 'gzip, deflate'})
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+    
     def extract_application_form(self, job_url: str) -> Optional[Dict]:
         """
         Extract application form structure from job posting URL.
@@ -37,80 +65,14 @@ class FormScraperService:
             logger.info(f"Extracting application form from: {job_url}")
             logger.info("="*70)
             
-            response = requests.get(job_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract from window.__appData
-            script = soup.find('script', string=lambda t: t and 'window.__appData' in t)
-            if not script:
+            data = self._fetch_app_data(job_url)
+            if data is None:
                 logger.error("❌ Could not find application form data")
                 return None
             
-            # Parse the JSON (handle extra data at the end)
-            content = script.string
-            json_start = content.find('{')
-            # Find the end of the JSON object by matching braces
-            brace_count = 0
-            json_end = json_start
-            for i in range(json_start, len(content)):
-                if content[i] == '{':
-                    brace_count += 1
-                elif content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
+            result = self._build_form_result(job_url, data)
             
-            data = json.loads(content[json_start:json_end])
-            
-            # Extract job posting details
-            posting = data.get('posting', {})
-            form_data = posting.get('applicationForm', {})
-            
-            form_fields = []
-            for entry in form_data.get('fieldEntries', []):
-                field = entry.get('field', {})
-                
-                # Extract description
-                desc_html = entry.get('descriptionHtml', '')
-                description = ""
-                if desc_html:
-                    desc_soup = BeautifulSoup(desc_html, 'html.parser')
-                    description = desc_soup.get_text(strip=True)
-                
-                # Extract options for select fields
-                options = []
-                if field.get('type') in ['ValueSelect', 'MultiValueSelect']:
-                    select_options = field.get('selectableValues', [])
-                    for opt in select_options:
-                        if isinstance(opt, dict):
-                            options.append(opt.get('label', opt.get('value', '')))
-                        else:
-                            options.append(str(opt))
-                
-                form_fields.append({
-                    'title': field.get('title'),
-                    'path': field.get('path'),
-                    'type': field.get('type'),
-                    'required': entry.get('isRequired', False),
-                    'description': description,
-                    'options': options if options else None
-                })
-            
-            result = {
-                'job_url': job_url,
-                'company': data.get('organization', {}).get('name'),
-                'job_title': posting.get('title'),
-                'job_description': posting.get('descriptionPlainText', ''),
-                'location': posting.get('locationName'),
-                'form_fields': form_fields,
-                'organization_id': posting.get('organizationId'),
-                'posting_id': posting.get('id')
-            }
-            
-            logger.info(f"✅ Found {len(form_fields)} form fields")
+            logger.info(f"✅ Found {len(result['form_fields'])} form fields")
             logger.info(f"   Company: {result['company']}")
             logger.info(f"   Position: {result['job_title']}")
             logger.info(f"   Location: {result['location']}")
@@ -120,3 +82,225 @@ class FormScraperService:
         except Exception as e:
             logger.error(f"❌ Error extracting form: {e}")
             return None
+    
+    def _build_form_result(self, job_url: str, data: Dict) -> Dict:
+        """
+        Build the form description from decoded window.__appData.
+        
+        Args:
+            job_url: URL of the job posting
+            data: Decoded app data
+            
+        Returns:
+            Dictionary containing form fields and job details
+        """
+        # Extract job posting details
+        posting = data.get('posting', {})
+        form_data = posting.get('applicationForm', {})
+        
+        form_fields = []
+        for entry in form_data.get('fieldEntries', []):
+            field = entry.get('field', {})
+            
+            # Extract description
+            desc_html = entry.get('descriptionHtml') or ''
+            if '<' in desc_html or '&' in desc_html:
+                description = html.unescape(_TAG_RE.sub('', desc_html)).strip()
+            else:
+                # Plain text already (the common case); nothing to strip or unescape
+                description = desc_html.strip()
+            
+            # Extract options for select fields
+            options = []
+            if field.get('type') in ['ValueSelect', 'MultiValueSelect']:
+                select_options = field.get('selectableValues', [])
+                for opt in select_options:
+                    if isinstance(opt, dict):
+                        options.append(opt.get('label', opt.get('value', '')))
+                    else:
+                        options.append(str(opt))
+            
+            form_fields.append({
+                'title': field.get('title'),
+                'path': field.get('path'),
+                'type': field.get('type'),
+                'required': entry.get('isRequired', False),
+                'description': description,
+                'options': options if options else None
+            })
+        
+        result = {
+            'job_url': job_url,
+            'company': data.get('organization', {}).get('name'),
+            'job_title': posting.get('title'),
+            'job_description': posting.get('descriptionPlainText', ''),
+            'location': posting.get('locationName'),
+            'form_fields': form_fields,
+            'organization_id': posting.get('organizationId'),
+            'posting_id': posting.get('id')
+        }
+        return result
+    
+    def _fetch_app_data(self, job_url: str) -> Optional[Dict]:
+        """
+        Stream the posting page and decode its window.__appData object.
+        
+        Args:
+            job_url: URL of the job posting
+            
+        Returns:
+            Decoded app data, or None if the page doesn't carry it
+        """
+        scanner = _AppDataScanner()
+        with self.session.get(job_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            
+            for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                data = scanner.feed(chunk)
+                if data is not None:
+                    return data
+        
+        return scanner.finish()
+    
+    async def extract_application_form_async(self, job_url: str, client) -> Optional[Dict]:
+        """
+        Async variant of extract_application_form for fetching many postings at once.
+        
+        Args:
+            job_url: URL of the job posting
+            client: httpx.AsyncClient shared by the batch
+            
+        Returns:
+            Dictionary containing form fields and job details, or None on failure
+        """
+        try:
+            scanner = _AppDataScanner()
+            data = None
+            async with client.stream('GET', job_url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_text(65536):
+                    data = scanner.feed(chunk)
+                    if data is not None:
+                        break
+            if data is None:
+                data = scanner.finish()
+            if data is None:
+                logger.error(f"❌ Could not find application form data: {job_url}")
+                return None
+            
+            result = self._build_form_result(job_url, data)
+            logger.info(f"✅ {result['company']} - {result['job_title']}: {len(result['form_fields'])} form fields")
+            return result
+        
+        except Exception as e:
+            logger.error(f"❌ Error extracting form from {job_url}: {e}")
+            return None
+    
+    def extract_many(self, job_urls: List[str], max_concurrency: int = 8) -> List[Optional[Dict]]:
+        """
+        Extract application forms for several postings concurrently.
+        
+        All requests share one httpx connection pool, using HTTP/2 when the
+        h2 package is installed.
+        
+        Args:
+            job_urls: URLs of the job postings
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Results in the same order as job_urls (None for failures)
+        """
+        if not job_urls:
+            return []
+        
+        logger.info(f"Extracting {len(job_urls)} application forms (max {max_concurrency} at once)...")
+        return asyncio.run(self._extract_many(job_urls, max_concurrency))
+    
+    async def _extract_many(self, job_urls: List[str], max_concurrency: int) -> List[Optional[Dict]]:
+        """Fetch and parse every posting over one shared AsyncClient."""
+        import httpx
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(
+            headers=self.headers,
+            timeout=10.0,
+            limits=limits,
+            http2=importlib.util.find_spec('h2') is not None,
+        ) as client:
+            async def extract(url):
+                async with semaphore:
+                    return await self.extract_application_form_async(url, client)
+            
+            return await asyncio.gather(*(extract(url) for url in job_urls))
+
+
+class _AppDataScanner:
+    """
+    Incrementally locate and decode window.__appData in streamed page text.
+    
+    Text is scanned as it arrives and the JSON is decoded straight from the
+    text after the sentinel, so the HTML is never parsed. BeautifulSoup is
+    only used if the object can't be decoded in place.
+    """
+    
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._chunks: List[str] = []
+        self._tail = ''
+        self._buffer: Optional[str] = None
+    
+    def feed(self, chunk: str) -> Optional[Dict]:
+        """
+        Add the next chunk of page text.
+        
+        Args:
+            chunk: Decoded text
+            
+        Returns:
+            The decoded app data once the whole object has arrived, else None
+        """
+        self._chunks.append(chunk)
+        if self._buffer is None:
+            # Only the last few characters can hold a sentinel split across chunks
+            window = self._tail + chunk
+            pos = window.find(_APP_DATA_SENTINEL)
+            if pos == -1:
+                self._tail = window[-len(_APP_DATA_SENTINEL):]
+                return None
+            self._buffer = window[pos:]
+        else:
+            self._buffer += chunk
+        
+        json_start = self._buffer.find('{')
+        if json_start == -1:
+            return None
+        try:
+            # raw_decode stops at the end of the object, ignoring trailing script
+            data, _ = self._decoder.raw_decode(self._buffer, json_start)
+            return data
+        except json.JSONDecodeError:
+            # Object not fully received yet
+            return None
+    
+    def finish(self) -> Optional[Dict]:
+        """
+        Handle the end of the page without an in-place decode.
+        
+        Returns:
+            App data from a full BeautifulSoup parse, or None if the page doesn't carry it
+        """
+        if self._buffer is None:
+            return None
+        
+        logger.debug("window.__appData not decodable in place, falling back to full parse")
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(''.join(self._chunks), 'lxml')
+        script = soup.find('script', string=lambda t: t and _APP_DATA_SENTINEL in t)
+        if not script:
+            return None
+        content = script.string
+        data, _ = self._decoder.raw_decode(content, content.find('{'))
+        return data
@@ -4,21 +4,165 @@ Job application orchestrator service.
 Coordinates all services to process job applications end-to-end.
 """
 
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
+import asyncio
+import atexit
 import json
+import logging
+import re
+import weakref
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config.settings import Settings
 from src.services.ai_service import AIService
 from src.services.resume_service import ResumeService
 from src.services.form_scraper_service import FormScraperService
 from src.services.browser_service import BrowserService
+from src.utils.fuzzy import best_option
 from src.utils.logger import get_logger
 from src.utils.paths import get_application_data_path
 
 logger = get_logger(__name__)
 
+# Maximum number of AI questions in flight at once while filling a form
+_AI_MAX_CONCURRENCY = 5
+
+# Hit id -> field title keywords, used by the dispatch in _route_field()
+_TITLE_KEYWORDS = {
+    'middle': ('middle',), 'name': ('name',), 'pronoun': ('pronoun',), 'email': ('email',),
+    'phone': ('phone',), 'resume': ('resume',), 'location': ('location',),
+    'linkedin': ('linkedin',), 'github': ('github',), 'website': ('website',), 'portfolio': ('portfolio',),
+    'state': ('state',), 'residency': ('residency',), 'authorized': ('authorized',),
+    'united_states': ('united states',), 'canada': ('canada',), 'visa': ('visa',), 'sponsorship': ('sponsorship',),
+    'start': ('start',), 'birth': ('birth', 'dob'),
+    'timezone': ('time zone', 'timezone', 'time-zone'),
+    'referral': ('referred by', 'referral', 'refer'),
+    'heard_about': ('where did you hear', 'how did you hear', 'hear about'),
+    'gender': ('gender',), 'race': ('race',), 'veteran': ('veteran',), 'disability': ('disability',),
+}
+# One case-insensitive pass finds every keyword and m.lastgroup names its hit id.
+# The lookahead also reports overlapping keywords ("united states" / "state").
+_TITLE_KEYWORD_RE = re.compile(
+    '(?=' + '|'.join(
+        f"(?P<{hit}>{'|'.join(re.escape(k) for k in keywords)})" for hit, keywords in _TITLE_KEYWORDS.items()
+    ) + ')',
+    re.IGNORECASE
+)
+
+
+def _title_hits(title: str) -> Set[str]:
+    """Return the hit ids of every keyword found in a field title."""
+    return {m.lastgroup for m in _TITLE_KEYWORD_RE.finditer(title)}
+
+
+# Free-text questions answered from config templates instead of the AI, checked in order:
+# (route, title pattern). Routes without a configured value still go to the AI.
+_TEMPLATE_ROUTES = (
+    ('about_yourself', re.compile(r'\b(?:tell (?:us|me) (?:a bit )?about yourself|introduce yourself|describe yourself)\b', re.IGNORECASE)),
+    ('why_company', re.compile(r'\bwhy\b.*\b(?:interested|want|excited|apply|applying)\b.*\b(?:role|position|company|team|us|join)\b', re.IGNORECASE)),
+    ('years_experience', re.compile(r'^\s*(?:how many )?(?:total )?years of (?:professional |relevant |work )?experience(?: do you have)?\s*\??\s*$', re.IGNORECASE)),
+)
+
+# Preferred answers for "where did you hear about us", most preferred first (lowercase)
+_PREFERRED_SOURCES = ('linkedin', 'google search', 'company website', 'careers page')
+
+# Profile fields answered straight from config, checked in order:
+# (system field path, any-of hit-id groups that must all appear in the title, route)
+_PROFILE_ROUTES = (
+    (None, (('middle', 'name'),), 'middle_name'),
+    (None, (('pronoun',),), 'pronouns'),
+    ('_systemfield_name', (('name',),), 'name'),
+    ('_systemfield_email', (('email',),), 'email'),
+    (None, (('phone',),), 'phone'),
+    ('_systemfield_resume', (('resume',),), 'resume'),
+    ('_systemfield_location', (('location',),), 'location'),
+    (None, (('linkedin',),), 'linkedin'),
+    (None, (('github',),), 'github'),
+    (None, (('website',), ('portfolio',)), 'website'),
+    (None, (('state', 'residency'),), 'state'),
+)
+
+
+def _route_field(field_path: str, field_type: str, field_title: str) -> str:
+    """
+    Decide how a form field gets its value.
+    
+    Args:
+        field_path: Field path from the form schema
+        field_type: Field type from the form schema
+        field_title: Field title shown on the form
+        
+    Returns:
+        Route name handled by JobApplicationService._fill_application_form
+    """
+    hits = _title_hits(field_title)
+    
+    # Specific fields first: first table entry whose path or keywords match wins
+    for system_path, keyword_sets, route in _PROFILE_ROUTES:
+        if field_path == system_path or any(
+            all(keyword in hits for keyword in keywords) for keywords in keyword_sets
+        ):
+            return route
+    
+    if field_type == 'Boolean':
+        if 'authorized' in hits and 'united_states' in hits:
+            return 'authorized_us'
+        if 'authorized' in hits and 'canada' in hits:
+            return 'authorized_canada'
+        if 'visa' in hits or 'sponsorship' in hits:
+            return 'visa'
+        return 'yes'
+    
+    if field_type == 'Date':
+        if 'start' in hits:
+            return 'start_date'
+        if 'birth' in hits:
+            return 'birth_date'
+        return 'today'
+    
+    if field_type in ['LongText', 'String']:
+        if 'timezone' in hits:
+            return 'timezone'
+        if 'referral' in hits:
+            return 'referral'
+        for route, pattern in _TEMPLATE_ROUTES:
+            if pattern.search(field_title):
+                return route
+        return 'ai_text'
+    
+    if field_type == 'Number':
+        if _TEMPLATE_ROUTES[-1][1].search(field_title):
+            return 'years_experience'
+        return 'ai_number'
+    
+    if field_type in ['ValueSelect', 'MultiValueSelect']:
+        for route in ('heard_about', 'pronoun', 'gender', 'race', 'veteran', 'disability'):
+            if route in hits:
+                return route
+        return 'ai_select'
+    
+    return 'ai_unknown'
+
+
+# Live services whose background file writes are flushed at interpreter exit
+_LIVE_SERVICES: 'weakref.WeakSet[JobApplicationService]' = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_pending_io():
+    """Flush the pending file writes of every service that was never closed."""
+    for service in list(_LIVE_SERVICES):
+        service._wait_for_pending_io()
+
 
 class JobApplicationService:
     """Orchestrate the complete job application workflow."""
@@ -37,7 +181,33 @@ class JobApplicationService:
         self.ai_service = AIService(settings)
         self.resume_service = ResumeService(settings, self.ai_service)
         self.form_scraper = FormScraperService()
-        self.browser_service = BrowserService(settings, headless=headless)
+        # Built on first use (see browser_service) so runs that stop before Step 3 skip it
+        self._headless = headless
+        self._browser_service: Optional[BrowserService] = None
+        
+        # Answers for the profile routes of _route_field(), flattened from config once
+        personal_info = settings.user_info.personal_info
+        links = settings.user_info.links
+        self._profile_answers: Dict[str, str] = {
+            'middle_name': personal_info.middle_name or '',
+            'pronouns': personal_info.pronouns,
+            'name': personal_info.name,
+            'email': personal_info.email,
+            'phone': personal_info.phone or '',
+            'location': personal_info.location,
+            'linkedin': links.linkedin or '',
+            'github': links.github or '',
+            'website': links.website or '',
+            'state': personal_info.state,
+        }
+        
+        # Background pool for the post-submission file writes (see _wait_for_pending_io)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_io = []
+        _LIVE_SERVICES.add(self)
+        
+        # Form schema (path, type, title per field) -> route per field, see _route_field()
+        self._route_plans: Dict[Tuple[Tuple[str, str, str], ...], Tuple[str, ...]] = {}
         
         logger.info("🤖 Job Application Service Initialized")
         logger.info(f"  Model: {settings.ai_settings.model}")
@@ -59,10 +229,16 @@ class JobApplicationService:
         
         # Step 1: Extract application form
         logger.info("Step 1/4: Extracting application form...")
-        form_data = self.form_scraper.extract_application_form(job_url)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            form_future = pool.submit(self.form_scraper.extract_application_form, job_url)
+            # Playwright is bound to this thread, so the browser starts here while the scrape runs
+            self.browser_service.prewarm()
+            form_data = form_future.result()
         
         if not form_data:
             logger.error("❌ Failed to extract application form")
+            # prewarm() already started Chrome; nothing will submit with it now
+            self.browser_service.close()
             return {
                 'success': False,
                 'error': 'Could not extract application form'
@@ -75,10 +251,7 @@ class JobApplicationService:
         
         # Log field types for visibility
         fields = form_data.get('form_fields', [])
-        field_types = {}
-        for field in fields:
-            field_type = field.get('type', 'unknown')
-            field_types[field_type] = field_types.get(field_type, 0) + 1
+        field_types = Counter(field.get('type', 'unknown') for field in fields)
         logger.info(f"   📋 Field breakdown: {dict(field_types)}")
         
         # Step 2: Fill application with AI assistance
@@ -100,8 +273,9 @@ class JobApplicationService:
         # Step 4: Save application data
         logger.info("\nStep 4/4: Saving application data...")
         filled_data['submission_result'] = submission_result
-        self._save_application_data(filled_data)
-        self._save_qa_text_file(filled_data)  # Save Q&A as text file
+        # Pure file output; written in the background so the result returns right away
+        self._pending_io.append(self._io_pool.submit(self._save_application_data, filled_data))
+        self._pending_io.append(self._io_pool.submit(self._save_qa_text_file, filled_data))  # Save Q&A as text file
         
         # Generate preview
         preview = self._generate_application_preview(filled_data)
@@ -121,6 +295,30 @@ class JobApplicationService:
             'filled_data': filled_data
         }
     
+    @property
+    def browser_service(self) -> BrowserService:
+        """Browser automation service, created on first access."""
+        if self._browser_service is None:
+            self._browser_service = BrowserService(self.settings, headless=self._headless)
+        return self._browser_service
+    
+    def close(self):
+        """Shut down the browser kept warm between applications and flush pending file writes."""
+        if self._browser_service is not None:
+            self._browser_service.close()
+        self._wait_for_pending_io()
+        self._io_pool.shutdown(wait=True)
+        _LIVE_SERVICES.discard(self)
+    
+    def _wait_for_pending_io(self):
+        """Block until all background application file writes have finished."""
+        for future in self._pending_io:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"   ⚠️  Saving application data failed: {e}")
+        self._pending_io.clear()
+    
     def _fill_application_form(self, form_data: Dict) -> Dict:
         """
         Fill application form with AI-generated content.
@@ -132,219 +330,188 @@ class JobApplicationService:
             Dictionary with filled form data
         """
         logger.info("📝 Filling application form with AI assistance...")
+        # Per-field logs are DEBUG; a single summary is logged at INFO once every field is filled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         job_description = form_data['job_description']
         job_title = form_data['job_title']
         company = form_data['company']
         
-        # Load original resume
-        original_resume_text, original_doc = self.resume_service.load_original_resume()
-        
         # Get user config shortcuts
         personal_info = self.settings.user_info.personal_info
-        links = self.settings.user_info.links
         work_auth = self.settings.user_info.work_authorization
         demographics = self.settings.user_info.demographics
         background = self.settings.user_info.background
         elevator_pitch = background.elevator_pitch if background and hasattr(background, 'elevator_pitch') else ""
+        # Answers for the template routes of _route_field(); empty values fall back to the AI
+        template_answers = {
+            'about_yourself': elevator_pitch,
+            'why_company': f"{elevator_pitch} I'm particularly excited about the opportunity at {company}." if elevator_pitch else '',
+            'years_experience': background.years_of_experience if background else None,
+        }
+        # Job context shared by every AI call on this form
+        ai_context = self.ai_service.build_context(job_description, job_title, company, elevator_pitch)
+        
+        # Date answers, computed once per application
+        now = datetime.now()
+        today_iso = now.strftime('%Y-%m-%d')
+        # Start date: the Monday on or after two weeks from today (weekday 0 = Monday)
+        two_weeks_later = now + timedelta(days=14)
+        start_monday_iso = (two_weeks_later + timedelta(days=(7 - two_weeks_later.weekday()) % 7)).strftime('%Y-%m-%d')
         
         filled_data = {
             'company': company,
             'job_title': job_title,
             'job_url': form_data['job_url'],
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'fields': {},
             'qa_pairs': []  # Track questions and answers
         }
         
-        for field in form_data['form_fields']:
+        # AI-answered fields are queued here and resolved concurrently after the loop.
+        # Their slots in 'fields' and 'qa_pairs' are reserved in form order up front.
+        ai_tasks: List[Tuple[Callable[[], Awaitable[Any]], Callable[[Any], None]]] = []
+        # Free-text questions share one batched completion: field path -> (question, result callback)
+        batched_questions: Dict[str, Tuple[str, Callable[[Any], None]]] = {}
+        # Option selections share another: field path -> (question, options, multi_select)
+        batched_selects: Dict[str, Tuple[str, List[str], bool]] = {}
+        
+        def queue_ai_answer(field_path, question, field_type, required, to_value=None):
+            """Queue a batched question whose answer fills the field and a Q&A slot."""
+            filled_data['fields'][field_path] = None
+            qa_index = len(filled_data['qa_pairs'])
+            filled_data['qa_pairs'].append(None)
+            
+            def finish(answer):
+                value = to_value(answer) if to_value else answer
+                filled_data['fields'][field_path] = value
+                filled_data['qa_pairs'][qa_index] = {
+                    'question': question,
+                    'answer': str(value) if to_value else answer,
+                    'field_type': field_type,
+                    'required': required
+                }
+                if debug_enabled:
+                    logger.debug(f"   ✅ {field_path}: {str(value)[:80]}")
+            
+            batched_questions[field_path] = (question, finish)
+        
+        # Postings from the same ATS share a schema, so the routing plan is computed once per schema
+        schema = tuple((f['path'], f['type'], f['title']) for f in form_data['form_fields'])
+        routes = self._route_plans.get(schema)
+        if routes is None:
+            routes = tuple(_route_field(path, ftype, title) for path, ftype, title in schema)
+            self._route_plans[schema] = routes
+        
+        for field, route in zip(form_data['form_fields'], routes):
+            # Unpack the field once; the branches below only use these locals
             field_title = field['title']
             field_type = field['type']
             field_path = field['path']
             required = field['required']
+            description = field['description']
+            # Prompt text for AI-answered fields
+            question = f"{field_title}: {description}" if description else field_title
             
-            logger.info(f"   🔹 {field_title} ({field_type}){' *REQUIRED*' if required else ''}")
-            
-            # Handle specific fields first
-            if 'middle' in field_title.lower() and 'name' in field_title.lower():
-                filled_data['fields'][field_path] = personal_info.middle_name or ''
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-            
-            elif 'pronoun' in field_title.lower():
-                filled_data['fields'][field_path] = personal_info.pronouns
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
+            if debug_enabled:
+                logger.debug(f"   🔹 {field_title} ({field_type}){' *REQUIRED*' if required else ''}")
             
-            elif field_path == '_systemfield_name' or ('name' in field_title.lower() and 'middle' not in field_title.lower()):
-                filled_data['fields'][field_path] = personal_info.name
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif field_path == '_systemfield_email' or 'email' in field_title.lower():
-                filled_data['fields'][field_path] = personal_info.email
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif 'phone' in field_title.lower():
-                filled_data['fields'][field_path] = personal_info.phone or ''
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif field_path == '_systemfield_resume' or 'resume' in field_title.lower():
+            if route == 'resume':
                 # Use original resume path directly (tailoring commented out for speed)
                 resume_path = self.settings.user_info.files.original_resume_path
-                filled_data['fields'][field_path] = original_resume_text
+                if field_type == 'File':
+                    # The browser uploads the file; only the path needs to travel with the form data
+                    filled_data['fields'][field_path] = {'__file__': str(resume_path)}
+                else:
+                    filled_data['fields'][field_path] = self.resume_service.load_original_resume_text()
                 filled_data['tailored_resume_path'] = resume_path
-                logger.info(f"   ✅ Using original resume: {resume_path}")
-                
-            elif field_path == '_systemfield_location' or 'location' in field_title.lower():
-                filled_data['fields'][field_path] = personal_info.location
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif 'linkedin' in field_title.lower():
-                filled_data['fields'][field_path] = links.linkedin or ''
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif 'github' in field_title.lower():
-                filled_data['fields'][field_path] = links.github or ''
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
-                
-            elif 'website' in field_title.lower() or 'portfolio' in field_title.lower():
-                filled_data['fields'][field_path] = links.website or ''
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
+                logger.debug(f"   ✅ Using original resume: {resume_path}")
+            
+            elif route in self._profile_answers:
+                filled_data['fields'][field_path] = self._profile_answers[route]
+                logger.debug(f"   ✅ Set to: {filled_data['fields'][field_path]}")
             
-            elif 'state' in field_title.lower() and 'residency' in field_title.lower():
-                # Use state from config for residency questions
-                filled_data['fields'][field_path] = personal_info.state
-                logger.info(f"   ✅ Set to: {filled_data['fields'][field_path]}")
+            elif template_answers.get(route) not in (None, ''):
+                value = template_answers[route]
+                filled_data['fields'][field_path] = value if field_type == 'Number' else str(value)
+                logger.debug(f"   ✅ Set to: {str(value)[:80]} (templated)")
                 
             elif field_type == 'Boolean':
                 # For yes/no questions, use config values
-                if 'authorized' in field_title.lower() and 'united states' in field_title.lower():
+                if route == 'authorized_us':
                     filled_data['fields'][field_path] = work_auth.authorized_to_work_us
-                    logger.info(f"   ✅ Set to: {'Yes' if work_auth.authorized_to_work_us else 'No'}")
-                elif 'authorized' in field_title.lower() and 'canada' in field_title.lower():
+                    logger.debug(f"   ✅ Set to: {'Yes' if work_auth.authorized_to_work_us else 'No'}")
+                elif route == 'authorized_canada':
                     filled_data['fields'][field_path] = work_auth.authorized_to_work_canada
-                    logger.info(f"   ✅ Set to: {'Yes' if work_auth.authorized_to_work_canada else 'No'}")
-                elif 'visa' in field_title.lower() or 'sponsorship' in field_title.lower():
+                    logger.debug(f"   ✅ Set to: {'Yes' if work_auth.authorized_to_work_canada else 'No'}")
+                elif route == 'visa':
                     filled_data['fields'][field_path] = work_auth.needs_visa_sponsorship
-                    logger.info(f"   ✅ Set to: {'Yes' if work_auth.needs_visa_sponsorship else 'No'}")
+                    logger.debug(f"   ✅ Set to: {'Yes' if work_auth.needs_visa_sponsorship else 'No'}")
                 else:
                     filled_data['fields'][field_path] = True
-                    logger.info(f"   ✅ Set to: Yes")
+                    logger.debug(f"   ✅ Set to: Yes")
             
             elif field_type == 'Date':
                 # Handle date fields - check if it's a start date question
-                if 'start' in field_title.lower():
-                    # Calculate Monday that is 2 weeks from today
-                    today = datetime.now()
-                    two_weeks_later = today + timedelta(days=14)
-                    days_until_monday = (7 - two_weeks_later.weekday()) % 7  # 0 = Monday
-                    if days_until_monday == 0:  # If that day is already Monday
-                        next_monday = two_weeks_later
-                    else:
-                        next_monday = two_weeks_later + timedelta(days=days_until_monday)
-                    date_value = next_monday.strftime('%Y-%m-%d')
+                if route == 'start_date':
+                    date_value = start_monday_iso
                     filled_data['fields'][field_path] = date_value
-                    logger.info(f"   ✅ Set to: {date_value} (Monday, 2+ weeks from today)")
-                elif 'birth' in field_title.lower() or 'dob' in field_title.lower():
+                    logger.debug(f"   ✅ Set to: {date_value} (Monday, 2+ weeks from today)")
+                elif route == 'birth_date':
                     # Don't fill DOB unless required
                     filled_data['fields'][field_path] = ''
-                    logger.info(f"   ⚠️  Skipped DOB field (privacy)")
+                    logger.debug(f"   ⚠️  Skipped DOB field (privacy)")
                 else:
                     # Generic date - use current date
-                    date_value = datetime.now().strftime('%Y-%m-%d')
+                    date_value = today_iso
                     filled_data['fields'][field_path] = date_value
-                    logger.info(f"   ✅ Set to: {date_value}")
+                    logger.debug(f"   ✅ Set to: {date_value}")
                     
             elif field_type in ['LongText', 'String']:
                 # Check for timezone questions - answer with "EST"
-                if any(keyword in field_title.lower() for keyword in ['time zone', 'timezone', 'time-zone']):
+                if route == 'timezone':
                     answer = "EST"
-                    logger.info(f"   ✅ Set to: {answer} (timezone question)")
+                    logger.debug(f"   ✅ Set to: {answer} (timezone question)")
                 # Check for referral questions - answer with "N/A"
-                elif any(keyword in field_title.lower() for keyword in ['refer', 'referral', 'referred by']):
+                elif route == 'referral':
                     answer = "N/A"
-                    logger.info(f"   ✅ Set to: {answer} (referral question)")
+                    logger.debug(f"   ✅ Set to: {answer} (referral question)")
                 else:
-                    # Use AI to answer custom questions
-                    question = f"{field_title}: {field['description']}" if field['description'] else field_title
-                    
-                    answer = self.ai_service.answer_question(
-                        question,
-                        job_description,
-                        job_title,
-                        company,
-                        elevator_pitch
-                    )
-                    
-                    # Save Q&A pair (only AI-generated answers)
-                    filled_data['qa_pairs'].append({
-                        'question': question,
-                        'answer': answer,
-                        'field_type': field_type,
-                        'required': required
-                    })
+                    # Use AI to answer custom questions (Q&A pair saved when the answer arrives)
+                    queue_ai_answer(field_path, question, field_type, required)
+                    answer = None
                 
-                filled_data['fields'][field_path] = answer
+                if answer is not None:
+                    filled_data['fields'][field_path] = answer
             
             elif field_type == 'Number':
                 # Use AI to generate numeric answers for experience, salary, etc.
-                question = f"{field_title}: {field['description']}" if field['description'] else field_title
-                
-                # Ask AI to provide a numeric answer
-                answer = self.ai_service.answer_question(
-                    question,
-                    job_description,
-                    job_title,
-                    company,
-                    elevator_pitch
-                )
-                
-                # Extract number from AI response (handle cases like "5 years" -> "5")
-                import re
-                number_match = re.search(r'\d+', str(answer))
-                if number_match:
-                    numeric_value = int(number_match.group())
-                else:
-                    # Fallback: try to analyze from resume
-                    numeric_value = 5  # Safe default
-                
-                filled_data['fields'][field_path] = numeric_value
-                logger.info(f"   ✅ Set to: {numeric_value}")
-                
-                # Save Q&A pair
-                filled_data['qa_pairs'].append({
-                    'question': question,
-                    'answer': str(numeric_value),
-                    'field_type': field_type,
-                    'required': required
-                })
+                queue_ai_answer(field_path, question, field_type, required, to_value=self._extract_number)
             
             elif field_type in ['ValueSelect', 'MultiValueSelect']:
-                options = field.get('options', [])
+                options = field.get('options') or []
                 
                 # Handle "Where did you hear about us" questions
-                if any(keyword in field_title.lower() for keyword in ['where did you hear', 'how did you hear', 'hear about']):
+                if route == 'heard_about':
                     # Prefer LinkedIn, Google search, or Company website
-                    preferred_sources = ['LinkedIn', 'Google search', 'Company website', 'Careers page']
                     selected = []
                     
-                    if options:
-                        for pref in preferred_sources:
-                            for opt in options:
-                                if pref.lower() in opt.lower():
-                                    selected.append(opt)
-                                    break
-                            if selected:
-                                break  # Take first match
+                    for pref in _PREFERRED_SOURCES:
+                        match = best_option(pref, options)
+                        if match is not None:
+                            selected.append(options[match])
+                            break  # Take first match
                     
                     if field_type == 'MultiValueSelect':
                         filled_data['fields'][field_path] = selected if selected else [options[0]] if options else []
                     else:
                         filled_data['fields'][field_path] = selected[0] if selected else (options[0] if options else '')
                     
-                    logger.info(f"   ✅ Selected: {filled_data['fields'][field_path]}")
+                    logger.debug(f"   ✅ Selected: {filled_data['fields'][field_path]}")
                 
                 # Handle specific demographics fields
-                elif 'pronoun' in field_title.lower():
-                    pronoun_input = personal_info.pronouns
+                elif route == 'pronoun':
+                    pronoun_input = personal_info.pronouns or ''
                     pronoun_mapping = {
                         'he/him/his': 'He/him/his',
                         'she/her/hers': 'She/her/hers',
@@ -352,101 +519,128 @@ class JobApplicationService:
                     }
                     pronoun_value = pronoun_mapping.get(pronoun_input.lower(), pronoun_input)
                     
-                    if options:
-                        for opt in options:
-                            if pronoun_input.lower() in opt.lower() or opt.lower() in pronoun_input.lower():
-                                pronoun_value = opt
-                                break
+                    match = best_option(pronoun_input, options)
+                    if match is not None:
+                        pronoun_value = options[match]
                     
                     filled_data['fields'][field_path] = pronoun_value
-                    logger.info(f"   ✅ Selected: {pronoun_value}")
+                    logger.debug(f"   ✅ Selected: {pronoun_value}")
                     
-                elif 'gender' in field_title.lower():
-                    logger.info(f"   [GENDER] Field: {field_title} | Config value: '{demographics.gender}' | Options: {options}")
+                elif route == 'gender':
+                    logger.debug(f"   [GENDER] Field: {field_title} | Config value: '{demographics.gender}' | Options: {options}")
                     gender_value = demographics.gender
-                    matched_option = None
                     if options:
-                        for opt in options:
-                            logger.info(f"   [GENDER] Checking option: '{opt}' against config value: '{gender_value}'")
-                            if gender_value.lower() in opt.lower() or opt.lower() in gender_value.lower():
-                                matched_option = opt
-                                logger.info(f"   [GENDER] Match found: '{opt}'")
-                                break
-                        if matched_option:
-                            gender_value = matched_option
+                        match = best_option(gender_value, options)
+                        if match is not None:
+                            gender_value = options[match]
+                            logger.debug(f"   [GENDER] Match found: '{gender_value}'")
                         else:
                             logger.warning(f"   [GENDER] No match found for gender value '{gender_value}' in options: {options}")
                     else:
                         logger.warning(f"   [GENDER] No options provided for gender field!")
                     filled_data['fields'][field_path] = gender_value
-                    logger.info(f"   ✅ Selected gender: {gender_value}")
+                    logger.debug(f"   ✅ Selected gender: {gender_value}")
                     
-                elif 'race' in field_title.lower():
+                elif route == 'race':
                     filled_data['fields'][field_path] = demographics.race
-                    logger.info(f"   ✅ Selected: {demographics.race}")
+                    logger.debug(f"   ✅ Selected: {demographics.race}")
                     
-                elif 'veteran' in field_title.lower():
+                elif route == 'veteran':
                     filled_data['fields'][field_path] = demographics.veteran_status
-                    logger.info(f"   ✅ Selected: {demographics.veteran_status}")
+                    logger.debug(f"   ✅ Selected: {demographics.veteran_status}")
                     
-                elif 'disability' in field_title.lower():
+                elif route == 'disability':
                     filled_data['fields'][field_path] = demographics.disability_status
-                    logger.info(f"   ✅ Selected: {demographics.disability_status}")
+                    logger.debug(f"   ✅ Selected: {demographics.disability_status}")
                     
                 else:
-                    # Use AI to select best option
-                    if field['description']:
-                        question = f"{field_title}: {field['description']}"
-                    else:
-                        question = field_title
-                    
-                    multi_select = field_type == 'MultiValueSelect'
-                    selected = self.ai_service.select_best_option(
-                        question,
-                        options,
-                        job_description,
-                        job_title,
-                        company,
-                        multi_select=multi_select
-                    )
-                    filled_data['fields'][field_path] = selected
-                    if multi_select:
-                        logger.info(f"   ✅ Selected: {', '.join(selected)}")
-                    else:
-                        logger.info(f"   ✅ Selected: {selected}")
+                    # Use AI to select best option (one batched completion after the loop)
+                    filled_data['fields'][field_path] = None
+                    batched_selects[field_path] = (question, options, field_type == 'MultiValueSelect')
             
             else:
                 # Catch-all for any unhandled field types - use AI
-                logger.info(f"   ⚠️  Unknown field type '{field_type}' - using AI to generate answer")
-                question = f"{field_title}: {field['description']}" if field['description'] else field_title
-                
-                answer = self.ai_service.answer_question(
-                    question,
-                    job_description,
-                    job_title,
-                    company,
-                    elevator_pitch
-                )
-                
-                filled_data['fields'][field_path] = answer
-                logger.info(f"   ✅ Set to: {answer}")
-                
-                # Save Q&A pair
-                filled_data['qa_pairs'].append({
-                    'question': question,
-                    'answer': answer,
-                    'field_type': field_type,
-                    'required': required
-                })
+                logger.debug(f"   ⚠️  Unknown field type '{field_type}' - using AI to generate answer")
+                queue_ai_answer(field_path, question, field_type, required)
+        
+        if batched_questions:
+            def finish_batch(answers):
+                for path, (_, finish) in batched_questions.items():
+                    finish(answers[path])
+            
+            ai_tasks.append((
+                partial(self.ai_service.answer_questions_batch_async,
+                        {path: question for path, (question, _) in batched_questions.items()},
+                        ai_context),
+                finish_batch
+            ))
+        
+        if batched_selects:
+            def finish_selects(selections):
+                for path, (_, _, multi_select) in batched_selects.items():
+                    selected = selections[path]
+                    filled_data['fields'][path] = selected
+                    if debug_enabled:
+                        logger.debug(f"   ✅ Selected: {', '.join(selected) if multi_select else selected}")
+            
+            ai_tasks.append((
+                partial(self.ai_service.select_options_batch_async, batched_selects, ai_context),
+                finish_selects
+            ))
+        
+        if ai_tasks:
+            logger.info(f"   🤖 Running {len(ai_tasks)} AI requests (up to {_AI_MAX_CONCURRENCY} at once)...")
+            asyncio.run(self._run_ai_tasks(ai_tasks, _AI_MAX_CONCURRENCY))
+        
+        rows = []
+        for field in form_data['form_fields']:
+            preview = str(filled_data['fields'].get(field['path'])).replace('\n', ' ')
+            rows.append(f"      • {field['title'][:45]:<45} {preview[:60]}")
+        logger.info(f"   ✅ Filled {len(rows)} fields:\n" + "\n".join(rows))
         
         return filled_data
     
+    async def _run_ai_tasks(
+        self,
+        tasks: List[Tuple[Callable[[], Awaitable[Any]], Callable[[Any], None]]],
+        max_concurrency: int
+    ):
+        """
+        Run queued AI calls concurrently, applying each result as soon as it arrives.
+        
+        Args:
+            tasks: (coroutine factory, result callback) pairs
+            max_concurrency: Maximum number of calls in flight
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(make_call, finish):
+            async with semaphore:
+                result = await make_call()
+            finish(result)
+        
+        await asyncio.gather(*(run(make_call, finish) for make_call, finish in tasks))
+    
+    @staticmethod
+    def _extract_number(answer) -> int:
+        """Extract the first integer from an AI answer (e.g. "5 years" -> 5), defaulting to 5."""
+        number_match = re.search(r'\d+', str(answer))
+        return int(number_match.group()) if number_match else 5
+    
     def _save_application_data(self, filled_data: Dict):
         """Save filled application data to JSON file."""
         output_path = get_application_data_path()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(filled_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson writes UTF-8 bytes directly (non-ASCII kept as-is, like ensure_ascii=False)
+            output_path.write_bytes(orjson.dumps(
+                filled_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(filled_data, f, indent=2, ensure_ascii=False, default=str)
         
         logger.info(f"   💾 Application saved to: {output_path}")
     
@@ -465,53 +659,49 @@ class JobApplicationService:
         filename = f"application_{company}_{timestamp}.txt"
         output_path = qa_dir / filename
         
-        # Write all form data to text file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("="*70 + "\n")
-            f.write(f"APPLICATION FORM DATA\n")
-            f.write("="*70 + "\n\n")
-            f.write(f"Company: {filled_data.get('company', 'Unknown')}\n")
-            f.write(f"Position: {filled_data.get('job_title', 'Unknown')}\n")
-            f.write(f"Date: {filled_data.get('timestamp', 'Unknown')}\n")
-            f.write(f"Job URL: {filled_data.get('job_url', 'Unknown')}\n")
-            
-            if filled_data.get('tailored_resume_path'):
-                f.write(f"Resume: {filled_data.get('tailored_resume_path')}\n")
-            
-            f.write("\n" + "="*70 + "\n")
-            f.write("FILLED FORM FIELDS\n")
-            f.write("="*70 + "\n\n")
-            
-            # Write all filled fields
-            fields = filled_data.get('fields', {})
-            if fields:
-                for field_path, value in fields.items():
-                    # Clean up the field path for display
-                    field_name = field_path.split('.')[-1].replace('_', ' ').title()
-                    f.write(f"{field_name}:\n")
-                    
-                    # Format the value nicely
-                    if isinstance(value, list):
-                        f.write(f"  {', '.join(str(v) for v in value)}\n")
-                    elif isinstance(value, str) and len(value) > 100:
-                        # For long text, indent it
-                        f.write(f"  {value}\n")
-                    else:
-                        f.write(f"  {value}\n")
-                    f.write("\n")
+        # Build the whole file in memory and write it once
+        parts = [
+            "="*70 + "\n",
+            "APPLICATION FORM DATA\n",
+            "="*70 + "\n\n",
+            f"Company: {filled_data.get('company', 'Unknown')}\n",
+            f"Position: {filled_data.get('job_title', 'Unknown')}\n",
+            f"Date: {filled_data.get('timestamp', 'Unknown')}\n",
+            f"Job URL: {filled_data.get('job_url', 'Unknown')}\n",
+        ]
+        
+        if filled_data.get('tailored_resume_path'):
+            parts.append(f"Resume: {filled_data.get('tailored_resume_path')}\n")
+        
+        parts.extend(["\n" + "="*70 + "\n", "FILLED FORM FIELDS\n", "="*70 + "\n\n"])
+        
+        # Write all filled fields
+        for field_path, value in filled_data.get('fields', {}).items():
+            # Clean up the field path for display
+            field_name = field_path.split('.')[-1].replace('_', ' ').title()
             
-            # Write AI-generated Q&A separately
-            qa_pairs = filled_data.get('qa_pairs', [])
-            if qa_pairs:
-                f.write("\n" + "="*70 + "\n")
-                f.write("AI-GENERATED ANSWERS\n")
-                f.write("="*70 + "\n\n")
-                
-                for i, qa in enumerate(qa_pairs, 1):
-                    f.write(f"Q{i}: {qa['question']}\n")
-                    f.write(f"     {'[REQUIRED]' if qa.get('required') else '[OPTIONAL]'} - {qa.get('field_type', 'Unknown')}\n\n")
-                    f.write(f"A{i}: {qa['answer']}\n")
-                    f.write("\n" + "-"*70 + "\n\n")
+            # Format the value nicely
+            if isinstance(value, dict) and '__file__' in value:
+                value_text = f"[File] {value['__file__']}"
+            elif isinstance(value, list):
+                value_text = ', '.join(str(v) for v in value)
+            else:
+                value_text = str(value)
+            parts.append(f"{field_name}:\n  {value_text}\n\n")
+        
+        # Write AI-generated Q&A separately
+        qa_pairs = filled_data.get('qa_pairs', [])
+        if qa_pairs:
+            parts.extend(["\n" + "="*70 + "\n", "AI-GENERATED ANSWERS\n", "="*70 + "\n\n"])
+            for i, qa in enumerate(qa_pairs, 1):
+                parts.append(
+                    f"Q{i}: {qa['question']}\n"
+                    f"     {'[REQUIRED]' if qa.get('required') else '[OPTIONAL]'} - {qa.get('field_type', 'Unknown')}\n\n"
+                    f"A{i}: {qa['answer']}\n"
+                    "\n" + "-"*70 + "\n\n"
+                )
+        
+        output_path.write_text(''.join(parts), encoding='utf-8')
         
         logger.info(f"   📝 Application form data saved to: {output_path}")
 
@@ -533,7 +723,9 @@ class JobApplicationService:
         
         lines.append(f"\n📝 Form Fields ({len(filled_data['fields'])}):")
         for path, value in filled_data['fields'].items():
-            if path == '_systemfield_resume':
+            if isinstance(value, dict) and '__file__' in value:
+                lines.append(f"  • {path}: [File - {Path(value['__file__']).name}]")
+            elif path == '_systemfield_resume':
                 lines.append(f"  • {path}: [Resume content - {len(str(value))} chars]")
             elif isinstance(value, list):
                 lines.append(f"  • {path}: {', '.join(value)}")
@@ -2,24 +2,119 @@
 Resume management service for loading, tailoring, and saving resumes.
 """
 
-from typing import Dict, Tuple, Optional, List
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from docx import Document
-import copy
 import re
 
 from src.config.settings import Settings
-from src.services.ai_service import AIService
 from src.utils.logger import get_logger
-from legacy_scripts.tailor_docx_resume import extract_resume_content, update_resume_sections
+
+# python-docx (and lxml behind it) and the provider SDKs are imported where they're used,
+# so importing this module stays cheap for code paths that never touch a resume
+if TYPE_CHECKING:
+    from docx import Document
+    from src.services.ai_service import AIService
 
 logger = get_logger(__name__)
 
+# Most tailoring completions run at once; each is an independent, network-bound provider call
+_AI_MAX_WORKERS = 8
+
+# Generation prompts built by this service only include the start of the job description
+_PROMPT_DESCRIPTION_CHARS = 2000
+
+# Characters dropped from company/job names before they become folder and file names
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^\w\s-]')
+# The same rule for ASCII as a str.translate table (deletes everything but letters, digits, _, - and whitespace)
+_UNSAFE_ASCII_NAME_CHARS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in '_-')
+))
+
+
+def _safe_name(name: str) -> str:
+    """Turn a company or job title into a folder/file name component."""
+    # Names are nearly always ASCII; translate() handles those in one C pass
+    cleaned = name.translate(_UNSAFE_ASCII_NAME_CHARS) if name.isascii() else _UNSAFE_NAME_CHARS_RE.sub('', name)
+    return cleaned.strip().replace(' ', '_')
+
+
+@lru_cache(maxsize=4)
+def _read_resume_file(path: Path, is_docx: bool, mtime_ns: int, size: int) -> Tuple[str, Optional[bytes]]:
+    """
+    Read a resume file and extract its text.
+    
+    Cached at module level so every ResumeService (one per application in the
+    web flow) shares the read; mtime_ns and size are only part of the key.
+    
+    Args:
+        path: Resume file
+        is_docx: Whether the file is a DOCX (otherwise plain text)
+        mtime_ns: File modification time, to key the cache
+        size: File size, to key the cache
+        
+    Returns:
+        Tuple of (resume_text, raw DOCX bytes or None for TXT)
+    """
+    if is_docx:
+        from docx import Document
+        
+        docx_bytes = path.read_bytes()
+        doc = Document(BytesIO(docx_bytes))
+        # Paragraph.text walks the runs' XML, so read it once per paragraph
+        text = '\n'.join(t for t in (para.text for para in doc.paragraphs) if t.strip())
+        logger.info(f"Loaded DOCX resume: {path}")
+        return text, docx_bytes
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    logger.info(f"Loaded TXT resume: {path}")
+    return text, None
+
+
+# Header placeholders in the resume template. One scan reports every marker a paragraph
+# contains (m.lastgroup per hit); _fill_template() then applies the first rule that fits.
+_HEADER_MARKER_RE = re.compile(
+    r'(?=(?P<full_name>\[Full Name\])|(?P<location>\[Location\])|(?P<linkedin>LinkedIn:)'
+    r'|(?P<title>PROFESSIONAL TITLE)|(?P<x5>xxxxx)|(?P<x3>xxx))'
+)
+
+# Skill category lines in the template ("Languages: [List ...]") -> key in the generated skills
+_SKILL_PLACEHOLDERS = {
+    'Languages:': 'Languages',
+    'AI/ML': 'AI/ML',
+    'Frontend:': 'Frontend',
+    'Backend:': 'Backend',
+    'Databases:': 'Databases',
+    'Cloud & DevOps:': 'Cloud & DevOps',
+    'Other:': 'Other',
+}
+_SKILL_PLACEHOLDER_RE = re.compile(
+    '^(' + '|'.join(re.escape(prefix) for prefix in _SKILL_PLACEHOLDERS) + r')(?=.*\[List)',
+    re.DOTALL
+)
+
+# Deletes the '*' / '**' markdown emphasis the models like to add, in one pass
+_STRIP_MARKDOWN_BOLD = str.maketrans('', '', '*')
+
+# Widely used tech for each category
+_DEFAULT_SKILLS = {
+    'Languages': 'Python, JavaScript, TypeScript, Java, Kotlin',
+    'AI/ML': 'TensorFlow, PyTorch, scikit-learn, OpenCV',
+    'Frontend': 'React, Next.js, Angular, Vue.js',
+    'Backend': 'Node.js, Flask, Django, Spring Boot',
+    'Databases': 'PostgreSQL, MongoDB, MySQL, Redis',
+    'Cloud & DevOps': 'AWS, Docker, Kubernetes, Azure, GCP',
+    'Other': 'CI/CD, Git, REST APIs, Agile, Functional Programming'
+}
+
 
 class ResumeService:
     """Handle resume loading, tailoring, and saving operations."""
     
-    def __init__(self, settings: Settings, ai_service: AIService):
+    def __init__(self, settings: Settings, ai_service: 'AIService'):
         """
         Initialize resume service.
         
@@ -36,29 +131,50 @@ class ResumeService:
         # Ensure directories exist
         self.tailored_resume_dir.mkdir(parents=True, exist_ok=True)
         
+        # The configured resume path is fixed for the life of the service, so resolve it once
+        self._original_resume_path = Path(self.settings.user_info.files.original_resume_path)
+        self._original_resume_is_docx = self._original_resume_path.name.endswith('.docx')
+        
         logger.info("Resume service initialized")
     
-    def load_original_resume(self) -> Tuple[str, Optional[Document]]:
+    def load_original_resume(self) -> Tuple[str, Optional['Document']]:
         """
         Load the original resume from file.
         
+        The file is only re-read when it changes. A DOCX is handed out as a
+        fresh Document each call because tailoring edits it in place.
+        
         Returns:
             Tuple of (resume_text, document_object or None)
             - If DOCX: (text_content, Document object)
             - If TXT: (text_content, None)
         """
-        resume_path = self.settings.user_info.files.original_resume_path
+        from docx import Document
+        
+        text, docx_bytes = self._read_original_resume()
+        return text, Document(BytesIO(docx_bytes)) if docx_bytes is not None else None
+    
+    def load_original_resume_text(self) -> str:
+        """
+        Get the text of the original resume without building a Document.
+        
+        Returns:
+            Resume text
+        """
+        return self._read_original_resume()[0]
+    
+    def _read_original_resume(self) -> Tuple[str, Optional[bytes]]:
+        """
+        Read the original resume, reusing the previous read while the file is unchanged.
+        
+        Returns:
+            Tuple of (resume_text, raw DOCX bytes or None for TXT)
+        """
+        resume_path = self._original_resume_path
         try:
-            if resume_path.endswith('.docx'):
-                doc = Document(resume_path)
-                text = '\n'.join([para.text for para in doc.paragraphs if para.text.strip()])
-                logger.info(f"Loaded DOCX resume: {resume_path}")
-                return text, doc
-            else:
-                with open(resume_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                logger.info(f"Loaded TXT resume: {resume_path}")
-                return text, None
+            stat = resume_path.stat()
+            # A changed file gets a new (mtime_ns, size) and so a fresh read
+            return _read_resume_file(resume_path, self._original_resume_is_docx, stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError:
             logger.error(f"❌ Resume file not found: {resume_path}")
             raise
@@ -69,7 +185,7 @@ class ResumeService:
         job_description: str,
         job_title: str,
         company: str,
-        original_doc: Optional[Document] = None
+        original_doc: Optional['Document'] = None
     ):
         """
         Use AI to tailor resume for specific job.
@@ -90,9 +206,28 @@ class ResumeService:
         if original_doc:
             return self._tailor_docx_resume(original_doc, job_description, job_title, company)
         
-        # Otherwise, do full text tailoring (legacy)
+        # Otherwise, do full text tailoring (legacy); its prompt only uses the start of the description
+        job_description = job_description[:_PROMPT_DESCRIPTION_CHARS]
         return self._tailor_text_resume(original_resume_text, job_description, job_title, company)
     
+    @staticmethod
+    def _job_prompt_prefix(job_description: str, job_title: str, company: str) -> str:
+        """
+        Build the job block that leads every resume-generation prompt for one posting.
+        
+        It is byte-identical across the header, skills and experience prompts,
+        so providers can serve it from their prompt cache after the first call.
+        
+        Args:
+            job_description: Job description
+            job_title: Job title
+            company: Company name
+            
+        Returns:
+            Prompt prefix
+        """
+        return f"TARGET JOB: {job_title} at {company}\n\nJOB DESCRIPTION:\n{job_description[:_PROMPT_DESCRIPTION_CHARS]}"
+    
     def _tailor_text_resume(
         self,
         resume_text: str,
@@ -101,12 +236,7 @@ class ResumeService:
         company: str
     ) -> str:
         """Tailor plain text resume."""
-        prompt = f"""You are a professional resume writer. Rewrite the following resume to perfectly match this job posting.
-
-JOB TITLE: {job_title}
-
-JOB DESCRIPTION:
-{job_description[:2000]}
+        prompt = f"""You are a professional resume writer. Rewrite the following resume to perfectly match the job posting above.
 
 ORIGINAL RESUME:
 {resume_text}
@@ -122,7 +252,10 @@ Instructions:
 Provide ONLY the tailored resume text, no additional commentary."""
 
         try:
-            tailored_resume = self.ai_service.generate_text(prompt)
+            tailored_resume = self.ai_service.generate_cached_completion(
+                'text_resume', prompt,
+                cached_prefix=self._job_prompt_prefix(job_description, job_title, company)
+            )
             logger.info(f"✅ Resume tailored successfully ({len(tailored_resume)} characters)")
             return tailored_resume
         except Exception as e:
@@ -132,11 +265,11 @@ Provide ONLY the tailored resume text, no additional commentary."""
     
     def _tailor_docx_resume(
         self,
-        doc: Document,
+        doc: 'Document',
         job_description: str,
         job_title: str,
         company: str
-    ) -> Document:
+    ) -> 'Document':
         """
         Tailor DOCX resume by updating specific sections while preserving formatting.
         
@@ -149,58 +282,88 @@ Provide ONLY the tailored resume text, no additional commentary."""
         Returns:
             Document object with tailored content
         """
+        from legacy_scripts.tailor_docx_resume import extract_resume_content, update_resume_sections
+        
         logger.info("🔍 Extracting resume sections...")
         content = extract_resume_content(doc)
+        jobs = content['experience_jobs']
         
-        # Tailor Summary section
-        tailored_summary = ""
-        if content['summary']['paras']:
-            logger.info("\n📝 Tailoring SUMMARY section...")
-            original_summary = '\n'.join([p['text'] for p in content['summary']['paras']])
-            tailored_summary = self.ai_service.tailor_resume_summary(
-                original_summary,
-                job_description,
-                job_title,
-                company
-            )
-            logger.info("   ✅ Summary updated")
-        
-        # Tailor Skills section
-        tailored_skills = ""
-        if content['skills']['paras']:
-            logger.info("\n🛠️  Tailoring TECHNICAL SKILLS section...")
-            original_skills = '\n'.join([p['text'] for p in content['skills']['paras']])
-            tailored_skills = self.ai_service.tailor_skills_section(
-                original_skills,
-                job_description,
-                job_title,
-                company
+        original_summary = self._section_text(content['summary'])
+        original_skills = self._section_text(content['skills'])
+        job_infos = [
+            {
+                'company': job.get('company', ''),
+                'title': job.get('title', ''),
+                'dates': job.get('dates', ''),
+                'bullets': [p['text'] for p in job['paras']]
+            }
+            for job in jobs
+        ]
+        
+        # Tailor every section in one request; anything it misses is redone on its own below
+        logger.info(f"\n📝 Tailoring SUMMARY, TECHNICAL SKILLS and WORK EXPERIENCE ({len(jobs)} jobs)...")
+        try:
+            bundle = self.ai_service.tailor_resume_bundle(
+                original_summary, original_skills, job_infos, job_description, job_title, company
             )
-            logger.info("   ✅ Skills updated")
-        
-        # Tailor Experience section (each job)
-        tailored_jobs = []
-        if content['experience_jobs']:
-            logger.info(f"\n💼 Tailoring WORK EXPERIENCE ({len(content['experience_jobs'])} jobs)...")
-            for idx, job in enumerate(content['experience_jobs'], 1):
-                logger.info(f"\n   Job {idx}/{len(content['experience_jobs'])}: {job.get('company', 'Unknown')}")
-                original_bullets = [p['text'] for p in job['paras']]
-                
-                job_info = {
-                    'company': job.get('company', ''),
-                    'title': job.get('title', ''),
-                    'dates': job.get('dates', ''),
-                    'bullets': original_bullets
-                }
-                
-                tailored_bullets = self.ai_service.tailor_work_experience(
-                    job_info,
+        except Exception as e:
+            logger.warning(f"   ⚠️  Combined tailoring failed ({e}), tailoring sections separately")
+            bundle = {'summary': None, 'skills': None, 'jobs': [None] * len(jobs)}
+        
+        # The fallbacks are independent of each other, so submit them all at once
+        with ThreadPoolExecutor(max_workers=_AI_MAX_WORKERS) as pool:
+            summary_future = skills_future = None
+            
+            if original_summary and not bundle['summary']:
+                logger.info("\n📝 Tailoring SUMMARY section separately...")
+                summary_future = pool.submit(
+                    self.ai_service.tailor_resume_summary,
+                    original_summary,
+                    job_description,
+                    job_title,
+                    company
+                )
+            
+            if original_skills and not bundle['skills']:
+                logger.info("\n🛠️  Tailoring TECHNICAL SKILLS section separately...")
+                skills_future = pool.submit(
+                    self.ai_service.tailor_skills_section,
+                    original_skills,
                     job_description,
                     job_title,
                     company
                 )
+            
+            job_futures = []
+            for job_info, bullets in zip(job_infos, bundle['jobs']):
+                if bullets:
+                    job_futures.append(None)
+                    continue
+                logger.info(f"\n💼 Tailoring WORK EXPERIENCE for {job_info['company'] or 'Unknown'} separately...")
+                job_futures.append(pool.submit(
+                    self.ai_service.tailor_work_experience,
+                    job_info,
+                    job_description,
+                    job_title,
+                    company
+                ))
+            
+            # Tailor Summary section
+            tailored_summary = summary_future.result() if summary_future else bundle['summary'] or ""
+            if tailored_summary:
+                logger.info("   ✅ Summary updated")
+            
+            # Tailor Skills section
+            tailored_skills = skills_future.result() if skills_future else bundle['skills'] or ""
+            if tailored_skills:
+                logger.info("   ✅ Skills updated")
+            
+            # Tailor Experience section (each job)
+            tailored_jobs = []
+            for idx, (job, bullets, future) in enumerate(zip(jobs, bundle['jobs'], job_futures), 1):
+                tailored_bullets = future.result() if future else bullets
                 tailored_jobs.append({'bullets': tailored_bullets})
-                logger.info(f"      ✅ Updated {len(tailored_bullets)} bullet points")
+                logger.info(f"   ✅ Job {idx}/{len(jobs)} ({job.get('company', 'Unknown')}): updated {len(tailored_bullets)} bullet points")
         
         # Update the document
         logger.info(f"\n📝 Applying changes to document...")
@@ -216,9 +379,27 @@ Provide ONLY the tailored resume text, no additional commentary."""
         logger.info(f"\n✅ Resume tailoring complete!")
         return doc
     
+    @staticmethod
+    def _section_text(section: Dict) -> str:
+        """
+        Get the original text of an extracted resume section.
+        
+        The joined text is stored on the section the first time, so validation
+        reuses the string built during tailoring.
+        
+        Args:
+            section: Section from extract_resume_content() (with 'paras')
+            
+        Returns:
+            Paragraph texts joined with newlines
+        """
+        if 'joined_text' not in section:
+            section['joined_text'] = '\n'.join(p['text'] for p in section['paras'])
+        return section['joined_text']
+    
     def _validate_and_enhance_resume(
         self,
-        doc: Document,
+        doc: 'Document',
         content: Dict,
         tailored_summary: str,
         tailored_skills: str,
@@ -226,14 +407,14 @@ Provide ONLY the tailored resume text, no additional commentary."""
         job_description: str,
         job_title: str,
         company: str
-    ) -> Document:
+    ) -> 'Document':
         """
         Validate tailored resume and enhance if sections are missing or incomplete.
         """
         issues_found = []
         
         # Check Summary section
-        if not tailored_summary or len(tailored_summary.strip()) < 50:
+        if not self.ai_service.summary_is_complete(tailored_summary):
             issues_found.append("Summary too short or missing")
             logger.warning("   ⚠️  Summary section incomplete")
         
@@ -243,9 +424,7 @@ Provide ONLY the tailored resume text, no additional commentary."""
             logger.warning("   ⚠️  Skills section incomplete")
         else:
             # Check if all 4 categories are present
-            required_categories = ['Programming & Frameworks:', 'Data & AI/ML Tools:', 
-                                   'Cloud & DevOps:', 'Databases & APIs:']
-            missing_categories = [cat for cat in required_categories if cat not in tailored_skills]
+            missing_categories = self.ai_service.missing_skill_categories(tailored_skills)
             if missing_categories:
                 issues_found.append(f"Missing skill categories: {missing_categories}")
                 logger.warning(f"   ⚠️  Missing categories: {', '.join(missing_categories)}")
@@ -264,25 +443,33 @@ Provide ONLY the tailored resume text, no additional commentary."""
         if issues_found:
             logger.info(f"\n🔧 Enhancing incomplete sections...")
             
+            # Regenerate what's needed, then write it back in one pass. update_resume_sections()
+            # only rewrites paragraph text, so the paragraph indices in `content` stay valid.
+            regenerated_summary = ""
+            regenerated_skills = ""
+            
             # Re-enhance summary if needed
             if any('Summary' in issue for issue in issues_found):
                 logger.info("   🔄 Re-generating summary...")
-                original_summary = '\n'.join([p['text'] for p in content['summary']['paras']])
-                tailored_summary = self.ai_service.tailor_resume_summary(
-                    original_summary, job_description, job_title, company
+                original_summary = self._section_text(content['summary'])
+                # Bypass the cache: the stored completion is the one that just failed the check
+                regenerated_summary = self.ai_service.tailor_resume_summary(
+                    original_summary, job_description, job_title, company, use_cache=False
                 )
-                content_updated = extract_resume_content(doc)
-                doc = update_resume_sections(doc, content_updated, tailored_summary, tailored_skills, tailored_jobs)
             
             # Re-enhance skills if needed
             if any('Skills' in issue or 'categories' in issue for issue in issues_found):
                 logger.info("   🔄 Re-generating skills...")
-                original_skills = '\n'.join([p['text'] for p in content['skills']['paras']])
-                tailored_skills = self.ai_service.tailor_skills_section(
-                    original_skills, job_description, job_title, company
+                original_skills = self._section_text(content['skills'])
+                regenerated_skills = self.ai_service.tailor_skills_section(
+                    original_skills, job_description, job_title, company, use_cache=False
                 )
-                content_updated = extract_resume_content(doc)
-                doc = update_resume_sections(doc, content_updated, tailored_summary, tailored_skills, tailored_jobs)
+            
+            if regenerated_summary or regenerated_skills:
+                from legacy_scripts.tailor_docx_resume import update_resume_sections
+                
+                # Empty sections are skipped, so only the regenerated ones are rewritten
+                doc = update_resume_sections(doc, content, regenerated_summary, regenerated_skills, [])
             
             logger.info("   ✅ Enhancement complete")
         else:
@@ -295,7 +482,7 @@ Provide ONLY the tailored resume text, no additional commentary."""
         company: str,
         job_title: str,
         tailored_content,
-        original_doc: Optional[Document] = None
+        original_doc: Optional['Document'] = None
     ) -> str:
         """
         Save tailored resume to file in organized directory structure.
@@ -311,8 +498,8 @@ Provide ONLY the tailored resume text, no additional commentary."""
             Path to saved resume file
         """
         # Create safe folder name from company and job title
-        safe_company = re.sub(r'[^\w\s-]', '', company).strip().replace(' ', '_')
-        safe_title = re.sub(r'[^\w\s-]', '', job_title).strip().replace(' ', '_')
+        safe_company = _safe_name(company)
+        safe_title = _safe_name(job_title)
         folder_name = f"{safe_company}_{safe_title}"
         
         # Create company/job folder inside tailored directory
@@ -320,8 +507,7 @@ Provide ONLY the tailored resume text, no additional commentary."""
         job_folder.mkdir(parents=True, exist_ok=True)
         
         # Get original resume filename (without path)
-        original_resume_path = Path(self.settings.user_info.files.original_resume_path)
-        original_filename = original_resume_path.name
+        original_filename = self._original_resume_path.name
         
         # Check if it's a Document object
         if hasattr(tailored_content, 'save') and hasattr(tailored_content, 'paragraphs'):
@@ -334,13 +520,21 @@ Provide ONLY the tailored resume text, no additional commentary."""
                 # Save as DOCX (legacy simple approach)
                 filepath = job_folder / original_filename
                 
-                new_doc = copy.deepcopy(original_doc)
+                from docx import Document
+                from docx.oxml.ns import qn
+                
+                # Save-and-reparse is much cheaper than copy.deepcopy() over the docx object graph
+                buffer = BytesIO()
+                original_doc.save(buffer)
+                buffer.seek(0)
+                new_doc = Document(buffer)
                 resume_lines = tailored_content.split('\n')
                 
-                # Clear and rebuild
-                while len(new_doc.paragraphs) > 0:
-                    p = new_doc.paragraphs[0]
-                    p._element.getparent().remove(p._element)
+                # Clear and rebuild; drop the body's <w:p> elements directly instead of
+                # re-materializing doc.paragraphs for every removal
+                body = new_doc.element.body
+                for p_element in body.findall(qn('w:p')):
+                    body.remove(p_element)
                 
                 for line in resume_lines:
                     if line.strip():
@@ -377,11 +571,17 @@ Provide ONLY the tailored resume text, no additional commentary."""
         """
         logger.info(f"\n🎯 Generating resume from template for {job_title} at {company}")
         
+        # Every section prompt only uses the start of the description; cut it once here so they
+        # all share one string (slicing an already-short str returns it unchanged)
+        job_description = job_description[:_PROMPT_DESCRIPTION_CHARS]
+        
         # Load template
         template_path = self.original_resume_dir / "Resume.docx"
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
         
+        from docx import Document
+        
         doc = Document(str(template_path))
         
         # Get personal info from config (build from user_info if resume_personal_info not set)
@@ -402,21 +602,28 @@ Provide ONLY the tailored resume text, no additional commentary."""
                 'value_statement': self.settings.user_info.background.elevator_pitch[:100]
             }
         
-        # Generate each section using AI
-        logger.info("📝 Generating header...")
-        header = self._generate_header(personal_info, job_description, job_title, company)
-
-        logger.info("🔧 Generating skills...")
-        skills = self._generate_skills(job_description, job_title, company)
-
-        logger.info("💼 Generating work experience...")
-        # Use real work experience from config and generate bullets for each
-        if self.settings.user_info.work_experience:
-            experience = self._generate_experience_with_config(
-                job_description, job_title, company, self.settings.user_info.work_experience
-            )
-        else:
-            experience = self._generate_experience(job_description, job_title, company)
+        # Generate each section using AI; the sections don't depend on each other, so run them at once
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            logger.info("📝 Generating header...")
+            header_future = pool.submit(self._generate_header, personal_info, job_description, job_title, company)
+            
+            logger.info("🔧 Generating skills...")
+            skills_future = pool.submit(self._generate_skills, job_description, job_title, company)
+            
+            logger.info("💼 Generating work experience...")
+            # Use real work experience from config and generate bullets for each
+            # (_generate_experience_with_config fans out per role on its own pool)
+            if self.settings.user_info.work_experience:
+                experience_future = pool.submit(
+                    self._generate_experience_with_config,
+                    job_description, job_title, company, self.settings.user_info.work_experience
+                )
+            else:
+                experience_future = pool.submit(self._generate_experience, job_description, job_title, company)
+            
+            header = header_future.result()
+            skills = skills_future.result()
+            experience = experience_future.result()
 
         logger.info("🎓 Using education from config...")
         # Use real education from config
@@ -437,15 +644,16 @@ Provide ONLY the tailored resume text, no additional commentary."""
         self._fill_template(doc, header, skills, experience, education)
         
         # Save generated resume
-        safe_company = "".join(c for c in (company or 'Company') if c.isalnum() or c in (' ', '_')).strip().replace(' ', '_')
-        safe_title = "".join(c for c in (job_title or 'Position') if c.isalnum() or c in (' ', '_')).strip().replace(' ', '_')
+        safe_company = _safe_name(company or 'Company')
+        safe_title = _safe_name(job_title or 'Position')
         
         output_dir = self.tailored_resume_dir / f"{safe_company}_{safe_title}"
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate filename: FirstName_LastName_CompanyName_Resume.docx
-        first_name = personal_info['full_name'].split()[0] if personal_info['full_name'] else 'Resume'
-        last_name = personal_info['full_name'].split()[-1] if len(personal_info['full_name'].split()) > 1 else ''
+        name_parts = personal_info['full_name'].split() if personal_info.get('full_name') else []
+        first_name = name_parts[0] if name_parts else 'Resume'
+        last_name = name_parts[-1] if len(name_parts) > 1 else ''
         filename = f"{first_name}_{last_name}_{safe_company}_Resume.docx" if last_name else f"{first_name}_{safe_company}_Resume.docx"
         
         output_file = output_dir / filename
@@ -473,10 +681,7 @@ Provide ONLY the tailored resume text, no additional commentary."""
                 years_experience = 10  # Fallback to 10 if parsing fails
         
         # Analyze job to determine professional title and core stack
-        prompt = f"""Based on this job description for {job_title} at {company}, generate a professional resume header.
-
-Job Description:
-{job_description[:1500]}
+        prompt = f"""Based on the job description above, generate a professional resume header.
 
 Generate EXACTLY 4 lines (no more, no less), each with ONLY the requested content:
 
@@ -500,10 +705,12 @@ Ruby on Rails, React, AWS, PostgreSQL
 Building high-performance systems serving 10M+ users daily
 """
 
-        response = self.ai_service.generate_completion(prompt).strip()
+        response = self.ai_service.generate_cached_completion(
+            'header', prompt, cached_prefix=self._job_prompt_prefix(job_description, job_title, company)
+        ).strip()
         
         # Clean AI response aggressively
-        response = response.replace('**', '').replace('*', '')
+        response = response.translate(_STRIP_MARKDOWN_BOLD)
         # Remove common AI prefixes from entire response
         for prefix in ['here is the generated resume header:', 'here is:', 'here are:', 'response:', 'output:']:
             if response.lower().startswith(prefix):
@@ -556,10 +763,7 @@ Building high-performance systems serving 10M+ users daily
         """Generate skills section based on job requirements."""
         
         prompt = f"""
-Analyze this job description for {job_title} at {company} and generate a comprehensive Technical Skills section for a resume.
-
-Job Description:
-{job_description[:2000]}
+Analyze the job description above and generate a comprehensive Technical Skills section for a resume.
 
 Generate skills in these exact categories (one line per category):
 - Languages: [programming languages]
@@ -594,7 +798,9 @@ Cloud & DevOps: AWS, Docker, Kubernetes
 Other: Git, REST APIs, GraphQL
 """
 
-        response = self.ai_service.generate_completion(prompt).strip()
+        response = self.ai_service.generate_cached_completion(
+            'skills_template', prompt, cached_prefix=self._job_prompt_prefix(job_description, job_title, company)
+        ).strip()
         
         # Remove empty lines and clean
         lines = [line.strip() for line in response.split('\n') if line.strip() and ':' in line]
@@ -633,10 +839,7 @@ Other: Git, REST APIs, GraphQL
         """Generate work experience bullets for past jobs."""
         
         # Get work history from config
-        prompt = f"""Generate impressive work experience bullets for a resume targeting {job_title} at {company}.
-
-Job Description (what they want):
-{job_description[:2000]}
+        prompt = f"""Generate impressive work experience bullets for a resume targeting the job above.
 
 Generate 4 past job experiences, each with:
 - Job Title | Company Name | Location | Dates (e.g., "Dec 2024 — Current")
@@ -660,7 +863,10 @@ JOB_TITLE | COMPANY | LOCATION | DATES
 
 Generate all 4 jobs now:"""
 
-        response = self.ai_service.generate_completion(prompt, temperature=0.8).strip()
+        response = self.ai_service.generate_cached_completion(
+            'experience_template', prompt, temperature=0.8,
+            cached_prefix=self._job_prompt_prefix(job_description, job_title, company)
+        ).strip()
         
         # Parse the response into structured format
         jobs = []
@@ -695,27 +901,33 @@ Generate all 4 jobs now:"""
     
     def _generate_experience_with_config(self, job_description: str, job_title: str, company: str, work_history: list) -> list:
         """Generate work experience bullets using real work history from config."""
+        if not work_history:
+            return []
         
-        jobs = []
-        for work in work_history:
-            # Extract year range from dates (e.g., "Feb 2015 – Jan 2019" -> 2015-2019)
-            try:
-                dates_parts = work.dates.replace('–', '-').replace('—', '-').split('-')
-                start_year = int(dates_parts[0].strip().split()[-1])
-                if len(dates_parts) > 1 and 'Current' not in dates_parts[1]:
-                    end_year = int(dates_parts[1].strip().split()[-1])
-                else:
-                    end_year = 2025  # Current
-            except:
-                start_year = 2020
-                end_year = 2025
-            
-            # Generate bullets for this specific job
-            prompt = f"""Generate 4-5 impressive work experience bullets for this role, tailored to the target job.
-
-TARGET JOB YOU'RE APPLYING FOR:
-Position: {job_title} at {company}
-Description: {job_description[:2000]}
+        # One independent completion per role, so run them concurrently; map() keeps the config order
+        with ThreadPoolExecutor(max_workers=min(_AI_MAX_WORKERS, len(work_history))) as pool:
+            jobs = pool.map(
+                lambda work: self._generate_role_bullets(work, job_description, job_title, company),
+                work_history
+            )
+            return [job for job in jobs if job]
+    
+    def _generate_role_bullets(self, work, job_description: str, job_title: str, company: str) -> Optional[dict]:
+        """Generate tailored bullets for one past role, or None if the AI produced none."""
+        # Extract year range from dates (e.g., "Feb 2015 – Jan 2019" -> 2015-2019)
+        try:
+            dates_parts = work.dates.replace('–', '-').replace('—', '-').split('-')
+            start_year = int(dates_parts[0].strip().split()[-1])
+            if len(dates_parts) > 1 and 'Current' not in dates_parts[1]:
+                end_year = int(dates_parts[1].strip().split()[-1])
+            else:
+                end_year = 2025  # Current
+        except:
+            start_year = 2020
+            end_year = 2025
+        
+        # Generate bullets for this specific job
+        prompt = f"""Generate 4-5 impressive work experience bullets for this role, tailored to the target job above.
 
 YOUR PAST ROLE (what you accomplished):
 Title: {work.title}
@@ -759,36 +971,38 @@ Output ONLY the bullets (4-5 bullets), one per line, starting with •
 Each bullet must be grammatically perfect with proper punctuation.
 NO additional commentary, explanations, prefixes, or meta-text."""
 
-            response = self.ai_service.generate_completion(prompt, temperature=0.8).strip()
-            
-            # Parse bullets - basic cleanup only
-            bullets = []
-            for line in response.split('\n'):
-                line = line.strip()
-                if line.startswith('•'):
-                    bullet = line.lstrip('•').strip()
-                    
-                    # Basic cleanup - ensure period at end
-                    if bullet and not bullet.endswith(('.', '!', '?')):
-                        bullet += '.'
-                    
-                    # Filter out bullets that:
-                    # 1. Mention target company as a tool
-                    # 2. Start with "Led" or "Lead"
-                    if (company.lower() not in bullet.lower() or f"at {company}" in bullet.lower()) and \
-                       not bullet.lower().startswith(('led ', 'lead ')):
-                        bullets.append(bullet)
-            
-            if bullets:
-                jobs.append({
-                    'title': work.title,
-                    'company': work.company,
-                    'location': work.location,
-                    'dates': work.dates,
-                    'bullets': bullets[:5]  # Max 5 bullets
-                })
-        
-        return jobs
+        response = self.ai_service.generate_cached_completion(
+            'experience_role', prompt, temperature=0.8,
+            cached_prefix=self._job_prompt_prefix(job_description, job_title, company)
+        ).strip()
+        
+        # Parse bullets - basic cleanup only
+        bullets = []
+        for line in response.split('\n'):
+            line = line.strip()
+            if line.startswith('•'):
+                bullet = line.lstrip('•').strip()
+                
+                # Basic cleanup - ensure period at end
+                if bullet and not bullet.endswith(('.', '!', '?')):
+                    bullet += '.'
+                
+                # Filter out bullets that:
+                # 1. Mention target company as a tool
+                # 2. Start with "Led" or "Lead"
+                if (company.lower() not in bullet.lower() or f"at {company}" in bullet.lower()) and \
+                   not bullet.lower().startswith(('led ', 'lead ')):
+                    bullets.append(bullet)
+        
+        if not bullets:
+            return None
+        return {
+            'title': work.title,
+            'company': work.company,
+            'location': work.location,
+            'dates': work.dates,
+            'bullets': bullets[:5]  # Max 5 bullets
+        }
     
     def _generate_education(self) -> dict:
         """Generate education section."""
@@ -802,19 +1016,50 @@ NO additional commentary, explanations, prefixes, or meta-text."""
             'coursework': 'Data Structures, Algorithms, Database Systems, Operating Systems, Computer Networks, Machine Learning'
         }
     
-    def _fill_template(self, doc: Document, header: dict, skills: dict, experience: list, education: dict):
+    def _fill_template(self, doc: 'Document', header: dict, skills: dict, experience: list, education: dict):
         """Fill the template with generated content while preserving formatting."""
         
+        # Replace skills placeholders using actual AI response keys, stripping markdown and fallback to correct keys if needed
+        def clean_skill_value(val):
+            if not val:
+                return ''
+            val = val.translate(_STRIP_MARKDOWN_BOLD).strip()
+            # Check if it's a placeholder value that should be ignored
+            if val.lower() in ['none', 'n/a', 'not mentioned', 'not specified', 'not applicable']:
+                return ''
+            # Remove parentheses and explanations
+            val = re.sub(r'\(.*?\)', '', val)
+            val = val.replace('e.g.', '').replace('E.g.', '').replace('for example', '').replace('no mention of', '').replace('implied to be', '').replace('implied', '').replace('but not specified', '').replace('not specified', '').replace('N/A', '').replace('None', '').replace(':', '').strip()
+            # Remove extra spaces and commas
+            val = re.sub(r',\s*,', ',', val)
+            val = re.sub(r'\s{2,}', ' ', val)
+            val = val.strip(', ').strip()
+            # Final check - if after cleaning it's too short or empty, return empty
+            if len(val) < 3:
+                return ''
+            return val
+
+        def get_skill_value(skills, key, fallback=None):
+            val = skills.get(key)
+            if not val:
+                val = skills.get(f"**{key}")
+            val = clean_skill_value(val)
+            # If cleaned value is empty or None-like, use fallback
+            if not val or len(val) < 3:
+                val = fallback if fallback else ''
+            return val
+        
         for paragraph in doc.paragraphs:
             text = paragraph.text
             # Replace header placeholders while preserving formatting
-            if '[Full Name]' in text:
+            markers = {m.lastgroup for m in _HEADER_MARKER_RE.finditer(text)}
+            if 'full_name' in markers:
                 self._replace_text_in_paragraph(paragraph, '[Full Name]', header['full_name'])
-            elif '[Location]' in text and 'xxx' in text:
+            elif 'location' in markers and ('x3' in markers or 'x5' in markers):
                 self._replace_text_in_paragraph(paragraph, text, f"{header['location']} | {header['phone']} | {header['email']}")
-            elif 'LinkedIn:' in text and 'xxxxx' in text:
+            elif 'linkedin' in markers and 'x5' in markers:
                 self._replace_text_in_paragraph(paragraph, text, f"LinkedIn: {header['linkedin']} | GitHub: {header['github']}")
-            elif 'PROFESSIONAL TITLE' in text:
+            elif 'title' in markers:
                 # Compose the professional title block in all uppercase and clean
                 title_block = f"{header['title']} | {header['years']} | {header['core_stack']} | {header['value_statement']}"
                 for prefix in ["HERE ARE THE REQUESTED ELEMENTS:", "HERE IS:", "HERE ARE:", "RESPONSE:", "|", ":"]:
@@ -823,68 +1068,11 @@ NO additional commentary, explanations, prefixes, or meta-text."""
                 title_block = title_block.upper()
                 self._replace_text_in_paragraph(paragraph, text, title_block)
             
-            # Replace skills placeholders using actual AI response keys, stripping markdown and fallback to correct keys if needed
-            def clean_skill_value(val):
-                if not val:
-                    return ''
-                val = val.replace('**', '').replace('*', '').strip()
-                # Check if it's a placeholder value that should be ignored
-                if val.lower() in ['none', 'n/a', 'not mentioned', 'not specified', 'not applicable']:
-                    return ''
-                # Remove parentheses and explanations
-                val = re.sub(r'\(.*?\)', '', val)
-                val = val.replace('e.g.', '').replace('E.g.', '').replace('for example', '').replace('no mention of', '').replace('implied to be', '').replace('implied', '').replace('but not specified', '').replace('not specified', '').replace('N/A', '').replace('None', '').replace(':', '').strip()
-                # Remove extra spaces and commas
-                val = re.sub(r',\s*,', ',', val)
-                val = re.sub(r'\s{2,}', ' ', val)
-                val = val.strip(', ').strip()
-                # Final check - if after cleaning it's too short or empty, return empty
-                if len(val) < 3:
-                    return ''
-                return val
-
-            def get_skill_value(skills, key, fallback=None):
-                val = skills.get(key)
-                if not val:
-                    val = skills.get(f"**{key}")
-                val = clean_skill_value(val)
-                # If cleaned value is empty or None-like, use fallback
-                if not val or len(val) < 3:
-                    val = fallback if fallback else ''
-                return val
-
-            # Widely used tech for each category
-            default_skills = {
-                'Languages': 'Python, JavaScript, TypeScript, Java, Kotlin',
-                'AI/ML': 'TensorFlow, PyTorch, scikit-learn, OpenCV',
-                'Frontend': 'React, Next.js, Angular, Vue.js',
-                'Backend': 'Node.js, Flask, Django, Spring Boot',
-                'Databases': 'PostgreSQL, MongoDB, MySQL, Redis',
-                'Cloud & DevOps': 'AWS, Docker, Kubernetes, Azure, GCP',
-                'Other': 'CI/CD, Git, REST APIs, Agile, Functional Programming'
-            }
-
-            if text.startswith('Languages:') and '[List' in text:
-                value = get_skill_value(skills, 'Languages', default_skills['Languages'])
-                self._replace_text_in_paragraph(paragraph, text, f"Languages: {value}")
-            elif text.startswith('AI/ML') and '[List' in text:
-                value = get_skill_value(skills, 'AI/ML', default_skills['AI/ML'])
-                self._replace_text_in_paragraph(paragraph, text, f"AI/ML: {value}")
-            elif text.startswith('Frontend:') and '[List' in text:
-                value = get_skill_value(skills, 'Frontend', default_skills['Frontend'])
-                self._replace_text_in_paragraph(paragraph, text, f"Frontend: {value}")
-            elif text.startswith('Backend:') and '[List' in text:
-                value = get_skill_value(skills, 'Backend', default_skills['Backend'])
-                self._replace_text_in_paragraph(paragraph, text, f"Backend: {value}")
-            elif text.startswith('Databases:') and '[List' in text:
-                value = get_skill_value(skills, 'Databases', default_skills['Databases'])
-                self._replace_text_in_paragraph(paragraph, text, f"Databases: {value}")
-            elif text.startswith('Cloud & DevOps:') and '[List' in text:
-                value = get_skill_value(skills, 'Cloud & DevOps', default_skills['Cloud & DevOps'])
-                self._replace_text_in_paragraph(paragraph, text, f"Cloud & DevOps: {value}")
-            elif text.startswith('Other:') and '[List' in text:
-                value = get_skill_value(skills, 'Other', default_skills['Other'])
-                self._replace_text_in_paragraph(paragraph, text, f"Other: {value}")
+            skill_match = _SKILL_PLACEHOLDER_RE.match(text)
+            if skill_match:
+                category = _SKILL_PLACEHOLDERS[skill_match.group(1)]
+                value = get_skill_value(skills, category, _DEFAULT_SKILLS[category])
+                self._replace_text_in_paragraph(paragraph, text, f"{category}: {value}")
         
         # Find and delete all template placeholders between RELEVANT WORK EXPERIENCE and EDUCATION
         work_header_idx = None
@@ -897,11 +1085,8 @@ NO additional commentary, explanations, prefixes, or meta-text."""
         
         # Delete all paragraphs between RELEVANT WORK EXPERIENCE and EDUCATION (template placeholders)
         if work_header_idx is not None and education_idx is not None:
-            # Get all paragraph elements between these indices
-            paras_to_delete = []
-            for i in range(work_header_idx + 1, education_idx):
-                if i < len(doc.paragraphs):
-                    paras_to_delete.append(doc.paragraphs[i])
+            # doc.paragraphs rebuilds its list on every access, so slice it once
+            paras_to_delete = doc.paragraphs[work_header_idx + 1:education_idx]
             
             # Delete them
             for para in paras_to_delete:
@@ -937,12 +1122,34 @@ NO additional commentary, explanations, prefixes, or meta-text."""
 
                 # Insert all bullets (in order)
                 for bullet in job['bullets']:
-                    clean_bullet = bullet.replace('**', '').replace('*', '').strip()
+                    clean_bullet = bullet.translate(_STRIP_MARKDOWN_BOLD).strip()
                     new_p = parent.makeelement('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p', nsmap=education_element.nsmap)
                     parent.insert(parent.index(education_element), new_p)
                     bullet_para = Paragraph(new_p, parent)
                     bullet_para.add_run(f"• {clean_bullet}")
 
+        # Clear template instructions and replace education placeholders (before bolding,
+        # which keys off the filled-in text, e.g. "Bachelor ...")
+        for paragraph in doc.paragraphs:
+            text = paragraph.text
+            if '[Focus on impact' in text or '[Include collaboration' in text or '[Always quantify' in text:
+                paragraph.clear()
+            elif '[Each bullet' in text or '[Remember' in text or '[Template' in text:
+                paragraph.clear()
+            elif '[Degree Name]' in text:
+                self._replace_text_in_paragraph(paragraph, '[Degree Name]', education['degree'])
+            elif 'Graduated:' in text and '[Month Year]' in text:
+                if education.get('gpa'):
+                    self._replace_text_in_paragraph(paragraph, text, f"Graduated: {education['graduated']} GPA: {education['gpa']}")
+                else:
+                    self._replace_text_in_paragraph(paragraph, text, f"Graduated: {education['graduated']}")
+            elif '[University Name]' in text:
+                self._replace_text_in_paragraph(paragraph, '[University Name]', education['university'])
+            elif text == '[City, State]':
+                self._replace_text_in_paragraph(paragraph, '[City, State]', education['location'])
+            elif 'Relevant Coursework:' in text and 'Data Structures' in text:
+                self._replace_text_in_paragraph(paragraph, text, f"Relevant Coursework: {education['coursework']}")
+        
         # Bold section headers and key fields
         for paragraph in doc.paragraphs:
             if paragraph.text.strip().upper() in [
@@ -960,27 +1167,6 @@ NO additional commentary, explanations, prefixes, or meta-text."""
             if paragraph.text.strip().startswith('Relevant Coursework:'):
                 for run in paragraph.runs:
                     run.bold = True
-            
-            # Clear template instructions and replace education placeholders
-            for paragraph in doc.paragraphs:
-                text = paragraph.text
-                if '[Focus on impact' in text or '[Include collaboration' in text or '[Always quantify' in text:
-                    paragraph.clear()
-                elif '[Each bullet' in text or '[Remember' in text or '[Template' in text:
-                    paragraph.clear()
-                elif '[Degree Name]' in text:
-                    self._replace_text_in_paragraph(paragraph, '[Degree Name]', education['degree'])
-                elif 'Graduated:' in text and '[Month Year]' in text:
-                    if education.get('gpa'):
-                        self._replace_text_in_paragraph(paragraph, text, f"Graduated: {education['graduated']} GPA: {education['gpa']}")
-                    else:
-                        self._replace_text_in_paragraph(paragraph, text, f"Graduated: {education['graduated']}")
-                elif '[University Name]' in text:
-                    self._replace_text_in_paragraph(paragraph, '[University Name]', education['university'])
-                elif text == '[City, State]':
-                    self._replace_text_in_paragraph(paragraph, '[City, State]', education['location'])
-                elif 'Relevant Coursework:' in text and 'Data Structures' in text:
-                    self._replace_text_in_paragraph(paragraph, text, f"Relevant Coursework: {education['coursework']}")
     
     def _replace_text_in_paragraph(self, paragraph, old_text: str, new_text: str):
         """Replace text in paragraph while preserving formatting."""
@@ -8,6 +8,8 @@ from .paths import (
     get_application_data_path,
     get_form_html_debug_path,
     get_form_debug_screenshot_path,
+    get_browser_state_path,
+    get_ai_cache_path,
     get_log_file_path,
     cleanup_old_data,
     DATA_DIR,
@@ -15,6 +17,7 @@ from .paths import (
     APPLICATIONS_DIR,
     DEBUG_DIR,
     LOGS_DIR,
+    CACHE_DIR,
 )
 
 __all__ = [
@@ -28,6 +31,8 @@ __all__ = [
     "get_application_data_path",
     "get_form_html_debug_path",
     "get_form_debug_screenshot_path",
+    "get_browser_state_path",
+    "get_ai_cache_path",
     "get_log_file_path",
     "cleanup_old_data",
     "DATA_DIR",
@@ -35,4 +40,5 @@ __all__ = [
     "APPLICATIONS_DIR",
     "DEBUG_DIR",
     "LOGS_DIR",
+    "CACHE_DIR",
 ]
@@ -0,0 +1,157 @@
+"""
+Persistent cache for AI-generated answers.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class AnswerCache:
+    """
+    Two-tier store for AI answers: an in-process LRU in front of SQLite.
+    
+    The SQLite file is shared across runs; the LRU saves the query for answers
+    reused within a run.
+    """
+    
+    def __init__(self, path: Path, memory_size: int = 512):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path to the SQLite file
+            memory_size: Number of answers kept in memory
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        # Answers are looked up from asyncio.to_thread workers, so share one connection under a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # WAL keeps reads from blocking on the occasional write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+        )
+        # Databases from before entries were timestamped count as already expired
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(answers)")}
+        if 'created_at' not in columns:
+            self._conn.execute("ALTER TABLE answers ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self._conn.commit()
+    
+    @staticmethod
+    def normalize_question(question: str) -> str:
+        """
+        Reduce a question to lowercase words so punctuation and spacing variants share a key.
+        
+        Args:
+            question: Question text
+            
+        Returns:
+            Normalized question
+        """
+        return ' '.join(_WORD_RE.findall(question.lower()))
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from everything that shapes an answer.
+        
+        Args:
+            *parts: Prompt inputs (question, job description, background, options, ...)
+            
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(json.dumps(part, ensure_ascii=False).encode('utf-8'))
+            digest.update(b'\x1f')
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached answer.
+        
+        Args:
+            key: Key from make_key()
+            
+        Returns:
+            The cached answer, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            try:
+                row = self._conn.execute("SELECT value FROM answers WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ AI answer cache read failed: {e}")
+                return None
+            if row is None:
+                return None
+            value = json.loads(row[0])
+            self._remember(key, value)
+            return value
+    
+    def set(self, key: str, value: Any):
+        """
+        Store an answer.
+        
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable answer
+        """
+        with self._lock:
+            self._remember(key, value)
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answers (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ AI answer cache write failed: {e}")
+    
+    def invalidate_older_than(self, max_age_seconds: float) -> int:
+        """
+        Drop stored answers older than max_age_seconds.
+        
+        Args:
+            max_age_seconds: Maximum age of an answer to keep
+            
+        Returns:
+            Number of answers removed
+        """
+        with self._lock:
+            # The in-memory tier only holds answers from this run, so it can stay
+            try:
+                cursor = self._conn.execute(
+                    "DELETE FROM answers WHERE created_at < ?", (time.time() - max_age_seconds,)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ AI answer cache cleanup failed: {e}")
+                return 0
+            return cursor.rowcount
+    
+    def _remember(self, key: str, value: Any):
+        """Put an answer in the in-memory tier, evicting the least recently used (lock held)."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
@@ -0,0 +1,141 @@
+"""
+Fuzzy string matching utilities.
+"""
+
+from difflib import SequenceMatcher
+import re
+from typing import Iterable, Optional, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz as _fuzz, process as _process
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _fuzz = _process = _Levenshtein = None
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Compute the Levenshtein distance between two strings, giving up early.
+
+    Uses rapidfuzz when installed; otherwise a pure-Python row DP that stops
+    as soon as every entry of the current row exceeds max_distance.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The edit distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(a, b, score_cutoff=max_distance)
+
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return min(previous[-1], max_distance + 1)
+
+
+def best_match(query: str, candidates: Iterable[str], max_distance: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the candidate closest to query within max_distance edits.
+
+    Args:
+        query: String to match
+        candidates: Strings to compare against
+        max_distance: Largest acceptable edit distance
+
+    Returns:
+        Tuple of (candidate index, distance) for the best match, or None
+    """
+    best = None
+    limit = max_distance
+    for idx, candidate in enumerate(candidates):
+        distance = bounded_levenshtein(query, candidate, limit)
+        if distance <= limit:
+            best = (idx, distance)
+            if distance == 0:
+                break
+            # Tighten the bound so later candidates must beat the current best
+            limit = distance - 1
+    return best
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Score how similar two strings are.
+    
+    Args:
+        a: First string
+        b: Second string
+        
+    Returns:
+        Similarity in [0, 100] (rapidfuzz ratio, or difflib when it isn't installed)
+    """
+    if _fuzz is not None:
+        return _fuzz.ratio(a, b)
+    return SequenceMatcher(None, a, b).ratio() * 100
+
+
+def best_option(query: str, options: Sequence[str], score_cutoff: float = 80.0) -> Optional[int]:
+    """
+    Pick the option that best matches query, ignoring case.
+    
+    An exact match wins. Otherwise options that contain the query as a whole
+    word are ranked by similarity, so "Man" picks "Man (including trans men)"
+    over "Woman". Only when no option does are plain substring matches (either
+    way round) ranked the same way, and failing that the most similar option
+    scoring at least score_cutoff is used.
+    
+    Args:
+        query: Value to look for (e.g. a configured answer)
+        options: Available options
+        score_cutoff: Minimum similarity for a match without containment
+        
+    Returns:
+        Index of the best option, or None if nothing matches
+    """
+    query = query.lower().strip()
+    if not query or not options:
+        return None
+    lowered = [opt.lower().strip() for opt in options]
+    if query in lowered:
+        return lowered.index(query)
+    
+    # Lookarounds rather than \b so queries that start or end with punctuation still match
+    word = re.compile(r'(?<!\w)' + re.escape(query) + r'(?!\w)')
+    whole_word = [i for i, opt in enumerate(lowered) if word.search(opt)]
+    if whole_word:
+        return max(whole_word, key=lambda i: similarity(query, lowered[i]))
+    
+    contained = [i for i, opt in enumerate(lowered) if opt and (query in opt or opt in query)]
+    if contained:
+        return max(contained, key=lambda i: similarity(query, lowered[i]))
+    
+    if _process is not None:
+        match = _process.extractOne(query, lowered, scorer=_fuzz.ratio, score_cutoff=score_cutoff)
+        return match[2] if match else None
+    
+    best = None
+    best_score = score_cutoff
+    for i, opt in enumerate(lowered):
+        score = similarity(query, opt)
+        if score >= best_score:
+            best, best_score = i, score
+    return best
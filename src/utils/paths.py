@@ -14,6 +14,7 @@ SCREENSHOTS_DIR = DATA_DIR / "screenshots"
 APPLICATIONS_DIR = DATA_DIR / "applications"
 DEBUG_DIR = DATA_DIR / "debug"
 LOGS_DIR = DATA_DIR / "logs"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Screenshot subdirectories
 PRE_SUBMIT_DIR = SCREENSHOTS_DIR / "pre_submit"
@@ -36,6 +37,7 @@ def ensure_data_directories():
         FORM_HTML_DIR,
         FORM_SCREENSHOTS_DIR,
         LOGS_DIR,
+        CACHE_DIR,
     ]
     
     for directory in directories:
@@ -117,22 +119,22 @@ def get_application_data_path(timestamp: Optional[datetime] = None) -> Path:
 
 def get_form_html_debug_path(timestamp: Optional[datetime] = None) -> Path:
     """
-    Get path for form HTML debug file.
+    Get path for form HTML debug file (gzip-compressed).
     
     Args:
         timestamp: Optional timestamp, defaults to now
         
     Returns:
-        Path object for the HTML file
+        Path object for the .html.gz file
     """
     ensure_data_directories()
-    filename = get_timestamped_filename("form_html_debug", "html", timestamp)
+    filename = get_timestamped_filename("form_html_debug", "html.gz", timestamp)
     return FORM_HTML_DIR / filename
 
 
 def get_form_debug_screenshot_path(timestamp: Optional[datetime] = None) -> Path:
     """
-    Get path for form debug screenshot.
+    Get path for form debug screenshot (JPEG).
     
     Args:
         timestamp: Optional timestamp, defaults to now
@@ -141,10 +143,32 @@ def get_form_debug_screenshot_path(timestamp: Optional[datetime] = None) -> Path
         Path object for the screenshot
     """
     ensure_data_directories()
-    filename = get_timestamped_filename("form_debug", "png", timestamp)
+    filename = get_timestamped_filename("form_debug", "jpg", timestamp)
     return FORM_SCREENSHOTS_DIR / filename
 
 
+def get_browser_state_path() -> Path:
+    """
+    Get path for the persisted Playwright storage state (cookies, localStorage).
+    
+    Returns:
+        Path object for the storage state JSON file
+    """
+    ensure_data_directories()
+    return CACHE_DIR / "playwright_state.json"
+
+
+def get_ai_cache_path() -> Path:
+    """
+    Get path for the SQLite cache of AI answers.
+    
+    Returns:
+        Path object for the cache database
+    """
+    ensure_data_directories()
+    return CACHE_DIR / "ai_answers.sqlite3"
+
+
 def get_log_file_path(log_type: str = "app", timestamp: Optional[datetime] = None) -> Path:
     """
     Get path for log file, organized by date.